@@ -14,7 +14,7 @@ import webbrowser
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk, simpledialog
 import fitz  # PyMuPDF
-from PIL import Image, ImageTk, ImageOps, ImageDraw
+from PIL import Image, ImageTk, ImageOps
 import io
 import tempfile
 import subprocess
@@ -26,6 +26,20 @@ import json
 import threading
 import socket
 import time
+import bisect
+import mmap
+import math
+import queue
+import itertools
+import hashlib
+import re
+import unicodedata
+import csv
+import concurrent.futures
+import multiprocessing
+import xml.etree.ElementTree as ET
+from collections import OrderedDict, deque
+from array import array
 
 # Applicatie versie
 APP_VERSION = "1.7.1"
@@ -306,6 +320,21 @@ class SingleInstance:
             except:
                 pass
 
+def pixmap_to_image(pix):
+    """Zet een fitz.Pixmap om naar een PIL image zonder PPM encode/decode.
+    
+    Voor RGB leest PIL de samples direct via een memoryview (één kopie naar PIL's eigen
+    pixelformaat). Andere formaten gebruiken de bytes kopie van de pixmap, omdat PIL die
+    anders zou delen met geheugen dat MuPDF vrijgeeft zodra de pixmap verdwijnt. Kleurruimtes
+    anders dan RGB en grijs (zoals CMYK) worden eerst naar RGB omgezet.
+    """
+    if pix.colorspace and pix.colorspace.name not in (fitz.csRGB.name, fitz.csGRAY.name):
+        pix = fitz.Pixmap(fitz.csRGB, pix)  # CMYK e.d.: vier kanalen zijn geen RGBA
+    if pix.n == 3 and not pix.alpha:
+        return Image.frombuffer("RGB", (pix.width, pix.height), pix.samples_mv, "raw", "RGB", pix.stride, 1)
+    mode = {1: "L", 2: "LA", 3: "RGB", 4: "RGBA"}[pix.n]
+    return Image.frombytes(mode, (pix.width, pix.height), pix.samples, "raw", mode, pix.stride, 1)
+
 def get_resource_path(relative_path):
     """Geef het absolute pad naar resource bestanden (werkt met PyInstaller)"""
     try:
@@ -348,20 +377,1404 @@ class Theme:
     FONT_HEADING = ("Segoe UI Variable", 12, "bold")
     FONT_SMALL = ("Segoe UI Variable", 9)
 
+# Zoom wordt gekwantiseerd in stappen van 1/ZOOM_BUCKETS zodat renders en tiles herbruikbaar zijn
+ZOOM_BUCKETS = 64
+
+def zoom_bucket(zoom):
+    """Gekwantiseerde zoom als geheel getal (sleutel voor caches)"""
+    return max(1, int(round(zoom * ZOOM_BUCKETS)))
+
+def quantize_zoom(zoom, round_down=False):
+    """Rond zoom af op een bucket (naar beneden voor fit-width zodat de pagina past)"""
+    bucket = math.floor(zoom * ZOOM_BUCKETS) if round_down else round(zoom * ZOOM_BUCKETS)
+    return max(1, bucket) / ZOOM_BUCKETS
+
+class DocumentSource:
+    """Bron van een PDF document: bestand (memory-mapped), buffer in het geheugen of stdin.
+    
+    Bestanden worden via mmap geopend en per pad gedeeld tussen tabs en render workers, zodat de
+    bytes maar één keer in de OS page cache staan en herhaald openen niets kopieert.
+    
+    MuPDF leest rechtstreeks uit de mapping zonder een buffer export vast te houden, dus Python kan
+    niet zien dat een handle de bytes nog gebruikt. Daarom telt elke handle van open() als gebruiker
+    (vrijgeven via close()); de mapping sluit pas als tabs én alle handles klaar zijn.
+    """
+    _shared = {}  # Genormaliseerd pad -> DocumentSource
+    _lock = threading.Lock()
+    FINGERPRINT_BYTES = 65536  # Bytes van begin en eind die de vingerafdruk bepalen
+
+    def __init__(self, name, path=None, data=None):
+        self.name = name  # Weergavenaam (of pad) van het document
+        self.path = path  # None voor documenten zonder bestand
+        self.data = data
+        self.users = 0  # Eigenaren (tabs) plus open documenthandles
+        self._file = None
+        self._mmap = None
+        self._buffer = None
+
+    @classmethod
+    def from_file(cls, path):
+        key = os.path.normcase(os.path.abspath(path))
+        with cls._lock:
+            source = cls._shared.get(key)
+            if source is None:
+                source = cls._shared[key] = cls(path, path=path)
+            source.users += 1
+        return source
+
+    @classmethod
+    def from_bytes(cls, data, name):
+        source = cls(name, data=data)
+        source.users = 1
+        return source
+
+    @classmethod
+    def from_stdin(cls):
+        """Lees een PDF van stdin (ValueError zonder invoer, bijv. in een --windowed build zonder console)"""
+        stdin = getattr(sys.stdin, "buffer", None)
+        if stdin is None or sys.stdin.isatty():
+            raise ValueError("Er is geen PDF via stdin doorgegeven.")
+        data = stdin.read()
+        if not data:
+            raise ValueError("De invoer via stdin is leeg.")
+        return cls.from_bytes(data, "stdin.pdf")
+
+    def buffer(self):
+        """Buffer met de bytes van het document (een mmap view voor bestanden, zonder kopie)"""
+        with self._lock:
+            if self._buffer is None:
+                if self.data is not None:
+                    self._buffer = self.data
+                else:
+                    self._file = open(self.path, "rb")
+                    try:
+                        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+                        self._buffer = memoryview(self._mmap)
+                    except (ValueError, OSError):
+                        # Lege of niet te mappen bestanden (bijv. sommige netwerkschijven)
+                        self._buffer = self._file.read()
+            return self._buffer
+
+    def size(self):
+        return len(self.buffer())
+
+    def fingerprint(self):
+        """Snelle inhoud-vingerafdruk: grootte plus hash van begin en eind (trailer en xref)"""
+        if getattr(self, '_fingerprint', None) is None:
+            buffer = self.buffer()
+            digest = hashlib.blake2b(str(len(buffer)).encode(), digest_size=16)
+            digest.update(buffer[:self.FINGERPRINT_BYTES])
+            digest.update(buffer[-self.FINGERPRINT_BYTES:])
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    def open(self):
+        """Open een nieuw fitz.Document over de gedeelde buffer (thread-safe, elke aanroeper eigen handle).
+        
+        De handle telt als gebruiker van de mapping: sluit hem met close(), niet met document.close().
+        """
+        with self._lock:
+            self.users += 1
+        try:
+            return self._open()
+        except Exception:
+            self.release()
+            raise
+
+    def _open(self):
+        buffer = self.buffer()
+        try:
+            return fitz.open(stream=buffer, filetype="pdf")
+        except Exception:
+            if not isinstance(buffer, memoryview):
+                raise
+        # Oudere PyMuPDF versies accepteren geen memoryview: één gedeelde kopie voor alle handles
+        with self._lock:
+            if isinstance(self._buffer, memoryview):
+                self._buffer = bytes(self._buffer)
+            buffer = self._buffer
+        return fitz.open(stream=buffer, filetype="pdf")
+
+    def close(self, document):
+        """Sluit een handle van open() en geef de mapping vrij als niemand hem meer gebruikt"""
+        try:
+            document.close()
+        finally:
+            self.release()
+
+    def release(self):
+        """Meld dat een gebruiker klaar is; de laatste sluit de mapping"""
+        with self._lock:
+            self.users -= 1
+            if self.users > 0:
+                return
+            if self.path and DocumentSource._shared.get(os.path.normcase(os.path.abspath(self.path))) is self:
+                DocumentSource._shared.pop(os.path.normcase(os.path.abspath(self.path)))
+            # Geen handle meer over de mapping (die tellen als gebruiker), dus sluiten is veilig
+            buffer, self._buffer = self._buffer, None
+            mapping, self._mmap = self._mmap, None
+            file, self._file = self._file, None
+            if isinstance(buffer, memoryview):
+                buffer.release()
+            if mapping is not None:
+                mapping.close()
+            if file is not None:
+                file.close()
+
+class PageLayout:
+    """Geometrie van alle pagina's in continuous scroll, opgebouwd uit page.bound() zonder te renderen.
+    
+    Basisafmetingen (zoom 1.0, inclusief rotatie) worden één keer per document bepaald. Een
+    zoomwijziging herberekent alleen de cumulatieve offsets; opzoeken gaat via bisect.
+    """
+    MARGIN_X = 20  # Links marge
+    MARGIN_TOP = 20  # Begin positie
+    PAGE_SPACING = 20  # Ruimte tussen pagina's
+
+    def __init__(self, document=None):
+        self.base_sizes = []  # (breedte, hoogte) in punten per pagina
+        self.rotations = []  # Rotatie per pagina
+        self.zoom = 1.0
+        self.tops = []  # Y-positie (canvas) van elke pagina
+        self.sizes = []  # (breedte, hoogte) in pixels op huidige zoom
+        self.total_height = 0
+        self.max_width = 0
+        if document is not None:
+            self.build(document)
+
+    def __len__(self):
+        return len(self.base_sizes)
+
+    def build(self, document):
+        """Lees paginagrenzen en rotatie van alle pagina's"""
+        self.base_sizes = []
+        self.rotations = []
+        for page in document:
+            rect = page.bound()
+            self.base_sizes.append((rect.width, rect.height))
+            self.rotations.append(page.rotation)
+        self.set_zoom(self.zoom)
+
+    def set_zoom(self, zoom):
+        """Herschaal de layout naar een nieuwe zoom (alleen rekenwerk, geen rendering)"""
+        self.zoom = zoom
+        self.tops = []
+        self.sizes = []
+        y_offset = self.MARGIN_TOP
+        max_width = 0
+        for width, height in self.base_sizes:
+            img_width = int(width * zoom)
+            img_height = int(height * zoom)
+            self.tops.append(y_offset)
+            self.sizes.append((img_width, img_height))
+            max_width = max(max_width, img_width)
+            y_offset += img_height + self.PAGE_SPACING
+        self.total_height = y_offset + self.MARGIN_TOP
+        self.max_width = max_width + self.MARGIN_X * 2
+
+    def fit_width_zoom(self, canvas_width):
+        """Zoom waarop de eerste pagina de canvasbreedte vult (None zonder pagina's)"""
+        page_width = self.base_sizes[0][0] if self.base_sizes else 0
+        if page_width <= 0:
+            return None
+        return quantize_zoom((canvas_width - self.MARGIN_X * 2) / page_width, round_down=True)
+
+    def scaled(self, zoom):
+        """Dezelfde pagina's op een andere zoom (bijv. de miniaturen zijbalk)"""
+        layout = PageLayout()
+        layout.base_sizes = self.base_sizes
+        layout.rotations = self.rotations
+        layout.set_zoom(zoom)
+        return layout
+
+    def page_top(self, page_num):
+        """Y-positie van pagina n op het canvas"""
+        return self.tops[page_num]
+
+    def page_rect(self, page_num):
+        """Canvas rechthoek (x0, y0, x1, y1) van pagina n"""
+        width, height = self.sizes[page_num]
+        top = self.tops[page_num]
+        return (self.MARGIN_X, top, self.MARGIN_X + width, top + height)
+
+    def page_at(self, y):
+        """Pagina op canvas hoogte y (ruimte tussen pagina's hoort bij de pagina erboven)"""
+        if not self.tops:
+            return 0
+        index = bisect.bisect_right(self.tops, y) - 1
+        return min(max(index, 0), len(self.tops) - 1)
+
+    def visible_range(self, top, bottom):
+        """Range van pagina's die het verticale interval [top, bottom] raken"""
+        if not self.tops or bottom < top:
+            return range(0)
+        first = self.page_at(top)
+        if self.tops[first] + self.sizes[first][1] < top:
+            first += 1
+        last = self.page_at(bottom)
+        return range(first, last + 1)
+
+class TextLayer:
+    """Lazy tekstlaag per pagina in (geroteerde) pagina coördinaten, dus onafhankelijk van de zoom.
+    
+    Tekst wordt pas geëxtraheerd wanneer een pagina voor het eerst geraakt wordt door selectie,
+    zoeken of kopiëren. Pagina's zonder fonts (scans) worden overgeslagen zonder extractie.
+    """
+    TEXTPAGE_LIMIT = 16  # Max aantal bewaarde fitz.TextPage objecten
+    GRID_CELL = 48  # Celgrootte (punten) van het ruimtelijke woordindex
+
+    def __init__(self, document):
+        self.document = document
+        self.words = {}  # page_num -> [(tekst, x0, y0, x1, y1)] in pagina coördinaten
+        self.grids = {}  # page_num -> {(kolom, rij): [woord index]}
+        self.textpages = OrderedDict()  # page_num -> (fitz.Page, fitz.TextPage), herbruikbaar voor zoeken
+        self.extractions = 0
+
+    def has_text(self, page_num):
+        """Goedkope check: een pagina zonder fonts heeft geen tekstlaag"""
+        return bool(self.document[page_num].get_fonts())
+
+    def textpage(self, page_num):
+        """(pagina, TextPage) van een pagina, of (None, None) voor pagina's zonder tekst.
+        
+        De TextPage verwijst zwak naar zijn pagina, daarom bewaren we die pagina mee.
+        """
+        entry = self.textpages.get(page_num)
+        if entry is not None:
+            self.textpages.move_to_end(page_num)
+            return entry
+        if not self.has_text(page_num):
+            return (None, None)
+        
+        page = self.document[page_num]
+        entry = (page, page.get_textpage())
+        self.extractions += 1
+        self.textpages[page_num] = entry
+        while len(self.textpages) > self.TEXTPAGE_LIMIT:
+            self.textpages.popitem(last=False)
+        return entry
+
+    def get_words(self, page_num):
+        """Woorden van een pagina (eenmalig geëxtraheerd)"""
+        words = self.words.get(page_num)
+        if words is not None:
+            return words
+        
+        words = self.raw_words(page_num)
+        page = self.document[page_num]
+        if words and page.rotation:
+            # get_text levert ongeroteerde coördinaten, de weergave is geroteerd
+            matrix = page.rotation_matrix
+            words = [(text,) + tuple(fitz.Rect(x0, y0, x1, y1) * matrix) for text, x0, y0, x1, y1 in words]
+        self.words[page_num] = words
+        return words
+
+    def raw_words(self, page_num):
+        """Woorden in ongeroteerde pagina coördinaten, zoals MuPDF ze levert (niet bewaard)"""
+        page, textpage = self.textpage(page_num)
+        if textpage is None:
+            return []
+        return [(text, x0, y0, x1, y1) for x0, y0, x1, y1, text, *_ in page.get_text("words", textpage=textpage)]
+
+    def _grid(self, page_num):
+        """Uniform grid over de woordvakken van een pagina, voor hit-testing zonder volledige scan"""
+        grid = self.grids.get(page_num)
+        if grid is not None:
+            return grid
+        grid = {}
+        cell = self.GRID_CELL
+        for index, (text, x0, y0, x1, y1) in enumerate(self.get_words(page_num)):
+            for column in range(int(x0 // cell), int(x1 // cell) + 1):
+                for row in range(int(y0 // cell), int(y1 // cell) + 1):
+                    grid.setdefault((column, row), []).append(index)
+        self.grids[page_num] = grid
+        return grid
+
+    def words_in_rect(self, page_num, x0, y0, x1, y1):
+        """Woorden (in leesvolgorde van extractie) die de rechthoek raken, in pagina coördinaten"""
+        grid = self._grid(page_num)
+        if not grid:
+            return []
+        cell = self.GRID_CELL
+        words = self.words[page_num]
+        hits = set()
+        for column in range(int(x0 // cell), int(x1 // cell) + 1):
+            for row in range(int(y0 // cell), int(y1 // cell) + 1):
+                hits.update(grid.get((column, row), ()))
+        result = []
+        for index in sorted(hits):
+            word = words[index]
+            if not (word[3] < x0 or word[1] > x1 or word[4] < y0 or word[2] > y1):
+                result.append(word)
+        return result
+
+    def invalidate(self, page_num):
+        self.words.pop(page_num, None)
+        self.grids.pop(page_num, None)
+        self.textpages.pop(page_num, None)
+
+def fold_diacritics(text):
+    """Verwijder accenten en splits ligaturen (ë -> e, ĳ -> ij) voor accent-ongevoelig zoeken"""
+    if text.isascii():
+        return text
+    return "".join(char for char in unicodedata.normalize("NFKD", text) if not unicodedata.combining(char))
+
+class SearchQuery:
+    """Zoekopdracht met opties, gecompileerd tot één reguliere expressie over de paginatekst.
+    
+    Letterlijke tekst matcht ook over meerdere spaties of regelovergangen. Met ignore_accents
+    worden zowel de zoektekst als de paginatekst via fold_diacritics vergeleken.
+    """
+    def __init__(self, text, regex=False, case_sensitive=False, whole_word=False, ignore_accents=True):
+        self.text = text
+        self.regex = regex
+        self.ignore_accents = ignore_accents
+        
+        pattern = text if regex else r"\s+".join(re.escape(part) for part in text.split())
+        if ignore_accents:
+            pattern = fold_diacritics(pattern)
+        if whole_word:
+            pattern = rf"(?<!\w)(?:{pattern})(?!\w)"
+        self.pattern = re.compile(pattern, 0 if case_sensitive else re.IGNORECASE)  # re.error bij ongeldige regex
+
+class SearchIndex:
+    """Omgekeerde woordindex en tekst per pagina, in de achtergrond opgebouwd met een eigen documenthandle.
+    
+    De postings (genormaliseerd woord -> pagina's) beperken letterlijke zoekopdrachten tot pagina's
+    die het woord bevatten; de SearchQuery zelf loopt over de gecachte paginatekst. Posities zijn
+    ongeroteerde pagina coördinaten, zodat een rotatie de index niet ongeldig maakt. Tijdens het
+    opbouwen zijn de al verwerkte pagina's doorzoekbaar.
+    """
+    PAGE_SHIFT = 20  # Postings zijn (pagina << PAGE_SHIFT) | woord index
+    WORD_MASK = (1 << PAGE_SHIFT) - 1
+    PUNCTUATION = ".,;:!?()[]{}<>\"'`“”‘’«»…-–—/\\*•"
+
+    def __init__(self, page_count, source=None, password=None):
+        self.page_count = page_count
+        self.source = source
+        self.password = password
+        self.postings = {}  # genormaliseerd woord -> array('Q') van postings
+        self.texts = {}  # page_num -> tuple van de woorden zoals op de pagina
+        self.tokens = {}  # page_num -> tuple van genormaliseerde woorden (leesvolgorde)
+        self.boxes = {}  # page_num -> array('f') met x0, y0, x1, y1 per woord
+        self.page_texts = {}  # (page_num, accenten genegeerd) -> (tekst, startpositie per woord)
+        self.folded_words = {}  # woord -> woord zonder accenten
+        self.indexed_pages = 0
+        self.done = False
+        self.cancelled = False
+        self.error = None
+        self._lock = threading.Lock()
+        self._document = None  # Eigen handle voor extractie en exacte rechthoeken
+        self._text_layer = None
+        self._document_lock = threading.Lock()
+
+    @classmethod
+    def normalize(cls, text):
+        return fold_diacritics(text.casefold().strip(cls.PUNCTUATION))
+
+    @classmethod
+    def terms(cls, text):
+        return [term for term in (cls.normalize(part) for part in text.split()) if term]
+
+    def has_page(self, page_num):
+        return page_num in self.tokens
+
+    def start(self):
+        thread = threading.Thread(target=self._build, name="SearchIndex", daemon=True)
+        thread.start()
+
+    def cancel(self):
+        self.cancelled = True
+        with self._document_lock:
+            if self._document is not None:
+                self.source.close(self._document)
+            self._document = None
+            self._text_layer = None
+
+    def _build(self):
+        try:
+            for page_num in range(self.page_count):
+                if self.cancelled:
+                    return
+                self.extract_page(page_num)
+                time.sleep(0)  # Laat de UI thread voor (extractie houdt de GIL vast)
+        except Exception as e:
+            self.error = e
+        finally:
+            self.done = True
+
+    def _text(self):
+        """TextLayer over de eigen documenthandle (aanroeper houdt _document_lock vast)"""
+        if self._text_layer is None:
+            document = self.source.open()
+            if self.password and document.needs_pass:
+                document.authenticate(self.password)
+            self._document = document
+            self._text_layer = TextLayer(document)
+        return self._text_layer
+
+    def extract_page(self, page_num):
+        """Extraheer en indexeer één pagina (vanuit de opbouw thread of een SearchJob)"""
+        with self._document_lock:
+            if self.cancelled or self.has_page(page_num):
+                return
+            words = self._text().raw_words(page_num)
+        self.add_page(page_num, words)
+
+    def add_page(self, page_num, words):
+        """Voeg de woorden (tekst, x0, y0, x1, y1) van één pagina toe (een tweede keer telt niet)"""
+        texts = tuple(sys.intern(text) for text, *_ in words)
+        tokens = tuple(sys.intern(self.normalize(text)) for text in texts)
+        boxes = array('f')
+        local = {}
+        for index, (text, x0, y0, x1, y1) in enumerate(words):
+            boxes.extend((x0, y0, x1, y1))
+            if tokens[index]:
+                local.setdefault(tokens[index], []).append((page_num << self.PAGE_SHIFT) | index)
+        with self._lock:
+            if page_num in self.tokens:
+                return
+            self.texts[page_num] = texts
+            self.tokens[page_num] = tokens
+            self.boxes[page_num] = boxes
+            for token, entries in local.items():
+                self.postings.setdefault(token, array('Q')).extend(entries)
+            self.indexed_pages += 1
+
+    def candidate_pages(self, text):
+        """Pagina's die een letterlijke zoektekst kunnen bevatten (via de postings), of None.
+        
+        Eén term mag deel van een woord zijn; bij meerdere termen moet de eerste aan het eind van
+        een woord staan. Tokens zijn zonder hoofdletters en accenten, dus dit is een ruime voorselectie.
+        """
+        terms = self.terms(text)
+        if not terms:
+            return None  # Alleen leestekens: geen voorselectie mogelijk
+        first = terms[0]
+        pages = set()
+        with self._lock:
+            if len(terms) == 1:
+                keys = [key for key in self.postings if first in key]
+            else:
+                keys = [key for key in self.postings if key.endswith(first)]
+            for key in keys:
+                pages.update(entry >> self.PAGE_SHIFT for entry in self.postings[key])
+        return sorted(pages)
+
+    def page_text(self, page_num, ignore_accents):
+        """(tekst, startpositie per woord) van een pagina; woorden gescheiden door één spatie"""
+        key = (page_num, ignore_accents)
+        entry = self.page_texts.get(key)
+        if entry is not None:
+            return entry
+        words = self.texts[page_num]
+        if ignore_accents:
+            words = [self._fold_word(word) for word in words]
+        starts = array('I')
+        position = 0
+        for word in words:
+            starts.append(position)
+            position += len(word) + 1
+        entry = self.page_texts[key] = (" ".join(words), starts)
+        return entry
+
+    def _fold_word(self, word):
+        folded = self.folded_words.get(word)
+        if folded is None:
+            folded = self.folded_words[word] = fold_diacritics(word)
+        return folded
+
+    def _original_offset(self, word, offset):
+        """Zet een positie in het woord zonder accenten om naar een positie in het originele woord"""
+        position = 0
+        for index, char in enumerate(word):
+            if position >= offset:
+                return index
+            position += len(self._fold_word(char))
+        return len(word)
+
+    def search_page(self, page_num, query, context_words=0):
+        """Treffers van een SearchQuery op één (geïndexeerde) pagina: [(page_num, rechthoeken, fragment)].
+        
+        Tekenposities worden via de woordstarts naar woorden vertaald. Volledig geraakte woorden
+        krijgen hun woordvak; bij een deel van een woord bepaalt MuPDF de exacte rechthoek binnen dat vak.
+        """
+        text, starts = self.page_text(page_num, query.ignore_accents)
+        words = self.texts[page_num]
+        boxes = self.boxes[page_num]
+        found = {}  # Woorddeel -> MuPDF resultaten op deze pagina per regel (één zoekactie per deel)
+        hits = []
+        for match in query.pattern.finditer(text):
+            start, end = match.span()
+            if start == end:
+                continue
+            first = bisect.bisect_right(starts, start) - 1
+            last = bisect.bisect_right(starts, end - 1) - 1
+            rects = []
+            for index in range(first, last + 1):
+                word_start = starts[index]
+                word_length = (starts[index + 1] - 1 if index + 1 < len(starts) else len(text)) - word_start
+                low = max(start, word_start) - word_start
+                high = min(end, word_start + word_length) - word_start
+                if high <= low:
+                    continue  # Alleen de spatie tussen twee woorden
+                box = tuple(boxes[index * 4:index * 4 + 4])
+                if low == 0 and high == word_length:
+                    rects.append(box)
+                    continue
+                word = words[index]
+                if query.ignore_accents and len(word) != word_length:
+                    low, high = self._original_offset(word, low), self._original_offset(word, high)
+                rects.append(self.char_rect(page_num, word, box, low, high, found))
+            if not rects:
+                continue
+            
+            snippet = ""
+            if context_words:
+                before = words[max(0, first - context_words):first]
+                after = words[last + 1:last + 1 + context_words]
+                snippet = " ".join(before + (f"[{' '.join(words[first:last + 1])}]",) + after)
+            hits.append((page_num, rects, snippet))
+        return hits
+
+    def char_rect(self, page_num, word, box, low, high, found):
+        """Rechthoek van de tekens low..high van een woord: het MuPDF resultaat binnen het woordvak"""
+        part = word[low:high]
+        x0, y0, x1, y1 = box
+        lines = found.get(part.lower())
+        if lines is None:
+            lines = found[part.lower()] = {}
+            with self._document_lock:
+                if not self.cancelled and self.source is not None:
+                    page, textpage = self._text().textpage(page_num)
+                    if textpage is not None:
+                        for rect in page.search_for(part, textpage=textpage):
+                            lines.setdefault(int(rect.y1), []).append(tuple(rect))
+        quads = sorted(quad for line in range(int(y1) - 1, int(y1) + 2) for quad in lines.get(line, ())
+                       if quad[0] >= x0 - 1 and quad[2] <= x1 + 1)
+        occurrence = word[:low].lower().count(part.lower())
+        if occurrence < len(quads):
+            return tuple(quads[occurrence])
+        # Geen MuPDF resultaat (bijv. ligaturen): verdeel het woordvak naar aantal tekens
+        width = (x1 - x0) / max(len(word), 1)
+        return (x0 + low * width, y0, x0 + high * width, y1)
+
+    def memory_bytes(self):
+        """Ruwe schatting van het geheugengebruik (voor de geheugenbewaking)"""
+        with self._lock:
+            words = sum(len(boxes) for boxes in self.boxes.values()) // 4
+            postings = sum(len(token) + 49 for token in self.postings)
+        page_texts = sum(len(text) + len(starts) * 4 for text, starts in list(self.page_texts.values()))
+        return words * 40 + postings + page_texts
+
+class SearchJob:
+    """Eén zoekopdracht die pagina voor pagina in een worker thread loopt en treffers doorgeeft.
+    
+    Begint bij de huidige pagina en loopt rond. Ontbrekende pagina's worden eerst aan de index
+    toegevoegd. Is de index compleet, dan slaat een letterlijke zoekopdracht alle pagina's over
+    waarop volgens de postings geen treffer kan staan.
+    """
+    CONTEXT_WORDS = 5  # Woorden voor en na een treffer in het fragment
+
+    def __init__(self, index, query, start_page):
+        self.index = index
+        self.query = query  # SearchQuery
+        self.start_page = start_page
+        self.results = queue.Queue()  # (page_num, rechthoeken, fragment); None als de job klaar is
+        self.scanned_pages = 0
+        self.cancelled = False
+        self.error = None
+
+    def start(self):
+        thread = threading.Thread(target=self._run, name="SearchJob", daemon=True)
+        thread.start()
+
+    def cancel(self):
+        self.cancelled = True
+
+    def _run(self):
+        index = self.index
+        page_count = index.page_count
+        try:
+            pages = [(self.start_page + offset) % page_count for offset in range(page_count)]
+            candidates = None
+            if index.indexed_pages == page_count and not self.query.regex:
+                candidates = index.candidate_pages(self.query.text)
+            if candidates is not None:
+                split = bisect.bisect_left(candidates, self.start_page)
+                pages = candidates[split:] + candidates[:split]
+                self.scanned_pages = page_count - len(pages)
+            
+            for page_num in pages:
+                if self.cancelled or index.cancelled:
+                    return
+                index.extract_page(page_num)
+                if not index.has_page(page_num):
+                    return  # Index gesloten tijdens het zoeken
+                for hit in index.search_page(page_num, self.query, self.CONTEXT_WORDS):
+                    self.results.put(hit)
+                self.scanned_pages += 1
+                time.sleep(0)  # Laat de UI thread voor
+        except Exception as e:
+            self.error = e
+        finally:
+            self.results.put(None)
+
+class FormField:
+    """Eén AcroForm veld, los van Tk widgets (getekend als canvas items)."""
+    EDITABLE_TYPES = (fitz.PDF_WIDGET_TYPE_TEXT, fitz.PDF_WIDGET_TYPE_CHECKBOX, fitz.PDF_WIDGET_TYPE_COMBOBOX)
+
+    def __init__(self, page_num, index, xref, name, field_type, rect, value, choices=None):
+        self.page_num = page_num
+        self.index = index  # Positie binnen de velden van de pagina
+        self.xref = xref
+        self.name = name
+        self.field_type = field_type
+        self.rect = rect  # In (geroteerde) pagina coördinaten, zoom 1.0
+        self.value = value  # Waarde zoals in het document
+        self.choices = choices or []
+
+    @staticmethod
+    def is_checked(value):
+        if isinstance(value, str):
+            return value.strip().lower() not in ("", "off", "0", "false", "nee", "no")
+        return bool(value)
+
+# Formulierdata uitwisselen: JSON ({naam: waarde}), XFDF (XML) en FDF (PDF syntax)
+XFDF_NAMESPACE = "http://ns.adobe.com/xfdf/"
+FDF_WHITESPACE = b" \t\r\n\f\x00"
+FDF_DELIMITERS = b"()<>[]{}/%"
+FDF_ESCAPES = {ord("n"): b"\n", ord("r"): b"\r", ord("t"): b"\t", ord("b"): b"\b", ord("f"): b"\f"}
+FDF_OBJECT_PATTERN = re.compile(rb"(\d+)\s+\d+\s+obj\b")
+FDF_REFERENCE_PATTERN = re.compile(rb"\s+\d+\s+R(?![^\s()<>\[\]{}/%])")
+FDF_MAX_DEPTH = 32  # Grens voor geneste /Kids en verwijzingsketens
+
+def _fdf_string(text):
+    """PDF string: letterlijk voor ASCII, anders UTF-16BE met BOM (PDFDocEncoding kent geen UTF-8)"""
+    if text.isascii():
+        for char, escaped in (("\\", "\\\\"), ("(", "\\("), (")", "\\)"), ("\r", "\\r"), ("\n", "\\n")):
+            text = text.replace(char, escaped)
+        return f"({text})"
+    return "<" + ("\ufeff" + text).encode("utf-16-be").hex().upper() + ">"
+
+def _fdf_text(raw):
+    """Decodeer een PDF string: UTF-16BE of UTF-8 met BOM, anders PDFDocEncoding"""
+    if raw.startswith(b"\xfe\xff"):
+        return raw[2:].decode("utf-16-be", errors="replace")
+    if raw.startswith(b"\xef\xbb\xbf"):
+        return raw[3:].decode("utf-8", errors="replace")
+    try:
+        return raw.decode("utf-8")  # Exports van oudere versies schreven UTF-8
+    except UnicodeDecodeError:
+        return raw.decode("latin-1")  # Benadering van PDFDocEncoding
+
+def _fdf_skip(data, pos):
+    """Sla witruimte en commentaar over"""
+    while pos < len(data):
+        if data[pos] in FDF_WHITESPACE:
+            pos += 1
+        elif data[pos] == ord("%"):
+            while pos < len(data) and data[pos] not in b"\r\n":
+                pos += 1
+        else:
+            break
+    return pos
+
+def _fdf_literal(data, pos):
+    """Letterlijke string vanaf de openingshaak: (bytes, positie erna)"""
+    result = bytearray()
+    depth = 1
+    pos += 1
+    while pos < len(data):
+        char = data[pos]
+        pos += 1
+        if char == ord("\\"):
+            if pos >= len(data):
+                break
+            char = data[pos]
+            pos += 1
+            if char in FDF_ESCAPES:
+                result += FDF_ESCAPES[char]
+            elif 48 <= char <= 55:  # Octaal, maximaal drie cijfers
+                digits = bytes([char])
+                while len(digits) < 3 and pos < len(data) and 48 <= data[pos] <= 55:
+                    digits += data[pos:pos + 1]
+                    pos += 1
+                result.append(int(digits, 8) & 0xFF)
+            elif char == ord("\r"):  # Regelvoortzetting
+                if data[pos:pos + 1] == b"\n":
+                    pos += 1
+            elif char != ord("\n"):
+                result.append(char)
+            continue
+        if char == ord("("):
+            depth += 1
+        elif char == ord(")"):
+            depth -= 1
+            if depth == 0:
+                break
+        result.append(char)
+    return bytes(result), pos
+
+def _fdf_parse(data, pos, depth=0):
+    """Lees één PDF object vanaf pos: (waarde, positie erna).
+    
+    Strings worden bytes, namen str, verwijzingen (objectnummer, "R") en woorden als true/null str.
+    """
+    pos = _fdf_skip(data, pos)
+    if pos >= len(data) or depth > FDF_MAX_DEPTH:
+        return None, len(data)
+    if data.startswith(b"<<", pos):
+        result = {}
+        pos = _fdf_skip(data, pos + 2)
+        while pos < len(data) and not data.startswith(b">>", pos):
+            key, pos = _fdf_parse(data, pos, depth + 1)
+            value, pos = _fdf_parse(data, pos, depth + 1)
+            if isinstance(key, str):
+                result[key] = value
+            pos = _fdf_skip(data, pos)
+        return result, pos + 2
+    char = data[pos]
+    if char == ord("["):
+        result = []
+        pos = _fdf_skip(data, pos + 1)
+        while pos < len(data) and data[pos] != ord("]"):
+            value, pos = _fdf_parse(data, pos, depth + 1)
+            result.append(value)
+            pos = _fdf_skip(data, pos)
+        return result, pos + 1
+    if char == ord("("):
+        return _fdf_literal(data, pos)
+    if char == ord("<"):
+        end = data.find(b">", pos)
+        end = len(data) if end < 0 else end
+        digits = re.sub(rb"[^0-9A-Fa-f]", b"", data[pos + 1:end])
+        return bytes.fromhex((digits + b"0" * (len(digits) % 2)).decode("ascii")), end + 1
+    
+    # Naam of los woord (getal, true, null, ...): tot de volgende scheiding
+    end = pos + 1 if char == ord("/") else pos
+    while end < len(data) and data[end] not in FDF_WHITESPACE and data[end] not in FDF_DELIMITERS:
+        end += 1
+    if end == pos:
+        return None, pos + 1  # Losse scheiding (bijv. "}"), overslaan
+    token = data[pos:end]
+    if char == ord("/"):
+        name = re.sub(rb"#([0-9A-Fa-f]{2})", lambda m: bytes.fromhex(m.group(1).decode("ascii")), token[1:])
+        return _fdf_text(name), end
+    if token.isdigit():
+        reference = FDF_REFERENCE_PATTERN.match(data, end)
+        if reference:
+            return (int(token), "R"), reference.end()
+    return token.decode("latin-1"), end
+
+def _fdf_fields(data):
+    """{volledige veldnaam: waarde} uit de /Fields van een FDF bestand, inclusief geneste /Kids"""
+    objects = {int(match.group(1)): match.end() for match in FDF_OBJECT_PATTERN.finditer(data)}
+    
+    def resolve(value):
+        for _ in range(FDF_MAX_DEPTH):
+            if not (isinstance(value, tuple) and value[0] in objects):
+                break
+            value = _fdf_parse(data, objects[value[0]])[0]
+        return None if isinstance(value, tuple) else value
+    
+    def text(value):
+        value = resolve(value)
+        if isinstance(value, bytes):
+            return _fdf_text(value)
+        if isinstance(value, list):  # Meerkeuze lijst
+            return ", ".join(text(item) for item in value)
+        return "" if value is None else value
+    
+    values = {}
+    
+    def walk(fields, parent, depth):
+        fields = resolve(fields)
+        if not isinstance(fields, list) or depth > FDF_MAX_DEPTH:
+            return
+        for field in fields:
+            field = resolve(field)
+            if not isinstance(field, dict):
+                continue
+            name = parent
+            if "T" in field:
+                partial = text(field["T"])
+                name = f"{parent}.{partial}" if parent else partial
+            if "V" in field and name:
+                values[name] = text(field["V"])
+            walk(field.get("Kids"), name, depth + 1)
+    
+    match = re.search(rb"/Fields(?![^\s()<>\[\]{}/%])", data)
+    if match:
+        walk(_fdf_parse(data, match.end())[0], "", 0)
+    return values
+
+def write_form_values(path, values):
+    """Schrijf {veldnaam: waarde} als JSON, XFDF of FDF (op basis van de extensie)"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".json":
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(values, f, ensure_ascii=False, indent=2)
+        return
+    
+    # Checkboxen als PDF namen (Yes/Off)
+    exported = {name: ("Yes" if value else "Off") if isinstance(value, bool) else str(value)
+                for name, value in values.items()}
+    if extension == ".xfdf":
+        root = ET.Element("xfdf", {"xmlns": XFDF_NAMESPACE, "xml:space": "preserve"})
+        fields = ET.SubElement(root, "fields")
+        for name, value in exported.items():
+            field = ET.SubElement(fields, "field", {"name": name})
+            ET.SubElement(field, "value").text = value
+        ET.ElementTree(root).write(path, encoding="utf-8", xml_declaration=True)
+    elif extension == ".fdf":
+        entries = []
+        for name, value in exported.items():
+            if isinstance(values[name], bool):
+                entries.append(f"<< /T {_fdf_string(name)} /V /{value} >>")
+            else:
+                entries.append(f"<< /T {_fdf_string(name)} /V {_fdf_string(value)} >>")
+        body = (
+            "%FDF-1.2\n1 0 obj\n<< /FDF << /Fields [\n" + "\n".join(entries) + "\n] >> >>\nendobj\n"
+            "trailer\n<< /Root 1 0 R >>\n%%EOF\n"
+        )
+        with open(path, "wb") as f:
+            f.write(body.encode("ascii"))
+    else:
+        raise ValueError(f"Onbekend formaat: {extension}")
+
+def read_form_values(path):
+    """Lees {veldnaam: waarde} uit een JSON, XFDF of FDF bestand"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".json":
+        with open(path, "r", encoding="utf-8") as f:
+            return dict(json.load(f))
+    if extension == ".xfdf":
+        values = {}
+        local_name = lambda element: element.tag.rsplit("}", 1)[-1]  # Met of zonder namespace
+        
+        def walk(element, parent):
+            # Geneste <field> elementen vormen samen de volledige naam (adres.straat)
+            for child in element:
+                if local_name(child) != "field":
+                    walk(child, parent)
+                    continue
+                name = child.get("name", "")
+                name = f"{parent}.{name}" if parent and name else parent or name
+                for grandchild in child:
+                    if local_name(grandchild) == "value":
+                        values[name] = grandchild.text or ""
+                        break
+                walk(child, name)
+        
+        walk(ET.parse(path).getroot(), "")
+        return values
+    if extension == ".fdf":
+        with open(path, "rb") as f:
+            return _fdf_fields(f.read())
+    raise ValueError(f"Onbekend formaat: {extension}")
+
+# ====================================================================
+# BATCH FORMULIEREN INVULLEN (mail merge over een process pool)
+# ====================================================================
+
+MERGE_CHUNK_SIZE = 25  # Records per taak; kleine blokken houden annuleren snel en geheugen laag
+MERGE_TASKS_PER_WORKER = 200  # Worker processen worden hierna vervangen (begrensd geheugen)
+
+_merge_template = None  # (template bytes, veldindex) per worker proces
+
+def template_field_names(template_path):
+    """Veldnamen van een formulier template, in documentvolgorde"""
+    names = []
+    with fitz.open(template_path) as doc:
+        for page in doc:
+            for widget in page.widgets():
+                if widget.field_name not in names:
+                    names.append(widget.field_name)
+    return names
+
+def read_merge_rows(path):
+    """(kolommen, records) uit een CSV (komma, puntkomma of tab) of JSON (lijst van objecten) bestand"""
+    if path.lower().endswith(".json"):
+        with open(path, "r", encoding="utf-8") as f:
+            rows = json.load(f)
+        if isinstance(rows, dict):
+            rows = [rows]
+        columns = list(dict.fromkeys(key for row in rows for key in row))
+        return columns, [{key: "" if value is None else value for key, value in row.items()} for row in rows]
+    
+    with open(path, "rb") as f:
+        data = f.read()
+    try:
+        text = data.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        text = data.decode("cp1252", errors="replace")  # Standaard "CSV" export van Excel op Windows
+    try:
+        dialect = csv.Sniffer().sniff(text[:4096], delimiters=",;\t")
+    except csv.Error:
+        dialect = csv.excel
+    reader = csv.DictReader(io.StringIO(text, newline=""), dialect=dialect)
+    rows = list(reader)
+    return list(reader.fieldnames or []), rows
+
+def flatten_form(doc):
+    """Maak formuliervelden definitief: in de pagina inhoud bakken indien mogelijk, anders read-only"""
+    if hasattr(doc, "bake"):
+        doc.bake(annots=False, widgets=True)
+        return
+    for page in doc:
+        for widget in page.widgets():
+            widget.field_flags |= fitz.PDF_FIELD_IS_READ_ONLY
+            widget.update()
+
+def _merge_worker_init(template_path):
+    """Lees het template één keer per worker proces en bouw de veldindex"""
+    global _merge_template
+    with open(template_path, "rb") as f:
+        data = f.read()
+    index = {}
+    with fitz.open("pdf", data) as doc:
+        for page in doc:
+            for widget in page.widgets():
+                index.setdefault(widget.field_name, []).append((page.number, widget.xref, widget.field_type))
+    _merge_template = (data, index)
+
+def fill_form_rows(jobs, output_dir, flatten):
+    """Worker: vul het template voor een blok records.
+    
+    jobs: [(bestandsnaam, {veldnaam: waarde})]. Geeft (aantal opgeslagen, [foutmeldingen]) terug.
+    Elk document wordt direct na opslaan gesloten, zodat het geheugen per worker begrensd blijft.
+    """
+    data, index = _merge_template
+    saved = 0
+    errors = []
+    for filename, values in jobs:
+        try:
+            with fitz.open("pdf", data) as doc:
+                pages = {}
+                for name, value in values.items():
+                    for page_num, xref, field_type in index.get(name, []):
+                        page = pages.get(page_num)
+                        if page is None:
+                            page = pages[page_num] = doc[page_num]
+                        widget = page.load_widget(xref)
+                        if field_type == fitz.PDF_WIDGET_TYPE_CHECKBOX:
+                            widget.field_value = FormField.is_checked(value)
+                        else:
+                            widget.field_value = str(value)
+                        widget.update()
+                if flatten:
+                    flatten_form(doc)
+                doc.save(os.path.join(output_dir, filename), garbage=1, deflate=True)
+            saved += 1
+        except Exception as e:
+            errors.append(f"{filename}: {e}")
+    return saved, errors
+
+class RenderJob:
+    """Eén render opdracht voor de RenderService."""
+    def __init__(self, doc_key, source, password, page_num, zoom, rotation, generation, callback,
+                 clip=None, tile=None, draft=False, version=0):
+        self.doc_key = doc_key
+        self.source = source  # DocumentSource waaruit de worker zijn eigen handle opent
+        self.password = password
+        self.page_num = page_num
+        self.zoom = zoom
+        self.rotation = rotation
+        self.generation = generation
+        self.callback = callback
+        self.clip = clip  # Alleen dit deel van de pagina renderen (pagina coördinaten)
+        self.tile = tile  # (kolom, rij) bij tiled rendering
+        self.draft = draft  # Snelle lage resolutie render, wordt later vervangen
+        self.version = version  # Inhoudsversie van de pagina (display list sleutel)
+        self.cancelled = False
+        self.image = None
+        self.error = None
+
+    def cancel(self):
+        self.cancelled = True
+
+class RenderService:
+    """Pool van render threads met prioriteitswachtrij en annulering.
+    
+    MuPDF documenten zijn niet thread-safe, daarom opent elke worker zijn eigen fitz.Document
+    per bron. Resultaten komen via één dispatch punt (Tk after-loop) op de main thread terecht.
+    """
+    POLL_INTERVAL = 15  # ms tussen dispatch rondes
+    DISPATCH_BUDGET = 0.025  # Max seconden per dispatch ronde, zodat input niet blokkeert
+    DRAFT_SCALE = 0.25  # Draft renders op een kwart van de zoom, daarna opgeschaald
+    DISPLAY_LIST_LIMIT = 16  # Max geïnterpreteerde pagina's (fitz.DisplayList) per worker
+
+    def __init__(self, root, workers=2):
+        self.root = root
+        self.jobs = queue.PriorityQueue()
+        self.results = queue.Queue()
+        self.running = True
+        self._sequence = itertools.count()
+        self._generations = {}  # doc_key -> huidige generatie
+        self._closed = set()  # doc_keys waarvan workers hun document moeten sluiten
+        self._lock = threading.Lock()
+        self.refine_latencies = deque(maxlen=200)  # Seconden tussen draft en scherpe weergave
+        self.display_list_hits = 0
+        self.display_list_builds = 0
+        
+        self.threads = []
+        for i in range(max(1, workers)):
+            thread = threading.Thread(target=self._worker_loop, name=f"RenderWorker-{i}", daemon=True)
+            thread.start()
+            self.threads.append(thread)
+        
+        self.root.after(self.POLL_INTERVAL, self._dispatch_results)
+
+    def submit(self, doc_key, source, password, page_num, zoom, rotation, priority, callback,
+               clip=None, tile=None, draft=False, version=0):
+        """Zet een render opdracht in de wachtrij (lagere prioriteit = eerder)"""
+        with self._lock:
+            generation = self._generations.setdefault(doc_key, 0)
+        job = RenderJob(doc_key, source, password, page_num, zoom, rotation, generation, callback,
+                        clip=clip, tile=tile, draft=draft, version=version)
+        self.jobs.put((priority, next(self._sequence), job))
+        return job
+
+    def cancel(self, doc_key):
+        """Annuleer alle openstaande opdrachten van een document (bijv. na zoom)"""
+        with self._lock:
+            self._generations[doc_key] = self._generations.get(doc_key, 0) + 1
+
+    def record_refine_latency(self, seconds):
+        self.refine_latencies.append(seconds)
+
+    def latency_summary(self):
+        """(aantal, gemiddelde ms, p95 ms) van de draft-naar-scherp latency"""
+        if not self.refine_latencies:
+            return (0, 0.0, 0.0)
+        values = sorted(self.refine_latencies)
+        p95 = values[min(len(values) - 1, int(len(values) * 0.95))]
+        return (len(values), sum(values) / len(values) * 1000, p95 * 1000)
+
+    def close_document(self, doc_key):
+        """Annuleer opdrachten en laat workers hun documenthandle sluiten"""
+        self.cancel(doc_key)
+        with self._lock:
+            self._closed.add(doc_key)
+
+    def stop(self):
+        self.running = False
+        for _ in self.threads:
+            self.jobs.put((float("-inf"), next(self._sequence), None))
+
+    def _is_stale(self, job):
+        return job.cancelled or job.generation != self._generations.get(job.doc_key)
+
+    def _display_list(self, display_lists, doc, job):
+        """Geïnterpreteerde content stream van een pagina, eenmalig opgebouwd per rotatie en versie.
+        
+        Een DisplayList hoort bij het document dat hem maakte, daarom houdt elke worker zijn eigen
+        begrensde LRU bij. Renders op een andere zoom of clip slaan zo het parsen van de pagina over.
+        """
+        key = (job.doc_key, job.page_num, job.rotation, job.version)
+        display_list = display_lists.get(key)
+        if display_list is not None:
+            display_lists.move_to_end(key)
+            self.display_list_hits += 1
+            return display_list
+        
+        page = doc[job.page_num]
+        if page.rotation != job.rotation:
+            page.set_rotation(job.rotation)
+        display_list = page.get_displaylist()
+        self.display_list_builds += 1
+        
+        # Oudere versies van dezelfde pagina zijn nooit meer nodig
+        for stale in [k for k in display_lists if k[:2] == key[:2]]:
+            del display_lists[stale]
+        display_lists[key] = display_list
+        while len(display_lists) > self.DISPLAY_LIST_LIMIT:
+            display_lists.popitem(last=False)
+        return display_list
+
+    def _worker_loop(self):
+        documents = {}  # Eigen documenthandles van deze worker
+        display_lists = OrderedDict()  # (doc_key, pagina, rotatie, versie) -> fitz.DisplayList
+        while self.running:
+            try:
+                _, _, job = self.jobs.get(timeout=0.5)
+            except queue.Empty:
+                job = False
+            
+            # Sluit documenten van gesloten tabs
+            with self._lock:
+                closed = [key for key in documents if key in self._closed]
+            for key in closed:
+                for list_key in [k for k in display_lists if k[0] == key]:
+                    del display_lists[list_key]
+                source, doc = documents.pop(key)
+                source.close(doc)  # Pas nu mag de bron zijn mapping sluiten
+            
+            if job is None:
+                break
+            if job is False or self._is_stale(job):
+                continue
+            
+            try:
+                doc = documents.get(job.doc_key, (None, None))[1]
+                if doc is None:
+                    doc = job.source.open()
+                    documents[job.doc_key] = (job.source, doc)
+                    if job.password and doc.needs_pass:
+                        doc.authenticate(job.password)
+                
+                display_list = self._display_list(display_lists, doc, job)
+                
+                zoom = job.zoom * self.DRAFT_SCALE if job.draft else job.zoom
+                mat = fitz.Matrix(zoom, zoom)
+                pix = display_list.get_pixmap(matrix=mat, clip=job.clip)
+                image = pixmap_to_image(pix)
+                if job.draft:
+                    # Schaal op naar het formaat van de definitieve render
+                    rect = display_list.rect
+                    size = (max(1, int(rect.width * job.zoom)), max(1, int(rect.height * job.zoom)))
+                    image = image.resize(size, Image.Resampling.BILINEAR)
+                job.image = image
+            except Exception as e:
+                job.error = e
+            
+            self.results.put(job)
+        
+        for source, doc in documents.values():
+            source.close(doc)
+
+    def _dispatch_results(self):
+        """Enige plek waar render resultaten de main thread (en dus het canvas) bereiken"""
+        deadline = time.perf_counter() + self.DISPATCH_BUDGET
+        while time.perf_counter() < deadline:
+            try:
+                job = self.results.get_nowait()
+            except queue.Empty:
+                break
+            if self._is_stale(job) or not job.callback:
+                continue
+            try:
+                job.callback(job)
+            except Exception as e:
+                print(f"Fout bij verwerken render resultaat pagina {job.page_num + 1}: {e}")
+        
+        if self.running:
+            self.root.after(self.POLL_INTERVAL, self._dispatch_results)
+
+class RenderCache:
+    """LRU cache van gerenderde bitmaps met een geheugenbudget, gedeeld door alle tabs.
+    
+    Sleutels zijn (document, pagina, zoom bucket, rotatie, render flags), zodat terug zoomen of
+    terug wisselen naar een tab uit het geheugen bediend wordt in plaats van door MuPDF.
+    """
+    def __init__(self, budget_bytes):
+        self.budget_bytes = budget_bytes
+        self.entries = OrderedDict()  # sleutel -> (PIL image, bytes)
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(doc_key, page_num, zoom, rotation, flags=""):
+        return (doc_key, page_num, zoom_bucket(zoom), rotation, flags)
+
+    @staticmethod
+    def image_bytes(image):
+        # PIL slaat RGB op met 4 bytes per pixel
+        width, height = image.size
+        return width * height * 4
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key, image):
+        size = self.image_bytes(image)
+        if size > self.budget_bytes:
+            return
+        if key in self.entries:
+            self.used_bytes -= self.entries.pop(key)[1]
+        self.entries[key] = (image, size)
+        self.used_bytes += size
+        while self.used_bytes > self.budget_bytes:
+            _, (_, evicted) = self.entries.popitem(last=False)
+            self.used_bytes -= evicted
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def find_page(self, doc_key, page_num, rotation):
+        """Een volledige (niet-tile) render van een pagina op willekeurige zoom, of None"""
+        for key, (image, _) in reversed(self.entries.items()):
+            if key[:2] == (doc_key, page_num) and key[3] == rotation and key[4] == "":
+                return image
+        return None
+
+    def drop_page(self, doc_key, page_num):
+        """Verwijder alle bitmaps van één pagina (bijv. nadat de inhoud gewijzigd is)"""
+        for key in [key for key in self.entries if key[:2] == (doc_key, page_num)]:
+            self.used_bytes -= self.entries.pop(key)[1]
+
+    def drop_document(self, doc_key):
+        """Verwijder alle bitmaps van één document (bijv. bij sluiten van een tab)"""
+        for key in [key for key in self.entries if key[0] == doc_key]:
+            self.used_bytes -= self.entries.pop(key)[1]
+
+    def document_bytes(self, doc_key):
+        return sum(size for key, (_, size) in self.entries.items() if key[0] == doc_key)
+
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+class DiskCache:
+    """Persistente LRU cache van thumbnails en renders van het eerste scherm, naast het settings bestand.
+    
+    Sleutels zijn (inhoud-vingerafdruk, pagina, zoom bucket, rotatie, soort), zodat hetzelfde document
+    ook onder een andere naam herkend wordt. De LRU volgorde is de wijzigingstijd van de bestanden;
+    PNG's worden in een eigen thread geschreven zodat de UI niet op de schijf wacht.
+    """
+    def __init__(self, directory, budget_bytes):
+        self.directory = directory
+        self.budget_bytes = budget_bytes
+        self.entries = OrderedDict()  # bestandsnaam -> bytes, minst recent gebruikt eerst
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._writes = queue.Queue()
+        
+        try:
+            os.makedirs(directory, exist_ok=True)
+            files = [entry for entry in os.scandir(directory) if entry.name.endswith(".png")]
+        except OSError:
+            files = []
+        for entry in sorted(files, key=lambda entry: entry.stat().st_mtime):
+            size = entry.stat().st_size
+            self.entries[entry.name] = size
+            self.used_bytes += size
+        
+        self._writer = threading.Thread(target=self._write_loop, name="DiskCacheWriter", daemon=True)
+        self._writer.start()
+
+    @staticmethod
+    def key(fingerprint, page_num, zoom, rotation, kind="page"):
+        return f"{fingerprint}_{page_num}_{zoom_bucket(zoom)}_{rotation}_{kind}.png"
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self.entries
+
+    def get(self, key):
+        """Lees een image van schijf (None als hij er niet is)"""
+        with self._lock:
+            if key not in self.entries:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+        path = os.path.join(self.directory, key)
+        try:
+            with Image.open(path) as stored:
+                image = stored.convert("RGB")
+            os.utime(path)  # LRU volgorde blijft bewaard over sessies
+        except (OSError, ValueError):
+            with self._lock:
+                self.used_bytes -= self.entries.pop(key, 0)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return image
+
+    def put(self, key, image, replace=False):
+        """Schrijf een image in de achtergrond (bestaande sleutels alleen met replace)"""
+        if not replace and key in self:
+            return
+        self._writes.put((key, image))
+
+    def close(self):
+        """Schrijf openstaande images weg en stop de writer"""
+        self._writes.put(None)
+        self._writer.join(timeout=2)
+
+    def _write_loop(self):
+        while True:
+            item = self._writes.get()
+            if item is None:
+                return
+            key, image = item
+            path = os.path.join(self.directory, key)
+            try:
+                temp_path = path + ".tmp"
+                image.save(temp_path, "PNG", compress_level=1)
+                os.replace(temp_path, path)
+                size = os.path.getsize(path)
+            except OSError:
+                continue
+            with self._lock:
+                self.used_bytes += size - self.entries.pop(key, 0)
+                self.entries[key] = size
+                evicted = []
+                while self.used_bytes > self.budget_bytes and len(self.entries) > 1:
+                    name, evicted_size = self.entries.popitem(last=False)
+                    self.used_bytes -= evicted_size
+                    evicted.append(name)
+            for name in evicted:
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass
+
 class PDFTab(tk.Frame):
     """Een enkel tabblad dat een PDF-document beheert."""
-    def __init__(self, master, file_path, theme, password=None):
+    # Standaard marge (in pixels) boven en onder de viewport waarbinnen pagina's worden gerenderd
+    DEFAULT_RENDER_MARGIN = 800
+    # Pagina's groter dan dit aantal pixels worden in tiles gerenderd (alleen het zichtbare deel)
+    TILE_THRESHOLD_PIXELS = 4000000
+    TILE_SIZE = 512
+    # Live selectie preview wordt maximaal één keer per frame bijgewerkt
+    SELECTION_FRAME_MS = 16
+    # Gewijzigde formuliervelden worden gebundeld naar MuPDF geschreven na deze pauze
+    FORM_FLUSH_DELAY_MS = 500
+    # Miniaturen: breedte in pixels, marge die vooraf gerenderd wordt en prioriteit (na alle pagina's)
+    THUMBNAIL_WIDTH = 110
+    THUMBNAIL_MARGIN = 600
+    THUMBNAIL_PRIORITY = 1000000
+
+    _doc_keys = itertools.count(1)  # Unieke sleutel per geopend document (voor render workers)
+
+    def __init__(self, master, file_path, theme, password=None, render_margin=None, document=None, layout=None,
+                 source=None):
         super().__init__(master, bg=theme["BG_PRIMARY"])
         self.theme = theme
         
-        # Document state
+        # Document state (een al geopend document wordt overgenomen in plaats van opnieuw geparsed)
         self.file_path = file_path
-        self.pdf_document = fitz.open(file_path)
+        self.source = source or DocumentSource.from_file(file_path)
+        self.password = password
+        self.doc_key = next(PDFTab._doc_keys)
+        self.pdf_document = document if document is not None else self.source.open()
         
         # Authenticeer met wachtwoord indien nodig
         if password and self.pdf_document.needs_pass:
             self.pdf_document.authenticate(password)
         
+        # Tijd tot de eerste zichtbare pagina (vanaf het openen)
+        self.open_started = time.perf_counter()
+        self.first_page_ms = None
+        self.screen_saved = False  # Eerste scherm staat in de schijf cache
+        self.opening_screen = None  # {page_num: PIL image} van de open thread, tot de eerste scherpe render
+        
+        # Slaapstand: document gesloten, alleen positie, zoom en formulierwaarden bewaard
+        self.hibernated = False
+        self.saved_anchor = None
+        self.last_active = time.monotonic()
+        
         self.current_page = 0
         self.zoom_level = 1.0
         self.zoom_mode = "fit_width"
@@ -369,41 +1782,121 @@ class PDFTab(tk.Frame):
         # UI elements
         self.canvas = tk.Canvas(self, bg=theme["BG_PRIMARY"], relief="flat", bd=0, 
                                highlightthickness=0)
-        v_scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.canvas.yview)
-        h_scrollbar = ttk.Scrollbar(self, orient=tk.HORIZONTAL, command=self.canvas.xview)
-        self.canvas.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
-        
-        v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        h_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
+        self.v_scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.canvas.yview)
+        self.h_scrollbar = ttk.Scrollbar(self, orient=tk.HORIZONTAL, command=self.canvas.xview)
+        self.canvas.configure(yscrollcommand=self._on_yscroll, xscrollcommand=self._on_xscroll)
+        
+        # Miniaturen zijbalk (alleen de zichtbare miniaturen bestaan als Tk image)
+        self.thumb_frame = tk.Frame(self, bg=theme["BG_SECONDARY"])
+        self.thumb_canvas = tk.Canvas(self.thumb_frame, bg=theme["BG_SECONDARY"], relief="flat", bd=0,
+                                      highlightthickness=0,
+                                      width=self.THUMBNAIL_WIDTH + PageLayout.MARGIN_X * 2)
+        self.thumb_scrollbar = ttk.Scrollbar(self.thumb_frame, orient=tk.VERTICAL, command=self.thumb_canvas.yview)
+        self.thumb_canvas.configure(yscrollcommand=self._on_thumb_scroll)
+        self.thumb_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.thumb_canvas.pack(side=tk.LEFT, fill=tk.Y)
+        self.thumb_frame.pack(side=tk.LEFT, fill=tk.Y)
+        
+        self.v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.h_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
         # Selection data
-        self.text_words = []
         self.drag_start = None
         self.drag_rect = None
+        self.drag_pointer = None  # Laatste muispositie die nog verwerkt moet worden
+        self.selection_after = None  # Geplande preview update (één per frame)
+        self.selection_items = {}  # Geselecteerd woord (canvas coördinaten) -> overlay item
         self.selection_rects = []
         self.selected_text = ""
         
         # Images
-        self.current_image = None
-        self.highlighted_image = None
         self.page_offset_x = 0
         self.page_offset_y = 0
-        self.page_images = []  # Voor continuous scroll
-        self.page_pil_images = {}  # PIL images voor elke pagina (voor highlighting)
-        self.page_positions = []  # Y-positie van elke pagina
+        self.page_images = {}  # PhotoImages van gerenderde pagina's (alleen zichtbare)
+        self.page_pil_images = {}  # PIL images voor elke gerenderde pagina (voor zoom previews)
+        self.layout = layout or PageLayout(self.pdf_document)  # Geometrie van alle pagina's
+        self.text_layer = TextLayer(self.pdf_document)  # Tekst per pagina, pas geëxtraheerd bij gebruik
+        self.pending_renders = {}  # page_num -> RenderJob die nog in de wachtrij staat
+        self.draft_pages = {}  # page_num -> tijdstip waarop de draft getoond werd
+        self.page_tiles = {}  # page_num -> {(kolom, rij): PhotoImage} voor tiled pagina's
+        self.pending_tiles = {}  # (page_num, kolom, rij) -> RenderJob
+        self.search_hits = {}  # page_num -> zoekresultaten (PDF rechthoeken) om te highlighten
+        self.search_index = None  # SearchIndex, in de achtergrond opgebouwd na de eerste pagina
+        self.search_query = ""
+        self.search_job = None  # Lopende SearchJob van de zoekbalk
+        self.search_results = []  # [(page_num, [rechthoeken], fragment)] vanaf de pagina waar gezocht werd
+        self.search_position = -1  # Huidige treffer (F3 / Shift+F3)
+        self.page_versions = {}  # page_num -> inhoudsversie, verhoogd bij rotatie of formulier wijziging
         self.scroll_to_page = None  # Flag voor initiële scroll
         
-        # Form fields
-        self.form_widgets = []
+        # Virtualisatie: render alleen pagina's binnen viewport + marge
+        self.render_margin = render_margin if render_margin is not None else self.DEFAULT_RENDER_MARGIN
+        self.view_changed_callback = None
+        self._visible_update_pending = False  # update_visible_pages staat al gepland (after_idle)
+        self._refine_after = None  # Geplande scherpe render van drafts (after id)
+        
+        # Form fields (canvas items per veld, één gedeelde editor widget)
         self.form_data = {}  # Store form field values
+        self.dirty_fields = set()  # Veldnamen waarvan de waarde nog niet in het document staat
+        self.form_flush_after = None  # Geplande batch write-back
+        self.page_fields = {}  # page_num -> [FormField], eenmalig gelezen
+        self.field_order = None  # Tab volgorde over het hele document: [(page_num, index)]
+        self.field_positions = {}  # (page_num, index) -> positie in field_order
+        self.field_index = None  # Veldnaam -> [(page_num, xref, veldtype)], eenmalig per document
+        self.attached_pages = set()  # Pagina's waarvan velden en zoekresultaten getekend zijn
+        self.active_field = None  # FormField met focus
+        self.editor_field = None  # FormField waarvan de waarde in de editor staat
+        self.form_entry = None  # Gedeelde editor voor tekstvelden
+        self.form_combo = None  # Gedeelde editor voor keuzelijsten
+        
+        # Miniaturen
+        self.thumb_layout = None  # PageLayout op miniatuur zoom
+        self.thumb_images = {}  # page_num -> PhotoImage (None = nog placeholder), alleen zichtbare
+        self.pending_thumbs = {}  # page_num -> RenderJob
+        self.thumb_after = None
+        self.thumb_view_callback = None
+
+    def _on_yscroll(self, first, last):
+        """Werk scrollbar bij en meld dat de zichtbare regio is veranderd"""
+        self.v_scrollbar.set(first, last)
+        if self.view_changed_callback:
+            self.view_changed_callback()
+
+    def _on_thumb_scroll(self, first, last):
+        self.thumb_scrollbar.set(first, last)
+        if self.thumb_view_callback:
+            self.thumb_view_callback()
+
+    def _on_xscroll(self, first, last):
+        """Horizontaal scrollen kan nieuwe tiles zichtbaar maken"""
+        self.h_scrollbar.set(first, last)
+        if self.view_changed_callback:
+            self.view_changed_callback()
+
+    def invalidate_page(self, page_num):
+        """Markeer de inhoud van een pagina als gewijzigd (display lists worden opnieuw opgebouwd)"""
+        self.page_versions[page_num] = self.page_versions.get(page_num, 0) + 1
+        self.text_layer.invalidate(page_num)
+        self.page_fields.pop(page_num, None)
+        self.field_order = None
+        self.field_index = None
 
     def close_document(self):
         if self.pdf_document:
-            self.pdf_document.close()
+            self.source.close(self.pdf_document)
             self.pdf_document = None
+        if self.source:
+            self.source.release()
+            self.source = None
 
 class NVictReader:
+    MEMORY_CHECK_MS = 5000  # Interval van de geheugenbewaking over alle tabs
+    FIND_DELAY_MS = 120  # Wachttijd na een toetsaanslag voordat een nieuwe zoekopdracht start
+    FIND_POLL_MS = 15  # Interval waarmee gestreamde treffers in de lijst komen
+    FIND_BUDGET = 0.02  # Max seconden per ronde voor het verwerken van treffers
+    OPENING_CHROME = (30, 50)  # Geschatte ruimte (px) van tabrand en scrollbalken rond het canvas van een tab
+
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("NVict Reader")
@@ -435,6 +1928,15 @@ class NVictReader:
         
         self.apply_theme()
         
+        # Achtergrond rendering (houdt de UI responsief tijdens het rasteriseren)
+        self.render_service = RenderService(self.root, workers=self.update_settings.get('render_threads', 2))
+        self.render_cache = RenderCache(self.update_settings.get('render_cache_mb', 256) * 1024 * 1024)
+        self.disk_cache = DiskCache(os.path.join(os.path.dirname(get_settings_path()), 'cache'),
+                                    self.update_settings.get('disk_cache_mb', 200) * 1024 * 1024)
+        self.first_page_times = deque(maxlen=50)  # ms van openen tot eerste zichtbare pagina
+        self.opening_files = set()  # Bestanden die nu in de achtergrond geopend worden
+        self.root.after(self.MEMORY_CHECK_MS, self.memory_governor_loop)
+        
         self.load_icons()
         
         self.setup_ui()
@@ -563,6 +2065,7 @@ class NVictReader:
         self.notebook = ttk.Notebook(self.root)
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=20, pady=(10, 20))
         self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_change)
+        self.create_find_bar()
 
         self.welcome_frame = tk.Frame(self.notebook, bg=self.theme["BG_PRIMARY"])
         
@@ -598,6 +2101,8 @@ class NVictReader:
         menubar.add_cascade(label="Bestand", menu=file_menu)
         file_menu.add_command(label="Openen...", command=self.open_pdf, accelerator="Ctrl+O")
         file_menu.add_command(label="Opslaan...", command=self.save_form_data, accelerator="Ctrl+S")
+        file_menu.add_command(label="Formulierdata importeren...", command=self.import_form_data)
+        file_menu.add_command(label="Formulierdata exporteren...", command=self.export_form_data)
         file_menu.add_separator()
         file_menu.add_command(label="Afdrukken...", command=self.print_pdf, accelerator="Ctrl+P")
         file_menu.add_separator()
@@ -608,7 +2113,7 @@ class NVictReader:
         edit_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="Bewerken", menu=edit_menu)
         edit_menu.add_command(label="Kopieer tekst", command=self.copy_text, accelerator="Ctrl+C")
-        edit_menu.add_command(label="Zoeken...", command=self.show_search_dialog, accelerator="Ctrl+F")
+        edit_menu.add_command(label="Zoeken...", command=self.show_find_bar, accelerator="Ctrl+F")
         edit_menu.add_separator()
         edit_menu.add_command(label="Pagina's exporteren...", command=self.export_pages)
         edit_menu.add_command(label="PDF's samenvoegen...", command=self.merge_pdfs)
@@ -659,7 +2164,7 @@ class NVictReader:
         
         # Zoeken, Kopiëren, Info, Bewerken
         self.search_btn = self.create_toolbar_button(toolbar_frame, " Zoeken", "search", 
-                                                     self.show_search_dialog, self.theme["BG_SECONDARY"])
+                                                     self.show_find_bar, self.theme["BG_SECONDARY"])
         self.copy_btn = self.create_toolbar_button(toolbar_frame, " Kopiëren", "copy", 
                                                    self.copy_text, self.theme["BG_SECONDARY"])
         self.info_btn = self.create_toolbar_button(toolbar_frame, " Info", "info", 
@@ -796,7 +2301,10 @@ class NVictReader:
         self.root.bind("<Control-plus>", lambda e: self.zoom_in())
         self.root.bind("<Control-minus>", lambda e: self.zoom_out())
         self.root.bind("<Control-c>", lambda e: self.copy_text())
-        self.root.bind("<Control-f>", lambda e: self.show_search_dialog())
+        self.root.bind("<Control-f>", lambda e: self.show_find_bar())
+        self.root.bind("<Control-b>", lambda e: self.toggle_thumbnails())
+        self.root.bind("<F3>", lambda e: self.find_next(1))
+        self.root.bind("<Shift-F3>", lambda e: self.find_next(-1))
         self.root.bind("<Left>", lambda e: self.prev_page())
         self.root.bind("<Right>", lambda e: self.next_page())
 
@@ -807,7 +2315,15 @@ class NVictReader:
             'auto_download': False,  # Automatisch downloaden (standaard uit)
             'last_check': None,
             'window_geometry': None,  # Laatst gebruikte schermgrootte
-            'window_state': 'normal'  # normal of zoomed (maximized)
+            'window_state': 'normal',  # normal of zoomed (maximized)
+            'render_margin': PDFTab.DEFAULT_RENDER_MARGIN,  # Pixels rond viewport die vooraf gerenderd worden
+            'render_threads': 2,  # Aantal achtergrond render threads
+            'progressive_render': True,  # Eerst snelle draft tonen, daarna scherp renderen
+            'refine_delay_ms': 150,  # Wachttijd na scrollen voordat drafts scherp gerenderd worden
+            'render_cache_mb': 256,  # Geheugenbudget voor gerenderde pagina's (alle tabs samen)
+            'memory_limit_mb': 1536,  # Plafond voor alle tabs samen; daarboven gaan achtergrond tabs slapen
+            'disk_cache_mb': 200,  # Schijfruimte voor thumbnails en het eerste scherm van recente documenten
+            'show_thumbnails': True  # Miniaturen zijbalk naast het document
         }
         
         try:
@@ -852,7 +2368,161 @@ class NVictReader:
         return None
 
     def on_tab_change(self, event=None):
+        tab = self.get_active_tab()
+        if isinstance(tab, PDFTab):
+            tab.last_active = time.monotonic()
+            if tab.hibernated:
+                self.rehydrate_tab(tab)
+            else:
+                # Bitmaps kunnen door de geheugenbewaking vrijgegeven zijn
+                self.schedule_visible_update(tab)
+                self.schedule_thumbnail_update(tab)
+        self.sync_find_bar(tab)
         self.update_ui_state()
+        self.enforce_memory_limit()
+
+    # ====================================================================
+    # GEHEUGENBEWAKING EN SLAAPSTAND
+    # ====================================================================
+
+    def pdf_tabs(self):
+        return [tab for tab in (self.notebook.nametowidget(tab_id) for tab_id in self.notebook.tabs())
+                if isinstance(tab, PDFTab)]
+
+    def estimate_tab_memory(self, tab):
+        """Geschat geheugen (bytes) van een tab: document, bitmaps, PhotoImages, tekst en cache"""
+        if tab.hibernated:
+            return 0
+        total = tab.source.size() if tab.source else 0  # Geparsed document schaalt met de bestandsgrootte
+        for image in tab.page_pil_images.values():
+            total += RenderCache.image_bytes(image) * 2  # PIL image + PhotoImage kopie in Tk
+        tile_bytes = PDFTab.TILE_SIZE * PDFTab.TILE_SIZE * 4
+        total += sum(len(tiles) for tiles in tab.page_tiles.values()) * tile_bytes
+        total += sum(len(words) for words in tab.text_layer.words.values()) * 200
+        total += self.render_cache.document_bytes(tab.doc_key)
+        if tab.search_index:
+            total += tab.search_index.memory_bytes()
+        return total
+
+    def memory_governor_loop(self):
+        self.enforce_memory_limit()
+        self.root.after(self.MEMORY_CHECK_MS, self.memory_governor_loop)
+
+    def enforce_memory_limit(self):
+        """Houd alle tabs samen onder het plafond: eerst caches van achtergrond tabs, dan slaapstand (LRU)"""
+        limit = self.update_settings.get('memory_limit_mb', 1536) * 1024 * 1024
+        tabs = self.pdf_tabs()
+        total = sum(self.estimate_tab_memory(tab) for tab in tabs)
+        if total <= limit:
+            return
+        
+        active = self.get_active_tab()
+        background = sorted((tab for tab in tabs if tab is not active and not tab.hibernated),
+                            key=lambda tab: tab.last_active)
+        
+        # Stap 1: gerenderde pagina's en cache van achtergrond tabs vrijgeven
+        for tab in background:
+            if total <= limit:
+                return
+            before = self.estimate_tab_memory(tab)
+            self.release_rendered_pages(tab)
+            total -= before - self.estimate_tab_memory(tab)
+        
+        # Stap 2: minst recent gebruikte tabs in slaapstand
+        for tab in background:
+            if total <= limit:
+                return
+            total -= self.estimate_tab_memory(tab)
+            self.hibernate_tab(tab)
+
+    def release_rendered_pages(self, tab):
+        """Geef alle bitmaps van een tab vrij (worden opnieuw gerenderd als de tab weer zichtbaar is)"""
+        self.render_service.cancel(tab.doc_key)
+        for page_num in set(tab.page_images) | set(tab.page_tiles) | set(tab.pending_renders):
+            self.release_page(tab, page_num)
+        tab.canvas.delete("page")
+        tab.thumb_canvas.delete("thumb")
+        tab.thumb_images = {}
+        tab.pending_thumbs = {}
+        self.render_cache.drop_document(tab.doc_key)
+
+    def hibernate_tab(self, tab):
+        """Sluit het document van een achtergrond tab; positie, zoom en formulierwaarden blijven bewaard"""
+        if tab.hibernated or not tab.pdf_document:
+            return
+        
+        # Bewaar het punt midden in de viewport (pagina coördinaten) voor het herstellen
+        layout = tab.layout
+        center_y = tab.canvas.canvasy(max(tab.canvas.winfo_height(), 1) / 2)
+        center_x = tab.canvas.canvasx(max(tab.canvas.winfo_width(), 1) / 2)
+        page_num = layout.page_at(center_y)
+        x0, y0 = layout.page_rect(page_num)[:2]
+        tab.saved_anchor = (page_num, ((center_x - x0) / layout.zoom, (center_y - y0) / layout.zoom))
+        
+        # Waarden staan in tab.form_data en worden bij het herstellen opnieuw weggeschreven
+        self.deactivate_field(tab)
+        if tab.form_flush_after is not None:
+            self.root.after_cancel(tab.form_flush_after)
+            tab.form_flush_after = None
+        self.release_rendered_pages(tab)
+        self.render_service.close_document(tab.doc_key)
+        
+        tab.canvas.delete("all")
+        tab.thumb_canvas.delete("all")
+        tab.attached_pages = set()
+        tab.page_fields = {}
+        tab.field_order = None
+        tab.field_index = None
+        tab.text_layer = None
+        if tab.search_index:
+            tab.search_index.cancel()
+            tab.search_index = None
+        if tab.search_job:
+            tab.search_job.cancel()
+            tab.search_job = None
+        
+        # Workers sluiten hun eigen handle pas in hun volgende ronde; tot dan blijft de mapping bestaan
+        tab.source.close(tab.pdf_document)
+        tab.pdf_document = None
+        if tab.source.path:
+            # Bestanden kunnen opnieuw gemapt worden; bronnen in het geheugen blijven bewaard
+            tab.source.release()
+            tab.source = None
+        tab.hibernated = True
+        self.notebook.tab(tab, text=f"💤 {os.path.basename(tab.file_path)}")
+
+    def rehydrate_tab(self, tab):
+        """Open een tab in slaapstand opnieuw op dezelfde positie en zoom"""
+        try:
+            if tab.source is None:
+                tab.source = DocumentSource.from_file(tab.file_path)
+            document = tab.source.open()
+            if tab.password and document.needs_pass:
+                document.authenticate(tab.password)
+        except Exception as e:
+            messagebox.showerror("Fout", f"Kan PDF niet opnieuw openen:\n{str(e)}")
+            return
+        
+        tab.pdf_document = document
+        tab.doc_key = next(PDFTab._doc_keys)  # Workers hebben de oude handle gesloten
+        tab.text_layer = TextLayer(document)
+        
+        # Niet opgeslagen rotaties opnieuw toepassen (alleen pagina's die gewijzigd zijn)
+        for page_num in tab.page_versions:
+            if document[page_num].rotation != tab.layout.rotations[page_num]:
+                document[page_num].set_rotation(tab.layout.rotations[page_num])
+        
+        # Formulierwaarden stonden in het gesloten document: opnieuw wegschrijven
+        tab.dirty_fields = set(tab.form_data)
+        if tab.dirty_fields:
+            self.schedule_form_flush(tab)
+        
+        tab.hibernated = False
+        self.notebook.tab(tab, text=os.path.basename(tab.file_path))
+        self.display_page(tab, anchor=tab.saved_anchor)
+        self.refresh_thumbnails(tab)
+        self.start_search_index(tab)
+        tab.saved_anchor = None
 
     def update_ui_state(self):
         tab = self.get_active_tab()
@@ -865,7 +2535,7 @@ class NVictReader:
         
         if has_pdf:
             self.page_var.set(str(tab.current_page + 1))
-            self.total_pages_label.config(text=f"/ {len(tab.pdf_document)}")
+            self.total_pages_label.config(text=f"/ {len(tab.layout)}")
             self.status_label.config(text=f"Zoom: {int(tab.zoom_level * 100)}%")
         else:
             self.page_var.set("1")
@@ -880,7 +2550,8 @@ class NVictReader:
         if file_path:
             self.add_new_tab(file_path)
 
-    def add_new_tab(self, file_path):
+    def add_new_tab(self, file_path, source=None):
+        """Open een document in een nieuwe tab (source: DocumentSource, standaard het bestand zelf)"""
         try:
             # Normaliseer bestandspad voor vergelijking
             file_path = os.path.abspath(file_path)
@@ -913,46 +2584,125 @@ class NVictReader:
             self.root.lift()
             self.root.focus_force()
             
-            # Probeer eerst te openen om te controleren of wachtwoord nodig is
-            test_doc = fitz.open(file_path)
+            # Eén keer openen (en xref herstellen) in de achtergrond; de UI blijft bruikbaar
+            if file_path in self.opening_files:
+                return
+            self.opening_files.add(file_path)
+            started = time.perf_counter()
+            self.status_label.config(text=f"Openen: {os.path.basename(file_path)}...")
+            result = {}
+            if source is None:
+                source = DocumentSource.from_file(file_path)
+            result["source"] = source
+            result["preview"] = self.show_cached_screen(file_path, source)
+            viewport = self.estimate_viewport()
+            
+            def open_document():
+                try:
+                    document = source.open()
+                except Exception as e:
+                    result["error"] = e
+                    return
+                try:
+                    # Geometrie van alle pagina's alvast bepalen (kan pas na authenticatie)
+                    result["layout"] = None if document.needs_pass else PageLayout(document)
+                    result["document"] = document
+                except Exception as e:
+                    source.close(document)
+                    result["error"] = e
+                    return
+                if result["layout"] is not None and viewport is not None:
+                    try:
+                        result["opening"] = self.render_opening_screen(document, result["layout"], viewport)
+                    except Exception as e:
+                        print(f"Fout bij renderen eerste scherm: {e}")  # Workers renderen het alsnog
+            
+            thread = threading.Thread(target=open_document, name="OpenDocument", daemon=True)
+            thread.start()
+            
+            def wait_for_document():
+                if thread.is_alive():
+                    self.root.after(15, wait_for_document)
+                else:
+                    self.finish_open(file_path, result, started)
+            
+            wait_for_document()
             
+        except Exception as e:
+            messagebox.showerror("Fout", f"Kan PDF niet openen:\n{str(e)}")
+
+    def finish_open(self, file_path, result, started):
+        """Maak de tab aan met het al geopende (en geauthenticeerde) document"""
+        self.opening_files.discard(file_path)
+        source = result["source"]
+        preview = result.get("preview")
+        
+        def drop_preview():
+            # Het voorlopige scherm uit de schijf cache maakt plaats voor de echte tab
+            nonlocal preview
+            if preview is not None:
+                self.notebook.forget(preview)
+                preview.destroy()
+                preview = None
+                if len(self.notebook.tabs()) == 0:
+                    self.notebook.add(self.welcome_frame)
+        
+        if "error" in result:
+            source.release()
+            drop_preview()
+            self.status_label.config(text="")
+            messagebox.showerror("Fout", f"Kan PDF niet openen:\n{str(result['error'])}")
+            return
+        
+        document = result["document"]
+        layout = result["layout"]
+        try:
             # Controleer of document beveiligd is
-            if test_doc.needs_pass:
-                test_doc.close()
-                
+            if document.needs_pass:
                 # Vraag wachtwoord
                 password = self.ask_password(file_path)
                 
                 if password is None:
                     # Gebruiker heeft geannuleerd
+                    source.close(document)
+                    source.release()
+                    drop_preview()
+                    self.status_label.config(text="")
                     return
                 
-                # Probeer te openen met wachtwoord
-                test_doc = fitz.open(file_path)
-                auth_result = test_doc.authenticate(password)
-                
-                if not auth_result:
-                    test_doc.close()
+                if not document.authenticate(password):
+                    source.close(document)
+                    source.release()
+                    drop_preview()
+                    self.status_label.config(text="")
                     messagebox.showerror("Fout", 
                         "Onjuist wachtwoord!\n\nKan het PDF bestand niet openen.")
                     return
                 
-                # Wachtwoord is correct, sla het op voor later gebruik
-                # (wordt gebruikt bij PDFTab aanmaak)
+                # Wachtwoord is correct, render workers openen het document zelf ook
                 self.temp_password = password
+                layout = PageLayout(document)
             else:
                 self.temp_password = None
             
-            test_doc.close()
-            
             # Nu de tab aanmaken
             if self.welcome_frame.winfo_ismapped():
                 self.notebook.forget(self.welcome_frame)
 
-            tab = PDFTab(self.notebook, file_path, self.theme, getattr(self, 'temp_password', None))
-            self.notebook.add(tab, text=os.path.basename(file_path), padding=5)
+            tab = PDFTab(self.notebook, file_path, self.theme, getattr(self, 'temp_password', None),
+                         render_margin=self.update_settings.get('render_margin'),
+                         document=document, layout=layout, source=source)
+            tab.open_started = started
+            tab.view_changed_callback = lambda t=tab: self.schedule_visible_update(t)
+            if result.get("opening"):
+                self.adopt_opening_screen(tab, *result["opening"])
+            if preview is not None:
+                self.notebook.insert(preview, tab, text=os.path.basename(file_path), padding=5)
+            else:
+                self.notebook.add(tab, text=os.path.basename(file_path), padding=5)
             self.notebook.select(tab)
-            self.display_page(tab)
+            drop_preview()
+            self.display_page(tab, preview=tab.opening_screen)
             
             # Bind events
             tab.canvas.bind("<Configure>", lambda e, t=tab: self.on_resize(e, t))
@@ -960,17 +2710,68 @@ class NVictReader:
             tab.canvas.bind("<B1-Motion>", lambda e, t=tab: self.on_drag(e, t))
             tab.canvas.bind("<ButtonRelease-1>", lambda e, t=tab: self.on_release(e, t))
             
+            # Formuliervelden: Tab volgorde en checkbox wisselen via het toetsenbord
+            tab.canvas.bind("<Tab>", lambda e, t=tab: self.focus_next_field(t, 1))
+            tab.canvas.bind("<Shift-Tab>", lambda e, t=tab: self.focus_next_field(t, -1))
+            tab.canvas.bind("<ISO_Left_Tab>", lambda e, t=tab: self.focus_next_field(t, -1))
+            tab.canvas.bind("<space>", lambda e, t=tab: self.toggle_active_checkbox(t))
+            
             # Muiswiel
             tab.canvas.bind("<MouseWheel>", lambda e, t=tab: self.on_mousewheel(e, t))
             tab.canvas.bind("<Button-4>", lambda e, t=tab: self.on_mousewheel(e, t))
             tab.canvas.bind("<Button-5>", lambda e, t=tab: self.on_mousewheel(e, t))
             
+            self.setup_thumbnails(tab)
+            
             # Wis tijdelijk wachtwoord
             self.temp_password = None
             
         except Exception as e:
+            drop_preview()
             messagebox.showerror("Fout", f"Kan PDF niet openen:\n{str(e)}")
     
+    def estimate_viewport(self):
+        """Verwachte canvasgrootte (breedte, hoogte) van een nieuwe tab, of None als het venster nog niet getekend is"""
+        for tab in self.pdf_tabs():
+            if tab.canvas.winfo_width() > 1:
+                return tab.canvas.winfo_width(), tab.canvas.winfo_height()
+        width = self.notebook.winfo_width() - self.OPENING_CHROME[0]
+        height = self.notebook.winfo_height() - self.OPENING_CHROME[1]
+        if self.update_settings.get('show_thumbnails', True):
+            width -= PDFTab.THUMBNAIL_WIDTH + PageLayout.MARGIN_X * 2 + self.OPENING_CHROME[0]
+        return (width, height) if width > 1 and height > 1 else None
+
+    def render_opening_screen(self, document, layout, viewport):
+        """Render het eerste scherm met het document van de open thread (draait op die thread).
+        
+        Render workers openen pas daarna hun eigen handle, zodat de eerste pagina niet wacht op een
+        tweede keer parsen (en xref herstel). Geeft (zoom, {page_num: PIL image}) terug.
+        """
+        width, height = viewport
+        zoom = layout.fit_width_zoom(width)
+        if zoom is None:
+            return None
+        layout.set_zoom(zoom)
+        images = {}
+        for page_num in layout.visible_range(0, height):
+            page_width, page_height = layout.sizes[page_num]
+            if page_width * page_height > PDFTab.TILE_THRESHOLD_PIXELS:
+                continue  # Grote pagina's gaan in tiles via de workers
+            pix = document[page_num].get_pixmap(matrix=fitz.Matrix(zoom, zoom))
+            images[page_num] = pixmap_to_image(pix)
+        return zoom, images
+
+    def adopt_opening_screen(self, tab, zoom, images):
+        """Zet het eerste scherm van de open thread in de caches; display_page toont het direct"""
+        for page_num, image in images.items():
+            rotation = tab.layout.rotations[page_num]
+            self.render_cache.put(RenderCache.key(tab.doc_key, page_num, zoom, rotation), image)
+            disk_key = self.disk_cache_key(tab, page_num, zoom, rotation)
+            if disk_key:
+                self.disk_cache.put(disk_key, image)
+        # Wijkt de echte canvasgrootte af, dan toont display_page ze geschaald als draft
+        tab.opening_screen = images or None
+
     def ask_password(self, file_path):
         """Toon dialoog om wachtwoord op te vragen voor beveiligde PDF"""
         dialog = tk.Toplevel(self.root)
@@ -1060,9 +2861,199 @@ class NVictReader:
         elif event.num == 5 or event.delta < 0:
             tab.canvas.yview_scroll(1, "units")
 
+    # ====================================================================
+    # MINIATUREN ZIJBALK
+    # ====================================================================
+
+    def setup_thumbnails(self, tab):
+        """Koppel de miniaturen zijbalk van een nieuwe tab"""
+        tab.thumb_view_callback = lambda t=tab: self.schedule_thumbnail_update(t)
+        tab.thumb_canvas.bind("<Configure>", lambda e, t=tab: self.schedule_thumbnail_update(t))
+        tab.thumb_canvas.bind("<Button-1>", lambda e, t=tab: self.on_thumbnail_click(e, t))
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            tab.thumb_canvas.bind(sequence, lambda e, t=tab: self.on_thumbnail_wheel(e, t))
+        if not self.update_settings.get('show_thumbnails', True):
+            tab.thumb_frame.pack_forget()
+        self.refresh_thumbnails(tab)
+
+    def toggle_thumbnails(self):
+        """Toon of verberg de miniaturen zijbalk in alle tabs"""
+        show = not self.update_settings.get('show_thumbnails', True)
+        self.update_settings['show_thumbnails'] = show
+        self.save_update_settings()
+        for tab in self.pdf_tabs():
+            if show:
+                tab.thumb_frame.pack(side=tk.LEFT, fill=tk.Y, before=tab.canvas)
+                self.schedule_thumbnail_update(tab)
+            else:
+                tab.thumb_frame.pack_forget()
+                tab.thumb_canvas.delete("thumb")
+                tab.thumb_images = {}
+
+    def refresh_thumbnails(self, tab):
+        """Leg de miniaturen opnieuw neer (na openen of rotatie)"""
+        for job in tab.pending_thumbs.values():
+            job.cancel()
+        tab.pending_thumbs = {}
+        tab.thumb_images = {}
+        tab.thumb_canvas.delete("all")
+        
+        # Eén zoom voor alle miniaturen: de breedste pagina vult de zijbalk
+        widest = max((width for width, height in tab.layout.base_sizes), default=1)
+        tab.thumb_layout = tab.layout.scaled(PDFTab.THUMBNAIL_WIDTH / max(widest, 1))
+        tab.thumb_canvas.configure(scrollregion=(0, 0, PDFTab.THUMBNAIL_WIDTH + PageLayout.MARGIN_X * 2,
+                                                 tab.thumb_layout.total_height))
+        self.schedule_thumbnail_update(tab)
+
+    def schedule_thumbnail_update(self, tab):
+        if tab.thumb_after is None:
+            tab.thumb_after = self.root.after_idle(lambda t=tab: self.update_thumbnails(t))
+
+    def update_thumbnails(self, tab):
+        """Toon de miniaturen in beeld en render die erboven en eronder alvast in de achtergrond"""
+        tab.thumb_after = None
+        if not tab.pdf_document or tab.thumb_layout is None or not tab.thumb_frame.winfo_manager():
+            return
+        
+        canvas = tab.thumb_canvas
+        thumbs = tab.thumb_layout
+        view_top = canvas.canvasy(0)
+        view_bottom = view_top + max(canvas.winfo_height(), 1)
+        visible = thumbs.visible_range(view_top, view_bottom)
+        wanted = thumbs.visible_range(view_top - PDFTab.THUMBNAIL_MARGIN, view_bottom + PDFTab.THUMBNAIL_MARGIN)
+        
+        for page_num in [page_num for page_num in tab.thumb_images if page_num not in visible]:
+            del tab.thumb_images[page_num]
+            canvas.delete(f"thumb_{page_num}")
+        for page_num in [page_num for page_num in tab.pending_thumbs if page_num not in wanted]:
+            tab.pending_thumbs.pop(page_num).cancel()
+        
+        for page_num in wanted:
+            if tab.thumb_images.get(page_num) is not None:
+                continue
+            if page_num in visible:
+                if page_num not in tab.pending_thumbs:
+                    image = self.cached_thumbnail(tab, page_num)
+                    if image is not None:
+                        self.place_thumbnail(tab, page_num, image)
+                        continue
+                if page_num not in tab.thumb_images:
+                    self.place_thumbnail(tab, page_num, None)
+            elif self.thumbnail_key(tab, page_num) in self.render_cache:
+                continue
+            if page_num in tab.pending_thumbs:
+                continue
+            
+            # Lage prioriteit: na alle pagina renders, dichtst bij de huidige pagina eerst
+            tab.pending_thumbs[page_num] = self.render_service.submit(
+                tab.doc_key, tab.source, tab.password, page_num,
+                thumbs.zoom, thumbs.rotations[page_num],
+                PDFTab.THUMBNAIL_PRIORITY + abs(page_num - tab.current_page),
+                callback=lambda job, t=tab: self.on_thumbnail_rendered(t, job),
+                version=tab.page_versions.get(page_num, 0)
+            )
+        self.mark_current_thumbnail(tab)
+
+    def thumbnail_key(self, tab, page_num):
+        thumbs = tab.thumb_layout
+        return RenderCache.key(tab.doc_key, page_num, thumbs.zoom, thumbs.rotations[page_num], "thumb")
+
+    def cached_thumbnail(self, tab, page_num):
+        """Miniatuur uit de render cache, verkleind van een al gerenderde pagina, of van schijf"""
+        key = self.thumbnail_key(tab, page_num)
+        image = self.render_cache.get(key)
+        if image is not None:
+            return image
+        
+        thumbs = tab.thumb_layout
+        rotation = thumbs.rotations[page_num]
+        page_image = self.render_cache.find_page(tab.doc_key, page_num, rotation)
+        if page_image is not None:
+            image = page_image.resize(thumbs.sizes[page_num], Image.Resampling.BOX)
+        else:
+            disk_key = self.disk_cache_key(tab, page_num, thumbs.zoom, rotation, "thumb")
+            if disk_key and disk_key in self.disk_cache:
+                image = self.disk_cache.get(disk_key)
+        if image is not None:
+            self.render_cache.put(key, image)
+        return image
+
+    def on_thumbnail_rendered(self, tab, job):
+        """Bewaar een gerenderde miniatuur en toon hem als hij in beeld is (main thread)"""
+        page_num = job.page_num
+        if tab.pending_thumbs.get(page_num) is not job:
+            return
+        del tab.pending_thumbs[page_num]
+        
+        if not tab.pdf_document:
+            return
+        if job.error:
+            print(f"Fout bij renderen miniatuur pagina {page_num + 1}: {job.error}")
+            return
+        
+        self.render_cache.put(self.thumbnail_key(tab, page_num), job.image)
+        disk_key = self.disk_cache_key(tab, page_num, job.zoom, job.rotation, "thumb")
+        if disk_key:
+            self.disk_cache.put(disk_key, job.image)
+        if page_num in tab.thumb_images:
+            self.place_thumbnail(tab, page_num, job.image)
+
+    def place_thumbnail(self, tab, page_num, pil_image):
+        """Teken een miniatuur (of een placeholder zolang pil_image None is) met paginanummer"""
+        canvas = tab.thumb_canvas
+        x0, y0, x1, y1 = tab.thumb_layout.page_rect(page_num)
+        canvas.delete(f"thumb_{page_num}")
+        tags = ("thumb", f"thumb_{page_num}")
+        if pil_image is None:
+            tab.thumb_images[page_num] = None
+            canvas.create_rectangle(x0, y0, x1, y1, fill="white", outline=self.theme["TEXT_SECONDARY"], tags=tags)
+        else:
+            photo = ImageTk.PhotoImage(pil_image)
+            tab.thumb_images[page_num] = photo
+            canvas.create_image(x0, y0, anchor="nw", image=photo, tags=tags)
+        canvas.create_text((x0 + x1) / 2, y1 + PageLayout.PAGE_SPACING / 2, text=str(page_num + 1),
+                           font=("Segoe UI", 8), fill=self.theme["TEXT_SECONDARY"], tags=tags)
+        canvas.tag_raise("thumb_current")
+
+    def mark_current_thumbnail(self, tab):
+        """Kader rond de miniatuur van de huidige pagina"""
+        if tab.thumb_layout is None or tab.current_page >= len(tab.thumb_layout):
+            return
+        x0, y0, x1, y1 = tab.thumb_layout.page_rect(tab.current_page)
+        canvas = tab.thumb_canvas
+        if canvas.find_withtag("thumb_current"):
+            canvas.coords("thumb_current", x0 - 3, y0 - 3, x1 + 3, y1 + 3)
+        else:
+            canvas.create_rectangle(x0 - 3, y0 - 3, x1 + 3, y1 + 3, outline=self.theme["ACCENT_COLOR"],
+                                    width=2, tags=("thumb_current",))
+
+    def on_thumbnail_click(self, event, tab):
+        """Spring naar de aangeklikte pagina via de pagina geometrie"""
+        if tab.thumb_layout is None or not len(tab.thumb_layout):
+            return
+        page_num = tab.thumb_layout.page_at(tab.thumb_canvas.canvasy(event.y))
+        tab.current_page = page_num
+        self.scroll_to_page(tab, page_num)
+        self.mark_current_thumbnail(tab)
+        self.update_ui_state()
+
+    def on_thumbnail_wheel(self, event, tab):
+        if event.num == 4 or event.delta > 0:
+            tab.thumb_canvas.yview_scroll(-1, "units")
+        elif event.num == 5 or event.delta < 0:
+            tab.thumb_canvas.yview_scroll(1, "units")
+
     def close_active_tab(self):
         active_tab = self.get_active_tab()
         if isinstance(active_tab, PDFTab):
+            if active_tab.form_flush_after is not None:
+                self.root.after_cancel(active_tab.form_flush_after)
+            if active_tab.search_index:
+                active_tab.search_index.cancel()
+            if active_tab.search_job:
+                active_tab.search_job.cancel()
+            self.render_service.close_document(active_tab.doc_key)
+            self.render_cache.drop_document(active_tab.doc_key)
             active_tab.close_document()
             self.notebook.forget(active_tab)
             if len(self.notebook.tabs()) == 0:
@@ -1071,256 +3062,796 @@ class NVictReader:
     
     def on_resize(self, event, tab):
         if tab.zoom_mode == "fit_width":
-            self.display_page(tab)
+            self.display_page(tab, preview=tab.opening_screen)
 
-    def display_page(self, tab):
+    def display_page(self, tab, preview=None, anchor=None):
+        """Leg alle pagina's opnieuw neer en render de zichtbare.
+        
+        preview: {page_num: PIL image op de oude zoom} die direct geschaald getoond worden als draft.
+        anchor: (page_num, (x, y) in pagina coördinaten) dat op dezelfde plek in de viewport blijft.
+        """
         if not tab or not tab.pdf_document:
             return
 
         # Clear
         tab.canvas.delete("all")
-        tab.text_words = []
+        tab.selection_items = {}
         tab.selected_text = ""
-        
-        # Verwijder oude form widgets
-        for widget in tab.form_widgets:
-            widget.destroy()
-        tab.form_widgets = []
+        tab.page_images = {}
+        tab.page_pil_images = {}
+        
+        # Annuleer renders voor de oude zoom/rotatie (miniaturen worden opnieuw aangevraagd)
+        self.render_service.cancel(tab.doc_key)
+        tab.pending_renders = {}
+        tab.pending_thumbs = {}
+        self.schedule_thumbnail_update(tab)
+        tab.draft_pages = {}
+        tab.page_tiles = {}
+        tab.pending_tiles = {}
+        
+        # Formuliervelden worden per pagina opnieuw getekend, de editor sluit (waarde blijft bewaard)
+        self.deactivate_field(tab)
+        tab.attached_pages = set()
 
+        layout = tab.layout
+        
         # Bereken zoom voor fit_width mode
         if tab.zoom_mode == "fit_width":
-            canvas_width = tab.canvas.winfo_width() - 40
-            page_width = tab.pdf_document[0].bound().width
-            if page_width > 0:
-                tab.zoom_level = canvas_width / page_width
-        
-        # Render ALLE pagina's onder elkaar
-        x_offset = 20  # Links marge
-        y_offset = 20  # Begin positie
-        page_spacing = 20  # Ruimte tussen pagina's
+            zoom = layout.fit_width_zoom(tab.canvas.winfo_width())
+            if zoom is not None:
+                tab.zoom_level = zoom
+        else:
+            tab.zoom_level = quantize_zoom(tab.zoom_level)
         
-        # Houd bij waar elke pagina begint
-        tab.page_positions = []
+        # Herschaal de layout (alleen rekenwerk) en leg placeholders neer
+        layout.set_zoom(tab.zoom_level)
         
-        for page_num in range(len(tab.pdf_document)):
-            page = tab.pdf_document[page_num]
-            
-            # Sla positie op
-            tab.page_positions.append(y_offset)
+        for page_num in range(len(layout)):
+            x0, y0, x1, y1 = layout.page_rect(page_num)
             
-            # Render pagina
-            mat = fitz.Matrix(tab.zoom_level, tab.zoom_level)
-            pix = page.get_pixmap(matrix=mat)
-            
-            img_data = pix.tobytes("ppm")
-            pil_image = Image.open(io.BytesIO(img_data))
-            
-            # Bewaar afbeelding (voor highlights later)
-            if page_num == tab.current_page:
-                tab.current_image = pil_image.copy()
-            
-            # Bewaar alle pagina afbeeldingen voor selectie highlighting
-            if not hasattr(tab, 'page_pil_images'):
-                tab.page_pil_images = {}
-            tab.page_pil_images[page_num] = pil_image.copy()
-            
-            photo = ImageTk.PhotoImage(pil_image)
-            
-            # Sla referentie op zodat garbage collector het niet verwijdert
-            if not hasattr(tab, 'page_images'):
-                tab.page_images = []
-            if len(tab.page_images) <= page_num:
-                tab.page_images.extend([None] * (page_num - len(tab.page_images) + 1))
-            tab.page_images[page_num] = photo
-            
-            # Teken pagina op canvas
-            img_width, img_height = pil_image.size
-            tab.canvas.create_image(x_offset, y_offset, anchor="nw", image=photo, tags=f"page_{page_num}")
+            # Placeholder voor de pagina (wordt vervangen zodra de pagina zichtbaar is)
+            tab.canvas.create_rectangle(
+                x0, y0, x1, y1,
+                fill="white", outline=self.theme["TEXT_SECONDARY"], tags=("placeholder", f"placeholder_{page_num}")
+            )
             
             # Teken pagina nummer
-            page_num_text = f"Pagina {page_num + 1} / {len(tab.pdf_document)}"
+            page_num_text = f"Pagina {page_num + 1} / {len(layout)}"
             tab.canvas.create_text(
-                x_offset + img_width // 2, 
-                y_offset - 5,
+                (x0 + x1) // 2, 
+                y0 - 5,
                 text=page_num_text,
                 font=("Segoe UI", 9),
                 fill=self.theme["TEXT_SECONDARY"]
             )
             
-            # Extract tekst voor deze pagina
-            words = page.get_text("words")
-            for word_info in words:
-                x0, y0, x1, y1, text = word_info[0], word_info[1], word_info[2], word_info[3], word_info[4]
-                sx0 = x0 * tab.zoom_level + x_offset
-                sy0 = y0 * tab.zoom_level + y_offset
-                sx1 = x1 * tab.zoom_level + x_offset
-                sy1 = y1 * tab.zoom_level + y_offset
-                tab.text_words.append((text, sx0, sy0, sx1, sy1))
-            
-            # Toon formuliervelden voor deze pagina
-            self.display_form_fields_for_page(tab, page, page_num, x_offset, y_offset)
-            
             # Teken lichte lijn onder pagina (scheiding)
-            separator_y = y_offset + img_height + page_spacing // 2
+            separator_y = y1 + layout.PAGE_SPACING // 2
             tab.canvas.create_line(
-                x_offset, separator_y,
-                x_offset + img_width, separator_y,
+                x0, separator_y,
+                x1, separator_y,
                 fill=self.theme["TEXT_SECONDARY"], width=1, dash=(2, 4)
             )
-            
-            # Update offset voor volgende pagina
-            y_offset += img_height + page_spacing
         
         # Sla offset info op voor navigatie
-        tab.page_offset_x = x_offset
-        tab.page_offset_y = 20
+        tab.page_offset_x = layout.MARGIN_X
+        tab.page_offset_y = layout.MARGIN_TOP
+        
+        # Scrollregion instellen
+        tab.canvas.configure(scrollregion=(0, 0, layout.max_width, layout.total_height))
         
         # Als we naar een specifieke pagina navigeren, scroll erheen
-        if hasattr(tab, 'scroll_to_page') and tab.scroll_to_page is not None:
+        if anchor is not None:
+            self.scroll_to_anchor(tab, anchor)
+        elif hasattr(tab, 'scroll_to_page') and tab.scroll_to_page is not None:
             self.scroll_to_page(tab, tab.scroll_to_page)
             tab.scroll_to_page = None
         
-        # Scrollregion instellen
-        total_height = y_offset + 20
-        max_width = max([tab.pdf_document[i].bound().width * tab.zoom_level for i in range(len(tab.pdf_document))]) + x_offset * 2
-        tab.canvas.configure(scrollregion=(0, 0, max_width, total_height))
+        # Toon bestaande bitmaps direct geschaald; de scherpe render volgt als de invoer stil ligt
+        if preview:
+            view_top = tab.canvas.canvasy(0)
+            view_bottom = view_top + max(tab.canvas.winfo_height(), 1)
+            for page_num in layout.visible_range(view_top, view_bottom):
+                if page_num in preview and not self.is_tiled_page(tab, page_num):
+                    scaled = preview[page_num].resize(layout.sizes[page_num], Image.Resampling.BILINEAR)
+                    self.show_page_image(tab, page_num, scaled, draft=True)
+        
+        # Render alleen de pagina's die (bijna) zichtbaar zijn
+        self.update_visible_pages(tab)
         
         self.update_ui_state()
 
-    def scroll_to_page(self, tab, page_num):
-        """Scroll naar een specifieke pagina"""
-        if not hasattr(tab, 'page_positions') or page_num >= len(tab.page_positions):
+    def schedule_visible_update(self, tab):
+        """Plan het bijwerken van zichtbare pagina's in (samengevoegd per idle moment)"""
+        if tab._visible_update_pending:
+            return
+        tab._visible_update_pending = True
+        
+        def run():
+            tab._visible_update_pending = False
+            if tab.pdf_document:
+                self.update_visible_pages(tab)
+        
+        tab.after_idle(run)
+        
+        # Scherpe renders pas als het scrollen even stil ligt
+        self.schedule_refine(tab)
+
+    def schedule_refine(self, tab):
+        """(Her)start de wachttijd waarna drafts scherp gerenderd worden"""
+        if tab._refine_after:
+            tab.after_cancel(tab._refine_after)
+        tab._refine_after = tab.after(self.update_settings.get('refine_delay_ms', 150),
+                                      lambda: self.refine_draft_pages(tab))
+
+    def update_visible_pages(self, tab):
+        """Render pagina's binnen viewport + marge en geef verre pagina's weer vrij"""
+        if not tab or not tab.pdf_document or not len(tab.layout):
+            return
+        
+        layout = tab.layout
+        view_top = tab.canvas.canvasy(0)
+        view_height = max(tab.canvas.winfo_height(), 1)
+        view_bottom = view_top + view_height
+        view_center = view_top + view_height / 2
+        
+        # Render binnen de marge, geef pas vrij buiten de dubbele marge (voorkomt heen-en-weer renderen)
+        wanted = layout.visible_range(view_top - tab.render_margin, view_bottom + tab.render_margin)
+        keep = layout.visible_range(view_top - tab.render_margin * 2, view_bottom + tab.render_margin * 2)
+        
+        for page_num in set(tab.page_images) | set(tab.pending_renders) | set(tab.page_tiles):
+            if page_num not in keep:
+                self.release_page(tab, page_num)
+        
+        view_left = tab.canvas.canvasx(0)
+        view = (view_left, view_top, view_left + max(tab.canvas.winfo_width(), 1), view_bottom)
+        
+        for page_num in wanted:
+            if self.is_tiled_page(tab, page_num):
+                # Grote pagina's: alleen de tiles in (en rond) de viewport
+                self.update_page_tiles(tab, page_num, view)
+            elif page_num not in tab.page_images and page_num not in tab.pending_renders:
+                cached = self.render_cache.get(RenderCache.key(
+                    tab.doc_key, page_num, tab.zoom_level, layout.rotations[page_num]))
+                if cached is not None:
+                    self.show_page_image(tab, page_num, cached)
+                    continue
+                
+                # Eerste scherm van een eerder geopend document: van schijf in plaats van MuPDF
+                if self.is_first_screen(tab, page_num):
+                    disk_key = self.disk_cache_key(tab, page_num, tab.zoom_level, layout.rotations[page_num])
+                    stored = self.disk_cache.get(disk_key) if disk_key else None
+                    if stored is not None:
+                        self.render_cache.put(RenderCache.key(
+                            tab.doc_key, page_num, tab.zoom_level, layout.rotations[page_num]), stored)
+                        self.show_page_image(tab, page_num, stored)
+                        continue
+                
+                # Prioriteit: afstand van het midden van de pagina tot het midden van de viewport
+                x0, y0, x1, y1 = layout.page_rect(page_num)
+                self.render_page(tab, page_num, priority=abs((y0 + y1) / 2 - view_center),
+                                 draft=self.update_settings.get('progressive_render', True))
+        
+        # Eerste scherm uit de cache (bijv. van de open thread) ook op schijf bewaren
+        if not tab.screen_saved:
+            self.save_first_screen(tab)
+        
+        # Pagina teller volgt de pagina in het bovenste deel van de viewport (of de laatste aan het eind)
+        if view_bottom >= layout.total_height - 1:
+            current = layout.page_at(view_bottom)
+        else:
+            current = layout.page_at(view_top + view_height / 3)
+        if current != tab.current_page:
+            tab.current_page = current
+            self.mark_current_thumbnail(tab)
+            if tab == self.get_active_tab():
+                self.page_var.set(str(current + 1))
+
+    def render_page(self, tab, page_num, priority=0, draft=False):
+        """Vraag een achtergrond render aan voor één pagina"""
+        job = self.render_service.submit(
+            tab.doc_key, tab.source, tab.password, page_num,
+            tab.zoom_level, tab.layout.rotations[page_num], priority,
+            callback=lambda job, t=tab: self.on_page_rendered(t, job),
+            draft=draft, version=tab.page_versions.get(page_num, 0)
+        )
+        tab.pending_renders[page_num] = job
+
+    def refine_draft_pages(self, tab):
+        """Vervang drafts door scherpe renders zodra het scrollen stil ligt"""
+        tab._refine_after = None
+        if not tab.pdf_document or not tab.draft_pages:
+            return
+        
+        view_center = tab.canvas.canvasy(max(tab.canvas.winfo_height(), 1) / 2)
+        for page_num in list(tab.draft_pages):
+            if page_num in tab.pending_renders:
+                continue
+            x0, y0, x1, y1 = tab.layout.page_rect(page_num)
+            self.render_page(tab, page_num, priority=abs((y0 + y1) / 2 - view_center))
+
+    def on_page_rendered(self, tab, job):
+        """Plaats een gerenderde pagina over de placeholder (main thread)"""
+        page_num = job.page_num
+        if tab.pending_renders.get(page_num) is not job:
+            return
+        del tab.pending_renders[page_num]
+        
+        if not tab.pdf_document:
+            return
+        if job.error:
+            print(f"Fout bij renderen pagina {page_num + 1}: {job.error}")
+            return
+        
+        if not job.draft:
+            self.render_cache.put(RenderCache.key(tab.doc_key, page_num, job.zoom, job.rotation), job.image)
+            if self.is_first_screen(tab, page_num):
+                disk_key = self.disk_cache_key(tab, page_num, job.zoom, job.rotation)
+                if disk_key:
+                    self.disk_cache.put(disk_key, job.image)
+        self.show_page_image(tab, page_num, job.image, draft=job.draft)
+        if not job.draft:
+            self.save_first_screen(tab)
+
+    def is_first_screen(self, tab, page_num):
+        """Pagina's die (deels) in de eerste viewport van het document staan"""
+        return tab.layout.page_rect(page_num)[1] < max(tab.canvas.winfo_height(), 1)
+
+    def disk_cache_key(self, tab, page_num, zoom, rotation, kind="page"):
+        """Sleutel in de schijf cache, of None als de pagina daar niet mag komen"""
+        if tab.password or tab.page_versions.get(page_num, 0):
+            return None  # Beveiligde documenten en gewijzigde pagina's blijven alleen in het geheugen
+        return DiskCache.key(tab.source.fingerprint(), page_num, zoom, rotation, kind)
+
+    def save_first_screen(self, tab):
+        """Bewaar het eerste scherm als één afbeelding, zodat heropenen het toont voordat MuPDF klaar is"""
+        if tab.screen_saved or tab.password or tab.canvas.canvasy(0) > 0:
+            return
+        width = max(tab.canvas.winfo_width(), 1)
+        height = max(tab.canvas.winfo_height(), 1)
+        pages = tab.layout.visible_range(0, height)
+        for page_num in pages:
+            if (page_num not in tab.page_pil_images or page_num in tab.draft_pages
+                    or tab.page_versions.get(page_num, 0)):
+                return
+        
+        tab.screen_saved = True
+        view_left = tab.canvas.canvasx(0)
+        screen = Image.new("RGB", (width, height), self.theme["BG_PRIMARY"])
+        for page_num in pages:
+            x0, y0 = tab.layout.page_rect(page_num)[:2]
+            screen.paste(tab.page_pil_images[page_num], (int(x0 - view_left), int(y0)))
+        self.disk_cache.put(DiskCache.key(tab.source.fingerprint(), 0, 1.0, 0, "screen"), screen, replace=True)
+
+    def show_cached_screen(self, file_path, source):
+        """Toon het bewaarde eerste scherm van een eerder geopend document (None als er geen is)"""
+        try:
+            screen = self.disk_cache.get(DiskCache.key(source.fingerprint(), 0, 1.0, 0, "screen"))
+        except (OSError, ValueError):
+            return None
+        if screen is None:
+            return None
+        
+        if self.welcome_frame.winfo_ismapped():
+            self.notebook.forget(self.welcome_frame)
+        preview = tk.Frame(self.notebook, bg=self.theme["BG_PRIMARY"])
+        photo = ImageTk.PhotoImage(screen)
+        label = tk.Label(preview, image=photo, bg=self.theme["BG_PRIMARY"], anchor="nw", bd=0)
+        label.image = photo  # Referentie houden
+        label.pack(fill=tk.BOTH, expand=True)
+        self.notebook.add(preview, text=os.path.basename(file_path), padding=5)
+        self.notebook.select(preview)
+        return preview
+
+    def show_page_image(self, tab, page_num, pil_image, draft=False):
+        """Toon een (draft of scherpe) bitmap van een pagina op het canvas"""
+        x_offset, y_offset = tab.layout.page_rect(page_num)[:2]
+        if tab.first_page_ms is None:
+            self.record_first_page(tab)
+        
+        if draft:
+            tab.draft_pages[page_num] = time.perf_counter()
+            if not tab._refine_after:
+                self.schedule_refine(tab)
+        elif page_num in tab.draft_pages:
+            # Meet hoe lang de draft zichtbaar was voordat de scherpe versie klaar was
+            self.render_service.record_refine_latency(time.perf_counter() - tab.draft_pages.pop(page_num))
+        if not draft:
+            tab.opening_screen = None
+        
+        # Bewaar pagina afbeelding (zoom previews en het eerste scherm), gedeeld met de render cache
+        tab.page_pil_images[page_num] = pil_image
+        
+        # Sla referentie op zodat garbage collector het niet verwijdert
+        photo = ImageTk.PhotoImage(pil_image)
+        tab.page_images[page_num] = photo
+        
+        # Teken pagina op canvas (boven de placeholder, vervangt een eventuele draft)
+        tab.canvas.delete(f"page_{page_num}")
+        tab.canvas.create_image(x_offset, y_offset, anchor="nw", image=photo, tags=("page", f"page_{page_num}"))
+        tab.canvas.tag_raise(f"page_{page_num}", f"placeholder_{page_num}")
+        tab.canvas.tag_raise("overlay")
+        
+        if page_num not in tab.attached_pages:
+            self.attach_page_content(tab, page_num)
+
+    def attach_page_content(self, tab, page_num):
+        """Voeg formuliervelden en zoekresultaten toe voor een pagina die in beeld komt"""
+        tab.attached_pages.add(page_num)
+        
+        # Toon formuliervelden voor deze pagina
+        self.display_form_fields_for_page(tab, page_num)
+        
+        # Zoekresultaten die op deze pagina wachtten
+        if page_num in tab.search_hits:
+            self.draw_search_highlights(tab, page_num)
+
+    def is_tiled_page(self, tab, page_num):
+        """Pagina's die op de huidige zoom te groot zijn voor één bitmap worden in tiles gerenderd"""
+        width, height = tab.layout.sizes[page_num]
+        return width * height > PDFTab.TILE_THRESHOLD_PIXELS
+
+    def update_page_tiles(self, tab, page_num, view):
+        """Render de tiles van een grote pagina die de viewport (plus één tile marge) raken"""
+        size = PDFTab.TILE_SIZE
+        x0, y0, x1, y1 = tab.layout.page_rect(page_num)
+        columns = math.ceil((x1 - x0) / size)
+        rows = math.ceil((y1 - y0) / size)
+        view_left, view_top, view_right, view_bottom = view
+        view_center = ((view_left + view_right) / 2, (view_top + view_bottom) / 2)
+        
+        def tile_range(low, high, origin, count):
+            first = max(0, int((low - origin) // size))
+            last = min(count - 1, int((high - origin) // size))
+            return range(first, last + 1)
+        
+        def tiles_within(margin):
+            return {(column, row)
+                    for column in tile_range(view_left - margin, view_right + margin, x0, columns)
+                    for row in tile_range(view_top - margin, view_bottom + margin, y0, rows)}
+        
+        wanted = tiles_within(size)
+        keep = tiles_within(size * 2)
+        tiles = tab.page_tiles.setdefault(page_num, {})
+        
+        # Tiles ver buiten beeld vrijgeven
+        for tile in [tile for tile in tiles if tile not in keep]:
+            del tiles[tile]
+            tab.canvas.delete(f"tile_{page_num}_{tile[0]}_{tile[1]}")
+        for key in [key for key in tab.pending_tiles if key[0] == page_num and key[1:] not in keep]:
+            tab.pending_tiles.pop(key).cancel()
+        
+        for column, row in wanted:
+            if (column, row) in tiles or (page_num, column, row) in tab.pending_tiles:
+                continue
+            
+            cached = self.render_cache.get(RenderCache.key(
+                tab.doc_key, page_num, tab.zoom_level, tab.layout.rotations[page_num], ("tile", column, row)))
+            if cached is not None:
+                self.place_tile(tab, page_num, (column, row), cached)
+                continue
+            
+            # Clip in pagina coördinaten (pixels / zoom)
+            px0, py0 = column * size, row * size
+            px1, py1 = min(px0 + size, x1 - x0), min(py0 + size, y1 - y0)
+            clip = fitz.Rect(px0, py0, px1, py1) / tab.zoom_level
+            
+            center_x, center_y = x0 + (px0 + px1) / 2, y0 + (py0 + py1) / 2
+            priority = abs(center_x - view_center[0]) + abs(center_y - view_center[1])
+            tab.pending_tiles[(page_num, column, row)] = self.render_service.submit(
+                tab.doc_key, tab.source, tab.password, page_num,
+                tab.zoom_level, tab.layout.rotations[page_num], priority,
+                callback=lambda job, t=tab: self.on_tile_rendered(t, job),
+                clip=clip, tile=(column, row), version=tab.page_versions.get(page_num, 0)
+            )
+
+    def on_tile_rendered(self, tab, job):
+        """Sla een gerenderde tile op in de cache en plaats hem op het canvas (main thread)"""
+        key = (job.page_num,) + job.tile
+        if tab.pending_tiles.get(key) is not job:
+            return
+        del tab.pending_tiles[key]
+        
+        if not tab.pdf_document:
+            return
+        if job.error:
+            print(f"Fout bij renderen tile {job.tile} van pagina {job.page_num + 1}: {job.error}")
+            return
+        
+        self.render_cache.put(RenderCache.key(tab.doc_key, job.page_num, job.zoom, job.rotation, ("tile",) + job.tile),
+                              job.image)
+        
+        self.place_tile(tab, job.page_num, job.tile, job.image)
+
+    def place_tile(self, tab, page_num, tile, pil_image):
+        """Plaats één tile als losse canvas afbeelding"""
+        size = PDFTab.TILE_SIZE
+        x0, y0 = tab.layout.page_rect(page_num)[:2]
+        photo = ImageTk.PhotoImage(pil_image)
+        tab.page_tiles.setdefault(page_num, {})[tile] = photo
+        if tab.first_page_ms is None:
+            self.record_first_page(tab)
+        
+        tab.canvas.create_image(x0 + tile[0] * size, y0 + tile[1] * size, anchor="nw", image=photo,
+                                tags=("page", f"page_{page_num}", f"tile_{page_num}_{tile[0]}_{tile[1]}"))
+        tab.canvas.tag_raise(f"page_{page_num}", f"placeholder_{page_num}")
+        tab.canvas.tag_raise("overlay")
+        
+        if page_num not in tab.attached_pages:
+            self.attach_page_content(tab, page_num)
+
+    def record_first_page(self, tab):
+        """Leg de tijd vast van openen tot de eerste zichtbare pagina"""
+        tab.first_page_ms = (time.perf_counter() - tab.open_started) * 1000
+        self.first_page_times.append(tab.first_page_ms)
+        self.status_label.config(
+            text=f"Geopend: {os.path.basename(tab.file_path)} (eerste pagina na {tab.first_page_ms:.0f} ms)"
+        )
+        # Pas nu de zoekindex opbouwen, zodat hij niet met de eerste render concurreert
+        self.start_search_index(tab)
+
+    def release_page(self, tab, page_num):
+        """Geef bitmap, tekst en form widgets van een pagina buiten beeld vrij"""
+        job = tab.pending_renders.pop(page_num, None)
+        if job:
+            job.cancel()
+        for key in [key for key in tab.pending_tiles if key[0] == page_num]:
+            tab.pending_tiles.pop(key).cancel()
+        tab.page_tiles.pop(page_num, None)
+        tab.draft_pages.pop(page_num, None)
+        
+        tab.canvas.delete(f"page_{page_num}")
+        tab.page_images.pop(page_num, None)
+        tab.page_pil_images.pop(page_num, None)
+        
+        # Formuliervelden zijn canvas items; een open editor op deze pagina sluit
+        if tab.active_field and tab.active_field.page_num == page_num:
+            self.deactivate_field(tab)
+        tab.canvas.delete(f"form_{page_num}")
+        tab.attached_pages.discard(page_num)
+
+    def scroll_to_anchor(self, tab, anchor):
+        """Scroll zodat een punt op een pagina (pagina coördinaten) midden in de viewport staat"""
+        layout = tab.layout
+        page_num, (point_x, point_y) = anchor
+        if page_num >= len(layout):
+            return
+        
+        x = layout.MARGIN_X + point_x * layout.zoom
+        y = layout.page_top(page_num) + point_y * layout.zoom
+        view_width = max(tab.canvas.winfo_width(), 1)
+        view_height = max(tab.canvas.winfo_height(), 1)
+        tab.canvas.xview_moveto(max(0.0, (x - view_width / 2) / layout.max_width))
+        tab.canvas.yview_moveto(max(0.0, (y - view_height / 2) / layout.total_height))
+
+    def scroll_to_page(self, tab, page_num):
+        """Scroll naar een specifieke pagina"""
+        layout = tab.layout
+        if page_num >= len(layout):
+            return
+        
+        y_pos = layout.page_top(page_num)
+        
+        # Scroll canvas naar deze positie
+        total_height = layout.total_height
+        canvas_height = tab.canvas.winfo_height()
+        
+        if total_height > canvas_height:
+            # Bereken fractie voor scrollpositie (0.0 - 1.0)
+            fraction = y_pos / total_height
+            tab.canvas.yview_moveto(fraction)
+
+    def get_page_fields(self, tab, page_num):
+        """Formuliervelden van een pagina (eenmalig gelezen, in pagina coördinaten)"""
+        fields = tab.page_fields.get(page_num)
+        if fields is not None:
+            return fields
+        
+        fields = []
+        try:
+            page = tab.pdf_document[page_num]
+            matrix = page.rotation_matrix if page.rotation else None
+            for widget in page.widgets():
+                if widget.field_type not in FormField.EDITABLE_TYPES:
+                    continue
+                rect = widget.rect * matrix if matrix is not None else widget.rect
+                fields.append(FormField(page_num, len(fields), widget.xref, widget.field_name,
+                                        widget.field_type, rect, widget.field_value,
+                                        getattr(widget, 'choice_values', None)))
+        except Exception as e:
+            print(f"Fout bij lezen formuliervelden op pagina {page_num + 1}: {e}")
+        tab.page_fields[page_num] = fields
+        return fields
+
+    def get_field_value(self, tab, field):
+        return tab.form_data.get(field.name, field.value)
+
+    def field_bounds(self, tab, field):
+        """Canvas rechthoek van een formulierveld op de huidige zoom"""
+        x_offset, y_offset = tab.layout.page_rect(field.page_num)[:2]
+        zoom = tab.zoom_level
+        rect = field.rect
+        return (x_offset + rect.x0 * zoom, y_offset + rect.y0 * zoom,
+                x_offset + rect.x1 * zoom, y_offset + rect.y1 * zoom)
+
+    def display_form_fields_for_page(self, tab, page_num):
+        """Toon formuliervelden voor een specifieke pagina (als canvas items, zonder Tk widgets)"""
+        for field in self.get_page_fields(tab, page_num):
+            self.draw_form_field(tab, field)
+
+    def draw_form_field(self, tab, field):
+        """Teken één veld met zijn huidige waarde boven de pagina bitmap"""
+        tag = f"field_{field.page_num}_{field.index}"
+        tab.canvas.delete(tag)
+        tags = ("form", f"form_{field.page_num}", tag)
+        
+        x0, y0, x1, y1 = self.field_bounds(tab, field)
+        height = y1 - y0
+        font = ("Arial", max(8, int(height * 0.6)))
+        value = self.get_field_value(tab, field)
+        
+        tab.canvas.create_rectangle(x0, y0, x1, y1, fill="white", outline="#7a7a7a", tags=tags)
+        if field.field_type == fitz.PDF_WIDGET_TYPE_CHECKBOX:
+            if FormField.is_checked(value):
+                tab.canvas.create_text((x0 + x1) / 2, (y0 + y1) / 2, text="✔", font=font,
+                                       fill="black", tags=tags)
+        else:
+            tab.canvas.create_text(x0 + 3, (y0 + y1) / 2, anchor="w", text=str(value or ""),
+                                   font=font, fill="black", tags=tags)
+            if field.field_type == fitz.PDF_WIDGET_TYPE_COMBOBOX:
+                tab.canvas.create_text(x1 - 3, (y0 + y1) / 2, anchor="e", text="▾",
+                                       font=font, fill="#555555", tags=tags)
+
+    def field_at(self, tab, x, y):
+        """Formulierveld onder een canvas punt, of None"""
+        page_num = tab.layout.page_at(y)
+        if page_num not in tab.attached_pages:
+            return None
+        for field in tab.page_fields.get(page_num, []):
+            x0, y0, x1, y1 = self.field_bounds(tab, field)
+            if x0 <= x <= x1 and y0 <= y <= y1:
+                return field
+        return None
+
+    def get_field_order(self, tab):
+        """Tab volgorde: per pagina van boven naar beneden, links naar rechts (eenmalig berekend)"""
+        if tab.field_order is None:
+            order = []
+            for page_num in range(len(tab.pdf_document)):
+                fields = sorted(self.get_page_fields(tab, page_num),
+                                key=lambda f: (round(f.rect.y0), f.rect.x0))
+                order.extend((field.page_num, field.index) for field in fields)
+            tab.field_order = order
+            tab.field_positions = {key: position for position, key in enumerate(order)}
+        return tab.field_order
+
+    def form_editor(self, tab, field_type):
+        """De gedeelde editor widget voor een veldtype (eenmalig per tab aangemaakt)"""
+        if field_type == fitz.PDF_WIDGET_TYPE_COMBOBOX:
+            if tab.form_combo is None:
+                tab.form_combo = ttk.Combobox(tab.canvas, state="readonly")
+                tab.form_combo.bind("<<ComboboxSelected>>", lambda e: self.commit_editor(tab))
+                self.bind_form_editor(tab, tab.form_combo)
+            return tab.form_combo
+        
+        if tab.form_entry is None:
+            tab.form_entry = tk.Entry(tab.canvas, bg="white", fg="black", relief="solid", bd=1)
+            self.bind_form_editor(tab, tab.form_entry)
+        return tab.form_entry
+
+    def bind_form_editor(self, tab, editor):
+        editor.bind("<Tab>", lambda e: self.focus_next_field(tab, 1))
+        editor.bind("<Shift-Tab>", lambda e: self.focus_next_field(tab, -1))
+        editor.bind("<ISO_Left_Tab>", lambda e: self.focus_next_field(tab, -1))
+        editor.bind("<Return>", lambda e: self.deactivate_field(tab))
+        editor.bind("<Escape>", lambda e: self.deactivate_field(tab, commit=False))
+        editor.bind("<FocusOut>", lambda e: self.commit_editor(tab), add="+")
+
+    def activate_field(self, tab, field):
+        """Geef een veld focus: checkboxen wisselen direct, andere velden krijgen de editor"""
+        self.deactivate_field(tab)
+        tab.active_field = field
+        bounds = self.field_bounds(tab, field)
+        x0, y0, x1, y1 = bounds
+        
+        if field.field_type == fitz.PDF_WIDGET_TYPE_CHECKBOX:
+            tab.canvas.focus_set()
+            self.set_field_value(tab, field, not FormField.is_checked(self.get_field_value(tab, field)))
+        else:
+            editor = self.form_editor(tab, field.field_type)
+            value = str(self.get_field_value(tab, field) or "")
+            if field.field_type == fitz.PDF_WIDGET_TYPE_COMBOBOX:
+                editor.configure(values=field.choices, font=("Arial", max(8, int((y1 - y0) * 0.6))))
+                editor.set(value)
+            else:
+                editor.configure(font=("Arial", max(8, int((y1 - y0) * 0.6))))
+                editor.delete(0, tk.END)
+                editor.insert(0, value)
+                editor.select_range(0, tk.END)
+            tab.editor_field = field
+            tab.canvas.create_window(x0, y0, anchor="nw", window=editor,
+                                     width=x1 - x0, height=y1 - y0, tags="form_editor")
+            editor.focus_set()
+        
+        self.draw_form_focus(tab, bounds)
+
+    def commit_editor(self, tab):
+        """Neem de waarde uit de editor over in het veld dat bewerkt wordt"""
+        field = tab.editor_field
+        if field is None:
+            return
+        editor = self.form_editor(tab, field.field_type)
+        value = editor.get()
+        if value != str(self.get_field_value(tab, field) or ""):
+            self.set_field_value(tab, field, value)
+
+    def deactivate_field(self, tab, commit=True):
+        """Sluit de editor en verwijder de focus markering"""
+        if commit:
+            self.commit_editor(tab)
+        tab.editor_field = None
+        tab.active_field = None
+        tab.canvas.delete("form_editor")
+        tab.canvas.delete("form_focus_overlay")
+        return "break"
+
+    def set_field_value(self, tab, field, value):
+        """Sla een nieuwe veldwaarde op; het document wordt later in één batch bijgewerkt"""
+        tab.form_data[field.name] = value
+        tab.dirty_fields.add(field.name)
+        self.schedule_form_flush(tab)
+        
+        # Velden met dezelfde naam (op zichtbare pagina's) tonen dezelfde waarde
+        for page_num in tab.attached_pages:
+            for other in tab.page_fields.get(page_num, []):
+                if other.name == field.name:
+                    self.draw_form_field(tab, other)
+        tab.canvas.tag_raise("overlay")
+
+    def schedule_form_flush(self, tab):
+        """Plan een batch write-back zodra de gebruiker even niets wijzigt"""
+        if tab.form_flush_after is not None:
+            self.root.after_cancel(tab.form_flush_after)
+        tab.form_flush_after = self.root.after(PDFTab.FORM_FLUSH_DELAY_MS, lambda: self.flush_form_data(tab))
+
+    def flush_form_data(self, tab):
+        """Schrijf alle gewijzigde velden in één keer naar de MuPDF widgets"""
+        if tab.form_flush_after is not None:
+            self.root.after_cancel(tab.form_flush_after)
+            tab.form_flush_after = None
+        self.commit_editor(tab)
+        if not tab.dirty_fields or not tab.pdf_document:
             return
         
-        y_pos = tab.page_positions[page_num]
-        
-        # Scroll canvas naar deze positie
-        total_height = int(tab.canvas.cget("scrollregion").split()[3])
-        canvas_height = tab.canvas.winfo_height()
+        # Groepeer per pagina via de veldindex (geen scan over alle widgets)
+        index = self.get_field_index(tab)
+        by_page = {}
+        for name in tab.dirty_fields:
+            for page_num, xref, field_type in index.get(name, []):
+                by_page.setdefault(page_num, []).append((name, xref))
+        tab.dirty_fields = set()
         
-        if total_height > canvas_height:
-            # Bereken fractie voor scrollpositie (0.0 - 1.0)
-            fraction = y_pos / total_height
-            tab.canvas.yview_moveto(fraction)
+        for page_num, entries in sorted(by_page.items()):
+            page = tab.pdf_document[page_num]
+            for name, xref in entries:
+                try:
+                    widget = page.load_widget(xref)
+                    widget.field_value = tab.form_data[name]
+                    widget.update()  # Appearance stream één keer per veld per batch
+                except Exception as e:
+                    print(f"Fout bij bijwerken formulierveld '{name}': {e}")
 
-    def display_form_fields_for_page(self, tab, page, page_num, x_offset, y_offset):
-        """Toon formuliervelden voor een specifieke pagina"""
-        try:
-            widgets = list(page.widgets())
-            
-            if not widgets:
-                return
-            
-            for widget in widgets:
-                field_type = widget.field_type
-                field_name = widget.field_name
-                rect = widget.rect
-                
-                # Schaal en positioneer het veld (relatief aan pagina positie)
-                x0 = rect.x0 * tab.zoom_level + x_offset
-                y0 = rect.y0 * tab.zoom_level + y_offset
-                x1 = rect.x1 * tab.zoom_level + x_offset
-                y1 = rect.y1 * tab.zoom_level + y_offset
-                
-                width = x1 - x0
-                height = y1 - y0
-                
-                # Maak field widgets (zelfde als voorheen)
-                if field_type == fitz.PDF_WIDGET_TYPE_TEXT:
-                    current_value = widget.field_value or ""
-                    if field_name in tab.form_data:
-                        current_value = tab.form_data[field_name]
-                    
-                    var = tk.StringVar(value=current_value)
-                    entry = tk.Entry(tab.canvas, textvariable=var,
-                                    font=("Arial", max(8, int(height * 0.6))),
-                                    bg="white", fg="black", relief="solid", bd=1)
-                    
-                    def save_value(name=field_name, variable=var, w=widget):
-                        tab.form_data[name] = variable.get()
-                        w.field_value = variable.get()
-                        w.update()
-                    
-                    var.trace('w', lambda *args, sv=save_value: sv())
-                    
-                    window = tab.canvas.create_window(x0, y0, anchor="nw", 
-                                                     window=entry, width=width, height=height)
-                    tab.form_widgets.append(entry)
-                
-                elif field_type == fitz.PDF_WIDGET_TYPE_CHECKBOX:
-                    current_value = widget.field_value
-                    if field_name in tab.form_data:
-                        current_value = tab.form_data[field_name]
-                    
-                    var = tk.BooleanVar(value=bool(current_value))
-                    
-                    checkbox = tk.Checkbutton(tab.canvas, variable=var,
-                                             bg=self.theme["BG_PRIMARY"],
-                                             activebackground=self.theme["BG_PRIMARY"],
-                                             selectcolor="white")
-                    
-                    def save_checkbox(name=field_name, variable=var, w=widget):
-                        tab.form_data[name] = variable.get()
-                        w.field_value = variable.get()
-                        w.update()
-                    
-                    var.trace('w', lambda *args, sc=save_checkbox: sc())
-                    
-                    window = tab.canvas.create_window(x0, y0, anchor="nw",
-                                                     window=checkbox, width=width, height=height)
-                    tab.form_widgets.append(checkbox)
-                
-                elif field_type == fitz.PDF_WIDGET_TYPE_COMBOBOX:
-                    current_value = widget.field_value or ""
-                    if field_name in tab.form_data:
-                        current_value = tab.form_data[field_name]
-                    
-                    choices = widget.choice_values if hasattr(widget, 'choice_values') else []
-                    
-                    var = tk.StringVar(value=current_value)
-                    combo = ttk.Combobox(tab.canvas, textvariable=var, values=choices,
-                                        font=("Arial", max(8, int(height * 0.6))),
-                                        state="readonly")
-                    
-                    def save_combo(name=field_name, variable=var, w=widget):
-                        tab.form_data[name] = variable.get()
-                        w.field_value = variable.get()
-                        w.update()
-                    
-                    var.trace('w', lambda *args, sco=save_combo: sco())
-                    
-                    window = tab.canvas.create_window(x0, y0, anchor="nw",
-                                                     window=combo, width=width, height=height)
-                    tab.form_widgets.append(combo)
-                    
-        except Exception as e:
-            print(f"Fout bij tonen formuliervelden op pagina {page_num + 1}: {e}")
+    def get_field_index(self, tab):
+        """Index van veldnaam naar (pagina, xref, type), eenmalig opgebouwd per document"""
+        if tab.field_index is None:
+            index = {}
+            for page_num in range(len(tab.pdf_document)):
+                for field in self.get_page_fields(tab, page_num):
+                    index.setdefault(field.name, []).append((page_num, field.xref, field.field_type))
+            tab.field_index = index
+        return tab.field_index
+
+    def apply_form_values(self, tab, values):
+        """Neem een set veldwaarden in één keer over; geeft (toegepast, onbekend) terug"""
+        index = self.get_field_index(tab)
+        applied = 0
+        unknown = 0
+        for name, value in values.items():
+            entries = index.get(name)
+            if not entries:
+                unknown += 1
+                continue
+            if entries[0][2] == fitz.PDF_WIDGET_TYPE_CHECKBOX:
+                value = FormField.is_checked(value)
+            else:
+                value = "" if value is None else str(value)
+            tab.form_data[name] = value
+            tab.dirty_fields.add(name)
+            applied += 1
+        
+        if applied:
+            for page_num in tab.attached_pages:
+                self.display_form_fields_for_page(tab, page_num)
+            tab.canvas.tag_raise("overlay")
+            self.schedule_form_flush(tab)
+        return applied, unknown
+
+    def harvest_form_values(self, tab):
+        """Alle veldwaarden van het document ({naam: waarde}), inclusief niet opgeslagen wijzigingen"""
+        self.commit_editor(tab)
+        values = {}
+        for page_num in range(len(tab.pdf_document)):
+            for field in self.get_page_fields(tab, page_num):
+                if field.name in values:
+                    continue
+                value = self.get_field_value(tab, field)
+                if field.field_type == fitz.PDF_WIDGET_TYPE_CHECKBOX:
+                    value = FormField.is_checked(value)
+                values[field.name] = "" if value is None else value
+        return values
+
+    def focus_next_field(self, tab, step):
+        """Tab/Shift+Tab: ga naar het volgende of vorige veld in de vooraf berekende volgorde"""
+        order = self.get_field_order(tab)
+        if not order:
+            return "break"
+        
+        current = tab.active_field
+        if current is None:
+            position = -1 if step > 0 else 0
+        else:
+            position = tab.field_positions.get((current.page_num, current.index), -1)
+        page_num, index = order[(position + step) % len(order)]
+        field = tab.page_fields[page_num][index]
+        
+        # Scroll het veld in beeld als het buiten de viewport ligt
+        x0, y0, x1, y1 = self.field_bounds(tab, field)
+        view_top = tab.canvas.canvasy(0)
+        view_bottom = view_top + tab.canvas.winfo_height()
+        if y0 < view_top or y1 > view_bottom:
+            tab.canvas.yview_moveto(max(0, y0 - 60) / max(1, tab.layout.total_height))
+            self.update_visible_pages(tab)
+        
+        self.activate_field(tab, field)
+        return "break"
+
+    def toggle_active_checkbox(self, tab):
+        field = tab.active_field
+        if field and field.field_type == fitz.PDF_WIDGET_TYPE_CHECKBOX:
+            self.set_field_value(tab, field, not FormField.is_checked(self.get_field_value(tab, field)))
+            return "break"
+
+    def draw_form_focus(self, tab, bounds):
+        """Markeer het formulierveld met focus zonder de pagina opnieuw te renderen"""
+        tab.canvas.delete("form_focus_overlay")
+        x0, y0, x1, y1 = bounds
+        tab.canvas.create_rectangle(
+            x0 - 2, y0 - 2, x1 + 2, y1 + 2,
+            outline=self.theme["ACCENT_COLOR"], width=2,
+            tags=("overlay", "form_focus_overlay")
+        )
 
     def on_click(self, event, tab):
         # Clear oude selectie
         tab.selected_text = ""
+        tab.search_hits = {}
         
         x = tab.canvas.canvasx(event.x)
         y = tab.canvas.canvasy(event.y)
+        
+        # Klik op een formulierveld opent de editor in plaats van een selectie
+        field = self.field_at(tab, x, y)
+        if field:
+            tab.drag_start = None
+            self.activate_field(tab, field)
+            return
+        self.deactivate_field(tab)
         tab.drag_start = (x, y)
         
-        # Herstel alle originele pagina afbeeldingen (verwijder highlighting)
-        if hasattr(tab, 'page_pil_images') and hasattr(tab, 'page_positions'):
-            for page_num in tab.page_pil_images.keys():
-                original_image = tab.page_pil_images[page_num]
-                photo = ImageTk.PhotoImage(original_image)
-                
-                # Bewaar photo reference
-                if len(tab.page_images) > page_num:
-                    tab.page_images[page_num] = photo
-                
-                # Update de afbeelding op canvas
-                page_y_offset = tab.page_positions[page_num]
-                page_x_offset = tab.page_offset_x
-                
-                tab.canvas.delete(f"page_{page_num}")
-                tab.canvas.create_image(page_x_offset, page_y_offset, 
-                                       anchor="nw", image=photo, tags=f"page_{page_num}")
+        # Verwijder highlighting (alleen overlay items, de pagina bitmaps blijven onaangeroerd)
+        tab.canvas.delete("selection_overlay")
+        tab.selection_items = {}
+        tab.canvas.delete("search_overlay")
         
         # Teken drag rectangle
         if tab.drag_rect:
@@ -1331,6 +3862,43 @@ class NVictReader:
         
         self.status_label.config(text="Selecteren...")
 
+    def words_in_selection(self, tab, left, top, right, bottom):
+        """Woorden onder een canvas rechthoek, in canvas coördinaten"""
+        zoom = tab.zoom_level
+        selected_words = []
+        for page_num in tab.layout.visible_range(top, bottom):
+            x_offset, y_offset = tab.layout.page_rect(page_num)[:2]
+            words = tab.text_layer.words_in_rect(
+                page_num, (left - x_offset) / zoom, (top - y_offset) / zoom,
+                (right - x_offset) / zoom, (bottom - y_offset) / zoom
+            )
+            selected_words.extend(
+                (text, x0 * zoom + x_offset, y0 * zoom + y_offset, x1 * zoom + x_offset, y1 * zoom + y_offset)
+                for text, x0, y0, x1, y1 in words
+            )
+        return selected_words
+
+    def draw_selection_overlay(self, tab, words):
+        """Werk selectie highlights bij: alleen het verschil met de vorige selectie wordt getekend"""
+        current = tab.selection_items
+        wanted = set(words)
+        for word in [word for word in current if word not in wanted]:
+            tab.canvas.delete(current.pop(word))
+        for word in wanted:
+            if word not in current:
+                text, wx0, wy0, wx1, wy1 = word
+                current[word] = tab.canvas.create_rectangle(
+                    wx0, wy0, wx1, wy1,
+                    fill=self.theme["SELECTION_COLOR"], stipple="gray50",
+                    outline="#FFA500", width=1,
+                    tags=("overlay", "selection_overlay")
+                )
+
+    def selection_bounds(self, tab, x, y):
+        """(left, top, right, bottom) van de sleep rechthoek tot (x, y)"""
+        x1, y1 = tab.drag_start
+        return (min(x1, x), min(y1, y), max(x1, x), max(y1, y))
+
     def on_drag(self, event, tab):
         if not tab.drag_start:
             return
@@ -1340,6 +3908,21 @@ class NVictReader:
         
         if tab.drag_rect:
             tab.canvas.coords(tab.drag_rect, tab.drag_start[0], tab.drag_start[1], x, y)
+        
+        # Woorden pas bij het volgende frame bijwerken, tussenliggende bewegingen vervallen
+        tab.drag_pointer = (x, y)
+        if tab.selection_after is None:
+            tab.selection_after = self.root.after(PDFTab.SELECTION_FRAME_MS,
+                                                  lambda: self.update_selection_preview(tab))
+
+    def update_selection_preview(self, tab):
+        """Toon de woorden onder de sleep rechthoek terwijl de gebruiker nog sleept"""
+        tab.selection_after = None
+        if not tab.drag_start or not tab.drag_pointer:
+            return
+        words = self.words_in_selection(tab, *self.selection_bounds(tab, *tab.drag_pointer))
+        self.draw_selection_overlay(tab, words)
+        self.status_label.config(text=f"Selecteren... {len(words)} woorden")
 
     def on_release(self, event, tab):
         if not tab.drag_start:
@@ -1353,101 +3936,22 @@ class NVictReader:
             tab.canvas.delete(tab.drag_rect)
             tab.drag_rect = None
         
-        # Selection bounds
-        x1, y1 = tab.drag_start
-        x2, y2 = x, y
-        
-        left = min(x1, x2)
-        right = max(x1, x2)
-        top = min(y1, y2)
-        bottom = max(y1, y2)
-        
-        # Detecteer op welke pagina(s) de selectie zich bevindt
-        selected_pages = set()
-        for word_data in tab.text_words:
-            text, wx0, wy0, wx1, wy1 = word_data
-            if not (wx1 < left or wx0 > right or wy1 < top or wy0 > bottom):
-                # Bepaal pagina nummer op basis van Y-positie
-                for page_num, page_y_pos in enumerate(tab.page_positions):
-                    if page_num + 1 < len(tab.page_positions):
-                        next_page_y = tab.page_positions[page_num + 1]
-                        if page_y_pos <= wy0 < next_page_y:
-                            selected_pages.add(page_num)
-                            break
-                    else:
-                        # Laatste pagina
-                        if wy0 >= page_y_pos:
-                            selected_pages.add(page_num)
-                            break
+        # Geplande preview is niet meer nodig, de definitieve selectie volgt hieronder
+        if tab.selection_after is not None:
+            self.root.after_cancel(tab.selection_after)
+            tab.selection_after = None
+        tab.drag_pointer = None
         
-        # Vind geselecteerde woorden
-        selected_words = []
-        for word_data in tab.text_words:
-            text, wx0, wy0, wx1, wy1 = word_data
-            if not (wx1 < left or wx0 > right or wy1 < top or wy0 > bottom):
-                selected_words.append(word_data)
+        # Vind geselecteerde woorden: alleen pagina's en grid cellen onder de selectie
+        selected_words = self.words_in_selection(tab, *self.selection_bounds(tab, x, y))
+        
+        # Highlight de geselecteerde woorden in de overlay laag (alleen het verschil met de preview)
+        self.draw_selection_overlay(tab, selected_words)
         
         if len(selected_words) > 0:
             # Sorteer woorden
             selected_words.sort(key=lambda w: (w[2], w[1]))
             
-            # Voor elke geselecteerde pagina, maak een highlighted versie
-            for page_num in selected_pages:
-                if not hasattr(tab, 'page_pil_images') or page_num not in tab.page_pil_images:
-                    continue
-                
-                # Haal de originele afbeelding van deze pagina op
-                original_image = tab.page_pil_images[page_num].copy()
-                highlighted = original_image.copy()
-                draw = ImageDraw.Draw(highlighted, 'RGBA')
-                
-                # Bepaal offset voor deze pagina
-                page_y_offset = tab.page_positions[page_num]
-                page_x_offset = tab.page_offset_x
-                
-                # Teken highlights alleen voor woorden op deze pagina
-                for word_data in selected_words:
-                    text, wx0, wy0, wx1, wy1 = word_data
-                    
-                    # Check of dit woord op deze pagina is
-                    word_on_this_page = False
-                    if page_num + 1 < len(tab.page_positions):
-                        next_page_y = tab.page_positions[page_num + 1]
-                        if page_y_offset <= wy0 < next_page_y:
-                            word_on_this_page = True
-                    else:
-                        if wy0 >= page_y_offset:
-                            word_on_this_page = True
-                    
-                    if not word_on_this_page:
-                        continue
-                    
-                    # Bereken positie relatief aan deze specifieke pagina afbeelding
-                    rel_x0 = wx0 - page_x_offset
-                    rel_y0 = wy0 - page_y_offset
-                    rel_x1 = wx1 - page_x_offset
-                    rel_y1 = wy1 - page_y_offset
-                    
-                    # Teken semi-transparante gele rechthoek
-                    draw.rectangle(
-                        [rel_x0, rel_y0, rel_x1, rel_y1],
-                        fill=(255, 215, 0, 100),  # Goud met 100/255 opacity
-                        outline=(255, 165, 0, 200),  # Oranje rand
-                        width=2
-                    )
-                
-                # Update canvas met gehighlighte afbeelding voor deze pagina
-                photo = ImageTk.PhotoImage(highlighted)
-                
-                # Bewaar de photo reference
-                if len(tab.page_images) > page_num:
-                    tab.page_images[page_num] = photo
-                
-                # Verwijder oude afbeelding en teken nieuwe
-                tab.canvas.delete(f"page_{page_num}")
-                tab.canvas.create_image(page_x_offset, page_y_offset, 
-                                       anchor="nw", image=photo, tags=f"page_{page_num}")
-            
             # Verzamel tekst
             tab.selected_text = ""
             last_y = None
@@ -1477,124 +3981,305 @@ class NVictReader:
         else:
             self.status_label.config(text="Geen tekst geselecteerd")
 
-    def show_search_dialog(self):
+    # ====================================================================
+    # ZOEKBALK (zoeken tijdens het typen)
+    # ====================================================================
+
+    def create_find_bar(self):
+        """Niet-modale zoekbalk boven het document met een lijst van treffers (verborgen tot Ctrl+F)"""
+        self.find_frame = tk.Frame(self.root, bg=self.theme["BG_SECONDARY"],
+                                   highlightbackground="#e0e0e0", highlightthickness=1)
+        self.find_after = None
+        self.find_updating = False  # Zoekveld wordt door de code gezet (bij tab wissel)
+        
+        row = tk.Frame(self.find_frame, bg=self.theme["BG_SECONDARY"])
+        row.pack(fill=tk.X, padx=10, pady=6)
+        
+        tk.Label(row, text="🔍 Zoeken:", font=Theme.FONT_MAIN,
+                bg=self.theme["BG_SECONDARY"], fg=self.theme["TEXT_PRIMARY"]).pack(side=tk.LEFT)
+        
+        self.find_var = tk.StringVar()
+        self.find_entry = tk.Entry(row, textvariable=self.find_var, font=Theme.FONT_MAIN, width=40)
+        self.find_entry.pack(side=tk.LEFT, padx=8)
+        self.find_var.trace_add("write", lambda *args: self.on_find_changed())
+        
+        for text, command in (("▲", lambda: self.find_next(-1)), ("▼", lambda: self.find_next(1)),
+                              ("✕", self.hide_find_bar)):
+            tk.Button(row, text=text, command=command, bg=self.theme["BG_PRIMARY"], fg=self.theme["TEXT_PRIMARY"],
+                     font=("Segoe UI", 9), padx=8, relief="flat", cursor="hand2").pack(side=tk.LEFT, padx=2)
+        
+        # Zoekopties; een wijziging start de zoekopdracht opnieuw
+        self.find_options = {
+            'case_sensitive': tk.BooleanVar(value=False),
+            'whole_word': tk.BooleanVar(value=False),
+            'regex': tk.BooleanVar(value=False),
+            'ignore_accents': tk.BooleanVar(value=True),
+        }
+        for option, text in (('case_sensitive', "Aa"), ('whole_word', "Heel woord"),
+                             ('regex', "Regex"), ('ignore_accents', "Accenten negeren")):
+            tk.Checkbutton(row, text=text, variable=self.find_options[option], command=self.on_find_changed,
+                          bg=self.theme["BG_SECONDARY"], fg=self.theme["TEXT_PRIMARY"],
+                          selectcolor=self.theme["BG_PRIMARY"],
+                          activebackground=self.theme["BG_SECONDARY"],
+                          activeforeground=self.theme["TEXT_PRIMARY"],
+                          font=("Segoe UI", 9)).pack(side=tk.LEFT, padx=2)
+        
+        self.find_count_label = tk.Label(row, text="", font=Theme.FONT_SMALL,
+                                         bg=self.theme["BG_SECONDARY"], fg=self.theme["TEXT_SECONDARY"])
+        self.find_count_label.pack(side=tk.LEFT, padx=10)
+        
+        # Treffers met fragment en paginanummer, aangevuld terwijl de pagina's doorzocht worden
+        list_frame = tk.Frame(self.find_frame, bg=self.theme["BG_SECONDARY"])
+        list_frame.pack(fill=tk.X, padx=10, pady=(0, 6))
+        self.find_list = tk.Listbox(list_frame, height=6, font=Theme.FONT_SMALL, activestyle="none",
+                                    bg=self.theme["BG_PRIMARY"], fg=self.theme["TEXT_PRIMARY"],
+                                    selectbackground=self.theme["ACCENT_COLOR"], relief="flat",
+                                    highlightthickness=0)
+        find_scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.find_list.yview)
+        self.find_list.configure(yscrollcommand=find_scrollbar.set)
+        find_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.find_list.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.find_list.bind("<<ListboxSelect>>", lambda e: self.on_find_list_select())
+        
+        self.find_entry.bind("<Return>", lambda e: self.find_next(1))
+        self.find_entry.bind("<Shift-Return>", lambda e: self.find_next(-1))
+        self.find_entry.bind("<Escape>", lambda e: self.hide_find_bar())
+
+    def show_find_bar(self):
+        if not isinstance(self.get_active_tab(), PDFTab):
+            return
+        if not self.find_frame.winfo_manager():
+            self.find_frame.pack(side=tk.TOP, fill=tk.X, padx=20, pady=(10, 0), before=self.notebook)
+        self.find_entry.focus_set()
+        self.find_entry.select_range(0, tk.END)
+
+    def hide_find_bar(self):
+        self.find_frame.pack_forget()
         tab = self.get_active_tab()
         if isinstance(tab, PDFTab):
-            search_window = tk.Toplevel(self.root)
-            search_window.title("Zoeken in PDF")
-            search_window.geometry("450x240")
-            search_window.configure(bg=self.theme["BG_PRIMARY"])
-            search_window.transient(self.root)
-            search_window.grab_set()
-            search_window.resizable(False, False)
-            
-            # Icon toevoegen
-            try:
-                icon_path = get_resource_path('favicon.ico')
-                if os.path.exists(icon_path):
-                    search_window.iconbitmap(icon_path)
-            except:
-                pass
-            
-            # Header met accent kleur (moderne stijl)
-            header_frame = tk.Frame(search_window, bg=self.theme["ACCENT_COLOR"], height=60)
-            header_frame.pack(fill=tk.X)
-            header_frame.pack_propagate(False)
-            
-            tk.Label(header_frame, text="🔍 Zoeken in PDF", font=("Segoe UI", 14, "bold"),
-                    bg=self.theme["ACCENT_COLOR"], fg="white").pack(pady=15)
-            
-            # Content frame
-            content_frame = tk.Frame(search_window, bg=self.theme["BG_PRIMARY"])
-            content_frame.pack(fill=tk.BOTH, expand=True, padx=30, pady=20)
-            
-            tk.Label(content_frame, text="Zoek tekst:", font=Theme.FONT_MAIN,
-                    bg=self.theme["BG_PRIMARY"], fg=self.theme["TEXT_PRIMARY"]).pack(pady=(0, 10))
-            
-            search_var = tk.StringVar()
-            search_entry = tk.Entry(content_frame, textvariable=search_var, 
-                                   font=Theme.FONT_MAIN, width=40)
-            search_entry.pack(pady=5)
-            search_entry.focus()
-            
-            # Footer met knoppen (moderne stijl)
-            footer_frame = tk.Frame(search_window, bg=self.theme["BG_SECONDARY"], height=70)
-            footer_frame.pack(fill=tk.X, side=tk.BOTTOM)
-            footer_frame.pack_propagate(False)
-            
-            btn_frame = tk.Frame(footer_frame, bg=self.theme["BG_SECONDARY"])
-            btn_frame.pack(expand=True)
-            
-            def do_search():
-                search_text = search_var.get()
-                if search_text:
-                    self.search_in_pdf(tab, search_text)
-                    search_window.destroy()
-            
-            tk.Button(btn_frame, text="Zoeken", command=do_search, 
-                     bg=self.theme["ACCENT_COLOR"], fg="white", 
-                     font=("Segoe UI", 10), padx=25, pady=10,
-                     relief="flat", cursor="hand2").pack(side=tk.LEFT, padx=5)
-            
-            tk.Button(btn_frame, text="Annuleren", command=search_window.destroy,
-                     bg=self.theme["BG_PRIMARY"], fg=self.theme["TEXT_PRIMARY"],
-                     font=("Segoe UI", 10), padx=25, pady=10,
-                     relief="flat", cursor="hand2").pack(side=tk.LEFT, padx=5)
-            
-            search_entry.bind("<Return>", lambda e: do_search())
+            tab.canvas.focus_set()
+
+    def on_find_changed(self):
+        """Nieuwe invoer: lopende zoekopdracht direct stoppen, de nieuwe na een korte pauze starten"""
+        if self.find_updating:
+            return
+        tab = self.get_active_tab()
+        if not isinstance(tab, PDFTab):
+            return
+        if tab.search_job:
+            tab.search_job.cancel()
+            tab.search_job = None
+        if self.find_after is not None:
+            self.root.after_cancel(self.find_after)
+        self.find_after = self.root.after(self.FIND_DELAY_MS, lambda t=tab: self.start_find(t, self.find_var.get()))
 
-    def search_in_pdf(self, tab, search_text):
-        found = False
-        start_page = tab.current_page
+    def start_find(self, tab, query):
+        """Start een zoekopdracht in de achtergrond; treffers stromen binnen via poll_find_results"""
+        self.find_after = None
+        if tab.search_job:
+            tab.search_job.cancel()
+            tab.search_job = None
+        tab.search_query = query
+        tab.search_results = []
+        tab.search_position = -1
+        tab.search_hits = {}
+        tab.canvas.delete("search_overlay")
+        self.find_list.delete(0, tk.END)
+        
+        if not query.strip() or not tab.pdf_document:
+            self.find_count_label.config(text="")
+            return
+        try:
+            search_query = SearchQuery(query, **{option: var.get() for option, var in self.find_options.items()})
+        except re.error as e:
+            self.find_count_label.config(text=f"Ongeldige expressie: {e}")
+            return
         
-        for offset in range(len(tab.pdf_document)):
-            page_num = (start_page + offset) % len(tab.pdf_document)
-            page = tab.pdf_document[page_num]
-            instances = page.search_for(search_text)
-            
-            if instances:
-                if page_num != tab.current_page:
-                    tab.current_page = page_num
-                    self.display_page(tab)
-                
-                # Highlight op de afbeelding
-                highlighted = tab.current_image.copy()
-                draw = ImageDraw.Draw(highlighted, 'RGBA')
-                
-                for inst in instances:
-                    rect = fitz.Rect(inst)
-                    x0 = rect.x0 * tab.zoom_level
-                    y0 = rect.y0 * tab.zoom_level
-                    x1 = rect.x1 * tab.zoom_level
-                    y1 = rect.y1 * tab.zoom_level
-                    
-                    draw.rectangle(
-                        [x0, y0, x1, y1],
-                        outline=(255, 140, 0, 255),  # Oranje
-                        width=3
-                    )
-                
-                photo = ImageTk.PhotoImage(highlighted)
-                tab.highlighted_image = photo
-                tab.canvas.delete("page_image")
-                tab.canvas.create_image(tab.page_offset_x, tab.page_offset_y,
-                                       anchor="nw", image=photo, tags="page_image")
-                
-                found = True
-                self.status_label.config(
-                    text=f"Gevonden: '{search_text}' ({len(instances)}x op pagina {page_num + 1})"
-                )
+        self.start_search_index(tab)
+        job = tab.search_job = SearchJob(tab.search_index, search_query, tab.current_page)
+        job.start()
+        self.find_count_label.config(text="Zoeken...")
+        self.root.after(self.FIND_POLL_MS, lambda: self.poll_find_results(tab, job))
+
+    def poll_find_results(self, tab, job):
+        """Verwerk binnengekomen treffers binnen een tijdsbudget, zodat de UI niet blokkeert"""
+        if tab.search_job is not job:
+            return
+        active = tab == self.get_active_tab()
+        finished = False
+        arrived = {}  # page_num -> rechthoeken die in deze ronde binnenkwamen
+        deadline = time.perf_counter() + self.FIND_BUDGET
+        while time.perf_counter() < deadline:
+            try:
+                hit = job.results.get_nowait()
+            except queue.Empty:
                 break
+            if hit is None:
+                finished = True
+                break
+            
+            page_num, rects, snippet = hit
+            tab.search_results.append(hit)
+            tab.search_hits.setdefault(page_num, []).extend(rects)
+            if page_num in tab.attached_pages:
+                arrived.setdefault(page_num, []).extend(rects)
+            if active:
+                self.find_list.insert(tk.END, f"p. {page_num + 1}: {snippet}")
+            if len(tab.search_results) == 1:
+                self.show_search_result(tab, 0)  # Eerste treffer direct tonen
+        
+        # Alleen de nieuwe treffers tekenen; eerder getekende blijven staan
+        for page_num, rects in arrived.items():
+            self.draw_search_highlights(tab, page_num, rects)
+        
+        if finished:
+            tab.search_job = None
+            if job.error:
+                print(f"Fout bij zoeken: {job.error}")
+        else:
+            self.root.after(self.FIND_POLL_MS, lambda: self.poll_find_results(tab, job))
+        if active:
+            self.update_find_count(tab)
+
+    def update_find_count(self, tab):
+        count = len(tab.search_results)
+        if not tab.search_query:
+            text = ""
+        elif count == 0:
+            text = "Zoeken..." if tab.search_job else "Niet gevonden"
+        else:
+            text = f"{tab.search_position + 1} van {count}"
+        if tab.search_job:
+            text += f" ({tab.search_job.scanned_pages} / {tab.search_job.index.page_count} pagina's)"
+        self.find_count_label.config(text=text)
+
+    def sync_find_bar(self, tab):
+        """Zet zoekveld en lijst na een tab wissel op de zoekopdracht van die tab"""
+        self.find_updating = True
+        self.find_var.set(tab.search_query if isinstance(tab, PDFTab) else "")
+        self.find_updating = False
+        self.find_list.delete(0, tk.END)
+        if isinstance(tab, PDFTab):
+            self.find_list.insert(tk.END, *[f"p. {page_num + 1}: {snippet}"
+                                            for page_num, _, snippet in tab.search_results])
+            self.update_find_count(tab)
+        else:
+            self.find_count_label.config(text="")
+
+    def on_find_list_select(self):
+        tab = self.get_active_tab()
+        selection = self.find_list.curselection()
+        if isinstance(tab, PDFTab) and selection and selection[0] < len(tab.search_results):
+            self.show_search_result(tab, selection[0], select=False)
+
+    def start_search_index(self, tab):
+        """Bouw de woordindex van een document op in de achtergrond"""
+        if tab.search_index is not None or not tab.pdf_document:
+            return
+        tab.search_index = SearchIndex(len(tab.pdf_document), tab.source, tab.password)
+        tab.search_index.start()
+
+    def find_next(self, step):
+        """F3 / Shift+F3: volgende of vorige treffer van de laatste zoekopdracht"""
+        tab = self.get_active_tab()
+        if not isinstance(tab, PDFTab):
+            return
+        if not tab.search_results:
+            self.show_find_bar()
+            return
+        self.show_search_result(tab, tab.search_position + step)
+
+    def show_search_result(self, tab, position, select=True):
+        """Scroll naar een treffer en markeer hem als huidige"""
+        tab.search_position = position % len(tab.search_results)
+        page_num, rects, _ = tab.search_results[tab.search_position]
+        
+        x0, y0, x1, y1 = self.pdf_rect_to_canvas(tab, page_num, rects[0])
+        view_width = max(tab.canvas.winfo_width(), 1)
+        view_height = max(tab.canvas.winfo_height(), 1)
+        view_left = tab.canvas.canvasx(0)
+        view_top = tab.canvas.canvasy(0)
+        if not (view_top <= y0 and y1 <= view_top + view_height):
+            tab.canvas.yview_moveto(max(0.0, (y0 - view_height / 3) / tab.layout.total_height))
+        if not (view_left <= x0 and x1 <= view_left + view_width):
+            tab.canvas.xview_moveto(max(0.0, (x0 - view_width / 3) / tab.layout.max_width))
+        
+        tab.current_page = page_num
+        self.update_visible_pages(tab)
+        self.draw_current_search_hit(tab)
+        
+        if tab == self.get_active_tab():
+            if select:
+                self.find_list.selection_clear(0, tk.END)
+                self.find_list.selection_set(tab.search_position)
+                self.find_list.see(tab.search_position)
+            self.update_find_count(tab)
+            self.status_label.config(text=f"Treffer {tab.search_position + 1} van {len(tab.search_results)}: "
+                                          f"'{tab.search_query}' (pagina {page_num + 1})")
+
+    def draw_current_search_hit(self, tab):
+        """Kader rond de huidige treffer (boven de oranje markering van alle treffers)"""
+        tab.canvas.delete("search_current")
+        if not (0 <= tab.search_position < len(tab.search_results)):
+            return
+        page_num, rects, _ = tab.search_results[tab.search_position]
+        transform = self.page_transform(tab, page_num)
+        for rect in rects:
+            x0, y0, x1, y1 = self.pdf_rect_to_canvas(tab, page_num, rect, transform)
+            tab.canvas.create_rectangle(
+                x0 - 2, y0 - 2, x1 + 2, y1 + 2,
+                outline=self.theme["ACCENT_COLOR"], width=2,
+                tags=("overlay", "search_overlay", "search_current")
+            )
+
+    def draw_search_highlights(self, tab, page_num, rects=None):
+        """Teken zoekresultaten van een pagina als overlay items.
         
-        if not found:
-            messagebox.showinfo("Zoeken", f"'{search_text}' niet gevonden in document")
+        rects: alleen deze (nieuw binnengekomen) treffers toevoegen; zonder rects wordt de hele pagina
+        opnieuw getekend (bijv. als de pagina in beeld komt).
+        """
+        redraw = rects is None
+        if redraw:
+            tab.canvas.delete(f"search_{page_num}")
+            rects = tab.search_hits.get(page_num, [])
+        transform = self.page_transform(tab, page_num)
+        for inst in rects:
+            x0, y0, x1, y1 = self.pdf_rect_to_canvas(tab, page_num, inst, transform)
+            tab.canvas.create_rectangle(
+                x0, y0, x1, y1,
+                fill="#FF8C00", stipple="gray25",
+                outline="#FF8C00", width=3,  # Oranje
+                tags=("overlay", "search_overlay", f"search_{page_num}")
+            )
+        if 0 <= tab.search_position < len(tab.search_results) and \
+                tab.search_results[tab.search_position][0] == page_num:
+            if redraw:
+                self.draw_current_search_hit(tab)
+            else:
+                tab.canvas.tag_raise("search_current")  # Kader boven de nieuwe markeringen houden
+
+    def page_transform(self, tab, page_num):
+        """(rotatiematrix of None, x offset, y offset, zoom) van een pagina, één keer per pagina opgezocht"""
+        page = tab.pdf_document[page_num]
+        matrix = page.rotation_matrix if page.rotation else None
+        x_offset, y_offset = tab.layout.page_rect(page_num)[:2]
+        return matrix, x_offset, y_offset, tab.zoom_level
+
+    def pdf_rect_to_canvas(self, tab, page_num, rect, transform=None):
+        """Zet een rechthoek in (ongeroteerde) pagina coördinaten om naar canvas coördinaten"""
+        matrix, x_offset, y_offset, zoom = transform or self.page_transform(tab, page_num)
+        rect = fitz.Rect(rect)
+        if matrix is not None:
+            rect = rect * matrix
+        return (x_offset + rect.x0 * zoom, y_offset + rect.y0 * zoom,
+                x_offset + rect.x1 * zoom, y_offset + rect.y1 * zoom)
 
     # Navigatie functies
     def navigate(self, delta):
         tab = self.get_active_tab()
         if isinstance(tab, PDFTab):
             new_page = tab.current_page + delta
-            if 0 <= new_page < len(tab.pdf_document):
+            if 0 <= new_page < len(tab.layout):
                 tab.current_page = new_page
                 self.scroll_to_page(tab, tab.current_page)
                 self.update_ui_state()
@@ -1615,7 +4300,7 @@ class NVictReader:
     def last_page(self):
         tab = self.get_active_tab()
         if isinstance(tab, PDFTab):
-            tab.current_page = len(tab.pdf_document) - 1
+            tab.current_page = max(len(tab.layout) - 1, 0)
             self.scroll_to_page(tab, tab.current_page)
             self.update_ui_state()
 
@@ -1624,7 +4309,7 @@ class NVictReader:
         if isinstance(tab, PDFTab):
             try:
                 page_num = int(self.page_var.get()) - 1
-                if 0 <= page_num < len(tab.pdf_document):
+                if 0 <= page_num < len(tab.layout):
                     tab.current_page = page_num
                     self.scroll_to_page(tab, page_num)
                     self.update_ui_state()
@@ -1636,10 +4321,30 @@ class NVictReader:
         tab = self.get_active_tab()
         if isinstance(tab, PDFTab):
             tab.zoom_mode = "manual"
-            new_zoom = tab.zoom_level * factor
-            if 0.2 < new_zoom < 5.0:
-                tab.zoom_level = new_zoom
-                self.display_page(tab)
+            new_zoom = quantize_zoom(tab.zoom_level * factor)
+            if 0.2 < new_zoom < 5.0 and new_zoom != tab.zoom_level:
+                self.apply_zoom(tab, new_zoom)
+    
+    def apply_zoom(self, tab, new_zoom):
+        """Zoom direct door bestaande bitmaps te schalen; de echte render volgt als de invoer stil ligt"""
+        layout = tab.layout
+        view_width = max(tab.canvas.winfo_width(), 1)
+        view_height = max(tab.canvas.winfo_height(), 1)
+        center_x = tab.canvas.canvasx(view_width / 2)
+        center_y = tab.canvas.canvasy(view_height / 2)
+        
+        # Onthoud welk documentpunt in het midden van de viewport staat
+        page_num = layout.page_at(center_y)
+        old_zoom = tab.zoom_level
+        anchor = (page_num, ((center_x - layout.MARGIN_X) / old_zoom,
+                             (center_y - layout.page_top(page_num)) / old_zoom))
+        
+        preview = {p: tab.page_pil_images[p]
+                   for p in layout.visible_range(center_y - view_height / 2, center_y + view_height / 2)
+                   if p in tab.page_pil_images}
+        
+        tab.zoom_level = new_zoom
+        self.display_page(tab, preview=preview, anchor=anchor)
     
     def zoom_in(self): 
         self.zoom(1.2)
@@ -1657,6 +4362,7 @@ class NVictReader:
         """Toon ingebouwde print dialoog met printer selectie"""
         tab = self.get_active_tab()
         if isinstance(tab, PDFTab):
+            self.flush_form_data(tab)  # Afdruk bevat ingevulde formuliervelden
             print_dialog = tk.Toplevel(self.root)
             print_dialog.title("Afdrukken")
             print_dialog.geometry("550x600")
@@ -2098,8 +4804,7 @@ class NVictReader:
                             pix = page.get_pixmap(matrix=mat, alpha=False)
                             
                             # Converteer naar PIL Image
-                            img_data = pix.tobytes("ppm")
-                            img = Image.open(io.BytesIO(img_data))
+                            img = pixmap_to_image(pix)
                             
                             # Bereken afmetingen voor printer
                             img_width, img_height = img.size
@@ -2205,19 +4910,59 @@ class NVictReader:
             )
             if save_path:
                 try:
-                    # Sla alle form data op in het PDF document
-                    for page_num in range(len(tab.pdf_document)):
-                        page = tab.pdf_document[page_num]
-                        for widget in page.widgets():
-                            if widget.field_name in tab.form_data:
-                                widget.field_value = tab.form_data[widget.field_name]
-                                widget.update()
+                    # Schrijf openstaande wijzigingen naar het PDF document
+                    self.flush_form_data(tab)
                     
                     tab.pdf_document.save(save_path)
                     messagebox.showinfo("Succes", "PDF met ingevulde formuliervelden opgeslagen")
                 except Exception as e:
                     messagebox.showerror("Fout", f"Kan PDF niet opslaan:\n{str(e)}")
     
+    def import_form_data(self):
+        """Vul formuliervelden vanuit een XFDF, FDF of JSON bestand"""
+        tab = self.get_active_tab()
+        if not isinstance(tab, PDFTab):
+            return
+        path = filedialog.askopenfilename(
+            filetypes=[("Formulierdata", "*.xfdf *.fdf *.json"), ("Alle Bestanden", "*.*")]
+        )
+        if not path:
+            return
+        try:
+            applied, unknown = self.apply_form_values(tab, read_form_values(path))
+            message = f"{applied} velden ingevuld"
+            if unknown:
+                message += f" ({unknown} onbekende velden overgeslagen)"
+            self.status_label.config(text=message)
+        except Exception as e:
+            messagebox.showerror("Fout", f"Kan formulierdata niet importeren:\n{str(e)}")
+
+    def export_form_data(self):
+        """Sla alle formulierwaarden op als XFDF, FDF of JSON"""
+        tab = self.get_active_tab()
+        if not isinstance(tab, PDFTab):
+            return
+        path = filedialog.asksaveasfilename(
+            defaultextension=".xfdf",
+            filetypes=[("XFDF", "*.xfdf"), ("FDF", "*.fdf"), ("JSON", "*.json")]
+        )
+        if not path:
+            return
+        try:
+            values = self.harvest_form_values(tab)
+            write_form_values(path, values)
+            self.status_label.config(text=f"{len(values)} velden geëxporteerd")
+        except Exception as e:
+            messagebox.showerror("Fout", f"Kan formulierdata niet exporteren:\n{str(e)}")
+
+    def save_new_document(self, doc, save_path):
+        """Schrijf een nieuw document weg en geef de bytes terug, zodat het zonder herladen geopend kan worden"""
+        data = doc.tobytes()
+        doc.close()
+        with open(save_path, "wb") as f:
+            f.write(data)
+        return data
+
     def split_pdf(self):
         """Splits PDF in losse pagina's"""
         tab = self.get_active_tab()
@@ -2232,6 +4977,8 @@ class NVictReader:
         if not folder_path:
             return
         
+        self.flush_form_data(tab)
+        
         try:
             base_name = os.path.splitext(os.path.basename(tab.file_path))[0]
             
@@ -2274,7 +5021,36 @@ class NVictReader:
                 f"Gemaakt: {metadata.get('creationDate', 'N/A')}\n"
                 f"Gewijzigd: {metadata.get('modDate', 'N/A')}\n"
                 f"Pagina's: {len(tab.pdf_document)}\n"
-                f"Bestandsgrootte: {os.path.getsize(tab.file_path) / 1024:.1f} KB"
+                f"Bestandsgrootte: {tab.source.size() / 1024:.1f} KB"
+            )
+            
+            # Render statistieken (voor het afstellen van refine_delay_ms per machine)
+            count, average_ms, p95_ms = self.render_service.latency_summary()
+            if count:
+                info_text += (
+                    f"\n\nDraft → scherp: gemiddeld {average_ms:.0f} ms, "
+                    f"p95 {p95_ms:.0f} ms ({count} pagina's)"
+                )
+            tabs = self.pdf_tabs()
+            info_text += (
+                f"\nGeschat geheugen (alle tabs): "
+                f"{sum(self.estimate_tab_memory(t) for t in tabs) / 1048576:.0f} MB van "
+                f"{self.update_settings.get('memory_limit_mb', 1536)} MB, "
+                f"{sum(1 for t in tabs if t.hibernated)} tab(s) in slaapstand"
+            )
+            if tab.first_page_ms is not None:
+                info_text += f"\nEerste pagina zichtbaar na {tab.first_page_ms:.0f} ms"
+                if len(self.first_page_times) > 1:
+                    average = sum(self.first_page_times) / len(self.first_page_times)
+                    info_text += f" (gemiddeld {average:.0f} ms over {len(self.first_page_times)} documenten)"
+            cache = self.render_cache
+            info_text += (
+                f"\nRender cache: {cache.used_bytes / 1048576:.0f} / {cache.budget_bytes / 1048576:.0f} MB, "
+                f"{cache.hits} hits / {cache.misses} misses ({cache.hit_rate():.0%})"
+                f"\nSchijf cache: {self.disk_cache.used_bytes / 1048576:.0f} / "
+                f"{self.disk_cache.budget_bytes / 1048576:.0f} MB, {self.disk_cache.hits} hits"
+                f"\nDisplay lists: {self.render_service.display_list_builds} opgebouwd, "
+                f"{self.render_service.display_list_hits} hergebruikt"
             )
             messagebox.showinfo("PDF Informatie", info_text)
 
@@ -2287,7 +5063,7 @@ class NVictReader:
         # Maak popup menu
         edit_menu = tk.Toplevel(self.root)
         edit_menu.title("PDF Bewerken")
-        edit_menu.geometry("400x450")
+        edit_menu.geometry("400x530")
         edit_menu.configure(bg=self.theme["BG_PRIMARY"])
         edit_menu.transient(self.root)
         edit_menu.grab_set()
@@ -2338,6 +5114,13 @@ class NVictReader:
                                               lambda: [edit_menu.destroy(), self.rotate_pages()])
         rotate_frame.pack(fill=tk.X, pady=5)
         
+        # Formulieren in bulk invullen
+        batch_frame = self.create_menu_option(content,
+                                             "📋 Formulieren in Bulk Invullen",
+                                             "Vul dit formulier voor elke regel uit een CSV of JSON bestand",
+                                             lambda: [edit_menu.destroy(), self.batch_fill_forms()])
+        batch_frame.pack(fill=tk.X, pady=5)
+        
         # Footer met knop (moderne stijl)
         footer_frame = tk.Frame(edit_menu, bg=self.theme["BG_SECONDARY"], height=70)
         footer_frame.pack(fill=tk.X, side=tk.BOTTOM)
@@ -2348,6 +5131,302 @@ class NVictReader:
                  font=("Segoe UI", 10), padx=30, pady=10,
                  relief="flat", cursor="hand2").pack(pady=15)
 
+    def batch_fill_forms(self):
+        """Vul een formulier template voor elk record uit een CSV of JSON bestand (één PDF per record)"""
+        tab = self.get_active_tab()
+        
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Formulieren in bulk invullen")
+        dialog.geometry("560x640")
+        dialog.configure(bg=self.theme["BG_PRIMARY"])
+        dialog.transient(self.root)
+        dialog.grab_set()
+        dialog.resizable(False, False)
+        
+        # Icon toevoegen
+        try:
+            icon_path = get_resource_path('favicon.ico')
+            if os.path.exists(icon_path):
+                dialog.iconbitmap(icon_path)
+        except:
+            pass
+        
+        # Header met accent kleur (moderne stijl)
+        header_frame = tk.Frame(dialog, bg=self.theme["ACCENT_COLOR"], height=60)
+        header_frame.pack(fill=tk.X)
+        header_frame.pack_propagate(False)
+        
+        tk.Label(header_frame, text="📋 Formulieren in Bulk Invullen", font=("Segoe UI", 14, "bold"),
+                bg=self.theme["ACCENT_COLOR"], fg="white").pack(pady=15)
+        
+        content_frame = tk.Frame(dialog, bg=self.theme["BG_PRIMARY"])
+        content_frame.pack(fill=tk.BOTH, expand=True, padx=30, pady=15)
+        
+        state = {"fields": [], "columns": [], "rows": [], "mapping": {}, "executor": None, "futures": [],
+                 "counted": set(), "saved": 0, "errors": [], "running": None}
+        
+        template_var = tk.StringVar(value=tab.file_path if isinstance(tab, PDFTab) else "")
+        data_var = tk.StringVar()
+        output_var = tk.StringVar()
+        name_var = tk.StringVar(value="(volgnummer)")
+        flatten_var = tk.BooleanVar(value=False)
+        
+        def file_row(label, variable, command):
+            tk.Label(content_frame, text=label, font=("Segoe UI", 9, "bold"),
+                    bg=self.theme["BG_PRIMARY"], fg=self.theme["TEXT_PRIMARY"]).pack(anchor="w")
+            row = tk.Frame(content_frame, bg=self.theme["BG_PRIMARY"])
+            row.pack(fill=tk.X, pady=(2, 8))
+            tk.Entry(row, textvariable=variable, font=("Segoe UI", 9)).pack(side=tk.LEFT, fill=tk.X, expand=True)
+            tk.Button(row, text="Bladeren...", command=command, bg=self.theme["BG_SECONDARY"],
+                     fg=self.theme["TEXT_PRIMARY"], font=("Segoe UI", 9), relief="flat",
+                     cursor="hand2").pack(side=tk.LEFT, padx=(5, 0))
+        
+        def load_template(path):
+            try:
+                state["fields"] = template_field_names(path)
+            except Exception as e:
+                state["fields"] = []
+                messagebox.showerror("Fout", f"Kan template niet lezen:\n{str(e)}", parent=dialog)
+            build_mapping()
+        
+        def choose_template():
+            path = filedialog.askopenfilename(filetypes=[("PDF Bestanden", "*.pdf")], parent=dialog)
+            if path:
+                template_var.set(path)
+                load_template(path)
+        
+        def choose_data():
+            path = filedialog.askopenfilename(
+                filetypes=[("Gegevens", "*.csv *.json"), ("Alle Bestanden", "*.*")], parent=dialog
+            )
+            if not path:
+                return
+            try:
+                state["columns"], state["rows"] = read_merge_rows(path)
+            except Exception as e:
+                messagebox.showerror("Fout", f"Kan gegevens niet lezen:\n{str(e)}", parent=dialog)
+                return
+            data_var.set(path)
+            name_combo.configure(values=["(volgnummer)"] + state["columns"])
+            build_mapping()
+        
+        def choose_output():
+            path = filedialog.askdirectory(title="Selecteer map voor ingevulde formulieren", parent=dialog)
+            if path:
+                output_var.set(path)
+        
+        file_row("Formulier template:", template_var, choose_template)
+        file_row("Gegevens (CSV of JSON):", data_var, choose_data)
+        
+        # Koppeling kolom -> veld (standaard op gelijke naam)
+        tk.Label(content_frame, text="Kolommen koppelen aan velden:", font=("Segoe UI", 9, "bold"),
+                bg=self.theme["BG_PRIMARY"], fg=self.theme["TEXT_PRIMARY"]).pack(anchor="w")
+        mapping_outer = tk.Frame(content_frame, bg=self.theme["BG_SECONDARY"], height=160)
+        mapping_outer.pack(fill=tk.X, pady=(2, 8))
+        mapping_outer.pack_propagate(False)
+        mapping_canvas = tk.Canvas(mapping_outer, bg=self.theme["BG_SECONDARY"], highlightthickness=0)
+        mapping_scroll = ttk.Scrollbar(mapping_outer, orient=tk.VERTICAL, command=mapping_canvas.yview)
+        mapping_canvas.configure(yscrollcommand=mapping_scroll.set)
+        mapping_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+        mapping_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        mapping_frame = tk.Frame(mapping_canvas, bg=self.theme["BG_SECONDARY"])
+        mapping_canvas.create_window(0, 0, anchor="nw", window=mapping_frame)
+        mapping_frame.bind("<Configure>",
+                           lambda e: mapping_canvas.configure(scrollregion=mapping_canvas.bbox("all")))
+        
+        def build_mapping():
+            for child in mapping_frame.winfo_children():
+                child.destroy()
+            state["mapping"] = {}
+            lookup = {name.lower(): name for name in state["fields"]}
+            for row_index, column in enumerate(state["columns"]):
+                tk.Label(mapping_frame, text=column, font=("Segoe UI", 9), anchor="w", width=24,
+                        bg=self.theme["BG_SECONDARY"], fg=self.theme["TEXT_PRIMARY"]).grid(
+                            row=row_index, column=0, sticky="w", padx=5, pady=1)
+                variable = tk.StringVar(value=lookup.get(str(column).lower(), "(niet gebruiken)"))
+                ttk.Combobox(mapping_frame, textvariable=variable, state="readonly", width=30,
+                             values=["(niet gebruiken)"] + state["fields"]).grid(
+                                 row=row_index, column=1, sticky="w", padx=5, pady=1)
+                state["mapping"][column] = variable
+        
+        # Uitvoer opties
+        file_row("Uitvoermap:", output_var, choose_output)
+        
+        options = tk.Frame(content_frame, bg=self.theme["BG_PRIMARY"])
+        options.pack(fill=tk.X, pady=(0, 8))
+        tk.Label(options, text="Bestandsnaam uit kolom:", font=("Segoe UI", 9),
+                bg=self.theme["BG_PRIMARY"], fg=self.theme["TEXT_PRIMARY"]).pack(side=tk.LEFT)
+        name_combo = ttk.Combobox(options, textvariable=name_var, state="readonly", width=20,
+                                  values=["(volgnummer)"])
+        name_combo.pack(side=tk.LEFT, padx=5)
+        tk.Checkbutton(options, text="Velden vastzetten (flatten)", variable=flatten_var,
+                      bg=self.theme["BG_PRIMARY"], fg=self.theme["TEXT_PRIMARY"],
+                      selectcolor=self.theme["BG_SECONDARY"],
+                      activebackground=self.theme["BG_PRIMARY"]).pack(side=tk.LEFT, padx=(10, 0))
+        
+        # Voortgang
+        progress = ttk.Progressbar(content_frame, mode="determinate")
+        progress.pack(fill=tk.X, pady=(5, 2))
+        status = tk.Label(content_frame, text="", font=("Segoe UI", 9),
+                         bg=self.theme["BG_PRIMARY"], fg=self.theme["TEXT_SECONDARY"])
+        status.pack(anchor="w")
+        
+        def build_jobs():
+            """(bestandsnaam, {veld: waarde}) per record, met unieke en geldige bestandsnamen"""
+            mapping = {column: variable.get() for column, variable in state["mapping"].items()
+                       if variable.get() != "(niet gebruiken)"}
+            base_name = os.path.splitext(os.path.basename(template_var.get()))[0]
+            name_column = name_var.get()
+            used = set()
+            jobs = []
+            for number, row in enumerate(state["rows"], start=1):
+                if name_column != "(volgnummer)" and str(row.get(name_column, "")).strip():
+                    name = re.sub(r'[\\/:*?"<>|]+', "_", str(row[name_column]).strip())
+                else:
+                    name = f"{base_name}_{number:05d}"
+                candidate = name
+                suffix = 2
+                while candidate.lower() in used:
+                    candidate = f"{name}_{suffix}"
+                    suffix += 1
+                used.add(candidate.lower())
+                values = {field: row.get(column, "") for column, field in mapping.items()}
+                jobs.append((candidate + ".pdf", values))
+            return jobs
+        
+        def start():
+            if state["executor"]:
+                return
+            template = template_var.get()
+            if not os.path.exists(template):
+                messagebox.showwarning("Template", "Kies een formulier template", parent=dialog)
+                return
+            if not state["rows"]:
+                messagebox.showwarning("Gegevens", "Kies een CSV of JSON bestand met records", parent=dialog)
+                return
+            if not output_var.get():
+                messagebox.showwarning("Uitvoermap", "Kies een map voor de ingevulde formulieren", parent=dialog)
+                return
+            
+            jobs = build_jobs()
+            # Telling per run: een tweede run in hetzelfde venster begint opnieuw
+            state.update(counted=set(), saved=0, errors=[], running=None, total=len(jobs))
+            pool_options = {}
+            if sys.version_info >= (3, 11):
+                pool_options["max_tasks_per_child"] = MERGE_TASKS_PER_WORKER
+            state["executor"] = concurrent.futures.ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1, initializer=_merge_worker_init,
+                initargs=(template,), **pool_options
+            )
+            state["futures"] = [
+                state["executor"].submit(fill_form_rows, jobs[i:i + MERGE_CHUNK_SIZE],
+                                         output_var.get(), flatten_var.get())
+                for i in range(0, len(jobs), MERGE_CHUNK_SIZE)
+            ]
+            state["started"] = time.perf_counter()
+            progress.configure(maximum=len(jobs), value=0)
+            start_button.configure(state="disabled")
+            poll()
+        
+        def poll():
+            """Verwerk afgeronde blokken zonder de UI te blokkeren"""
+            if not state["executor"] or not dialog.winfo_exists():
+                return
+            for future in state["futures"]:
+                if future.done() and future not in state["counted"] and not future.cancelled():
+                    state["counted"].add(future)
+                    try:
+                        saved, errors = future.result()
+                    except Exception as e:
+                        saved, errors = 0, [str(e)]
+                    state["saved"] += saved
+                    state["errors"].extend(errors)
+            
+            done = state["saved"] + len(state["errors"])
+            elapsed = time.perf_counter() - state["started"]
+            rate = state["saved"] / elapsed if elapsed > 0 else 0
+            progress.configure(value=done)
+            if state["running"] is not None:
+                status.config(text=f"Annuleren: wachten op records {running_records()} ({state['saved']} opgeslagen)")
+            else:
+                status.config(text=f"{state['saved']} van {state['total']} opgeslagen ({rate:.0f} per seconde)")
+            
+            if all(future.done() for future in state["futures"]):
+                finish(cancelled=state["running"] is not None)
+            else:
+                dialog.after(100, poll)
+        
+        def running_records():
+            """Recordnummers van de blokken die al liepen toen er geannuleerd werd (bijv. "26-50, 51-75")"""
+            ranges = []
+            for index in state["running"]:
+                first = index * MERGE_CHUNK_SIZE + 1
+                ranges.append(f"{first}-{min(first + MERGE_CHUNK_SIZE - 1, state['total'])}")
+            return ", ".join(ranges)
+        
+        def finish(cancelled=False):
+            executor = state["executor"]
+            state["executor"] = None
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+            start_button.configure(state="normal")
+            summary = f"{state['saved']} formulieren opgeslagen in {output_var.get()}"
+            if state["errors"]:
+                summary += f"\n{len(state['errors'])} fouten, bijv.:\n" + "\n".join(state["errors"][:5])
+            if cancelled:
+                text = f"Geannuleerd: {state['saved']} formulieren opgeslagen"
+                if state["running"]:
+                    text += f" (records {running_records()} liepen al en zijn afgemaakt)"
+                status.config(text=text)
+            elif dialog.winfo_exists():
+                messagebox.showinfo("Klaar", summary, parent=dialog)
+        
+        def cancel():
+            """Annuleer wachtende blokken; blokken die al lopen schrijven hun PDF's nog weg"""
+            if not state["executor"]:
+                dialog.destroy()
+                return
+            if state["running"] is not None:
+                return
+            state["running"] = [index for index, future in enumerate(state["futures"])
+                                if not future.cancel() and not future.done()]
+            state["executor"].shutdown(wait=False, cancel_futures=True)
+            # poll() meldt de lopende blokken en rondt af zodra ze klaar zijn
+        
+        def close():
+            if state["executor"]:
+                cancel()
+                if state["running"]:
+                    messagebox.showinfo(
+                        "Formulieren in bulk invullen",
+                        f"Records {running_records()} waren al bezig en worden nog opgeslagen in "
+                        f"{output_var.get()}.", parent=self.root)
+            dialog.destroy()
+        
+        dialog.protocol("WM_DELETE_WINDOW", close)
+        
+        # Footer met knoppen (moderne stijl)
+        footer_frame = tk.Frame(dialog, bg=self.theme["BG_SECONDARY"], height=70)
+        footer_frame.pack(fill=tk.X, side=tk.BOTTOM)
+        footer_frame.pack_propagate(False)
+        
+        btn_container = tk.Frame(footer_frame, bg=self.theme["BG_SECONDARY"])
+        btn_container.pack(expand=True)
+        
+        start_button = tk.Button(btn_container, text="Start", command=start,
+                                bg=self.theme["ACCENT_COLOR"], fg="white",
+                                font=("Segoe UI", 10), padx=25, pady=10,
+                                relief="flat", cursor="hand2")
+        start_button.pack(side=tk.LEFT, padx=5)
+        
+        tk.Button(btn_container, text="Annuleren", command=cancel,
+                 bg=self.theme["BG_PRIMARY"], fg=self.theme["TEXT_PRIMARY"],
+                 font=("Segoe UI", 10), padx=25, pady=10,
+                 relief="flat", cursor="hand2").pack(side=tk.LEFT, padx=5)
+        
+        if template_var.get():
+            load_template(template_var.get())
+
     def create_menu_option(self, parent, title, description, command):
         """Maak een menu optie frame"""
         frame = tk.Frame(parent, bg=self.theme["BG_SECONDARY"], 
@@ -2501,13 +5580,15 @@ class NVictReader:
                 for page_num in pages:
                     new_doc.insert_pdf(tab.pdf_document, from_page=page_num, to_page=page_num)
                 
-                new_doc.save(save_path)
-                new_doc.close()
+                data = self.save_new_document(new_doc, save_path)
                 
                 dialog.destroy()
                 messagebox.showinfo("Succes", 
                     f"{len(pages)} pagina('s) succesvol geëxporteerd naar:\n{os.path.basename(save_path)}")
                 
+                if messagebox.askyesno("Openen?", "Wilt u het geëxporteerde bestand openen?"):
+                    self.add_new_tab(save_path, source=DocumentSource.from_bytes(data, save_path))
+                
             except Exception as e:
                 messagebox.showerror("Fout", f"Kan pagina's niet exporteren:\n{str(e)}")
         
@@ -2607,9 +5688,13 @@ class NVictReader:
                 for page_num in pages:
                     page = tab.pdf_document[page_num]
                     page.set_rotation(rotation)
+                    tab.invalidate_page(page_num)
+                    self.render_cache.drop_page(tab.doc_key, page_num)
                 
-                # Ververs weergave
+                # Ververs weergave (paginagrenzen zijn gewijzigd)
+                tab.layout.build(tab.pdf_document)
                 self.display_page(tab)
+                self.refresh_thumbnails(tab)
                 rotate_dialog.destroy()
                 
                 messagebox.showinfo("Succes", 
@@ -2662,6 +5747,8 @@ class NVictReader:
             if isinstance(tab, PDFTab):
                 tab.close_document()
         
+        self.render_service.stop()
+        self.disk_cache.close()
         self.root.quit()
         self.root.destroy()
         sys.exit(0)
@@ -2765,13 +5852,15 @@ class NVictReader:
                     for page_num in pages:
                         new_doc.insert_pdf(tab.pdf_document, from_page=page_num, to_page=page_num)
                     
-                    new_doc.save(save_path)
-                    new_doc.close()
+                    data = self.save_new_document(new_doc, save_path)
                     
                     dialog.destroy()
                     messagebox.showinfo("Succes", 
                         f"{len(pages)} pagina's geëxtraheerd naar:\n{os.path.basename(save_path)}")
                     
+                    if messagebox.askyesno("Openen?", "Wilt u het geëxtraheerde bestand openen?"):
+                        self.add_new_tab(save_path, source=DocumentSource.from_bytes(data, save_path))
+                    
             except Exception as e:
                 messagebox.showerror("Fout", f"Kan pagina's niet extraheren:\n{str(e)}")
         
@@ -2942,20 +6031,22 @@ class NVictReader:
                 try:
                     merged_doc = fitz.open()
                     for pdf_file in pdf_files:
-                        pdf_doc = fitz.open(pdf_file)
+                        # Gedeelde bron: al geopende bestanden worden niet opnieuw ingelezen
+                        source = DocumentSource.from_file(pdf_file)
+                        pdf_doc = source.open()
                         merged_doc.insert_pdf(pdf_doc)
-                        pdf_doc.close()
+                        source.close(pdf_doc)
+                        source.release()
                     
-                    merged_doc.save(save_path)
-                    merged_doc.close()
+                    data = self.save_new_document(merged_doc, save_path)
                     
                     dialog.destroy()
                     messagebox.showinfo("Succes", 
                         f"{len(pdf_files)} PDF's gecombineerd naar:\n{os.path.basename(save_path)}")
                     
-                    # Vraag of gebruiker het gecombineerde bestand wil openen
+                    # Vraag of gebruiker het gecombineerde bestand wil openen (direct uit het geheugen)
                     if messagebox.askyesno("Openen?", "Wilt u het gecombineerde bestand openen?"):
-                        self.add_new_tab(save_path)
+                        self.add_new_tab(save_path, source=DocumentSource.from_bytes(data, save_path))
                         
                 except Exception as e:
                     messagebox.showerror("Fout", f"Kan PDF's niet combineren:\n{str(e)}")
@@ -3359,11 +6450,19 @@ def main():
         
         # Check of er een bestand is meegegeven als argument
         file_to_open = None
+        stdin_source = None
+        stdin_error = None
         print_mode = False
         
         # Parse command line argumenten
         if len(sys.argv) > 1:
-            if sys.argv[1] == "--print" and len(sys.argv) > 2:
+            if sys.argv[1] == "-":
+                # Format: ... | NVictReader.exe -   (PDF via stdin, altijd in een eigen venster)
+                try:
+                    stdin_source = DocumentSource.from_stdin()
+                except (ValueError, OSError) as e:
+                    stdin_error = str(e)  # Gemeld zodra het venster er is
+            elif sys.argv[1] == "--print" and len(sys.argv) > 2:
                 # Format: NVictReader.exe --print "bestand.pdf"
                 print_mode = True
                 if os.path.exists(sys.argv[2]):
@@ -3393,6 +6492,10 @@ def main():
         single_instance.start_server(app)
         
         # Open bestand als er een is meegegeven
+        if stdin_source:
+            app.root.after(100, lambda: app.add_new_tab(stdin_source.name, source=stdin_source))
+        if stdin_error:
+            app.root.after(100, lambda: messagebox.showerror("Fout", f"Kan PDF niet lezen van stdin:\n{stdin_error}"))
         if file_to_open:
             app.root.after(100, lambda: app.add_new_tab(file_to_open))
             
@@ -3415,4 +6518,5 @@ def main():
         input("\nDruk op Enter om af te sluiten...")
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # Nodig voor de batch workers in de exe versie
     main()
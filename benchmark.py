@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+"""
+NVict Reader - Prestatie benchmarks
+Meet de render- en zoekpaden van NVict Reader zonder de GUI te starten.
+
+Gebruik:
+    python benchmark.py                 (gebruikt een gegenereerd testdocument)
+    python benchmark.py bestand.pdf     (meet op een eigen document)
+"""
+
+import sys
+import io
+import time
+import tracemalloc
+
+import fitz  # PyMuPDF
+from PIL import Image
+
+from NVict_Reader import pixmap_to_image, PageLayout, TextLayer, DocumentSource, SearchIndex, SearchQuery
+
+
+def make_test_document(pages=50, words_per_line=12, lines=60):
+    """Maak een document met veel tekst (voor render- en selectie metingen)"""
+    doc = fitz.open()
+    for page_num in range(pages):
+        page = doc.new_page()
+        for line in range(lines):
+            text = " ".join(f"woord{page_num}_{line}_{i}" for i in range(words_per_line))
+            page.insert_text((36, 40 + line * 12), text, fontsize=7)
+    return doc
+
+
+def report(title, rows):
+    """Print een eenvoudige tabel"""
+    print(f"\n{title}")
+    print("-" * len(title))
+    for label, value in rows:
+        print(f"  {label:<52} {value}")
+
+
+# ====================================================================
+# PIXEL PIPELINE - PPM round trip vs. directe buffer
+# ====================================================================
+
+def legacy_pixel_pipeline(pix):
+    """Oude pad: PPM encode, decode en twee kopieën per pagina"""
+    img_data = pix.tobytes("ppm")
+    pil_image = Image.open(io.BytesIO(img_data))
+    pil_image.load()
+    current_image = pil_image.copy()
+    page_pil_image = pil_image.copy()
+    # Alle PIL images die het pad aanmaakt, ook de gedecodeerde tussenstap
+    return (pil_image, current_image, page_pil_image)
+
+
+def buffer_pixel_pipeline(pix):
+    """Nieuw pad: samples via memoryview, één image gedeeld door cache en tab"""
+    return (pixmap_to_image(pix),)
+
+
+def pil_buffer_bytes(images):
+    """Geschatte PIL pixelbuffers: PIL houdt geen byte telling bij, RGB(A) kost 4 bytes per pixel"""
+    return sum(image.width * image.height * (4 if image.mode in ("RGB", "RGBA") else len(image.mode))
+               for image in images)
+
+
+def measure_pipeline(doc, pipeline, zoom):
+    """Meet tijd en gealloceerde bytes per pagina voor een pixel pipeline"""
+    matrix = fitz.Matrix(zoom, zoom)
+    total_time = 0.0
+    python_bytes = 0
+    pil_bytes = 0
+    for page in doc:
+        pix = page.get_pixmap(matrix=matrix)
+        tracemalloc.start()
+        start = time.perf_counter()
+        result = pipeline(pix)
+        total_time += time.perf_counter() - start
+        python_bytes += tracemalloc.get_traced_memory()[1]  # Piek Python heap (bytes objecten)
+        tracemalloc.stop()
+        pil_bytes += pil_buffer_bytes(result)
+        del result
+    pages = len(doc)
+    return total_time / pages * 1000, python_bytes / pages, pil_bytes / pages
+
+
+def bench_pixel_pipeline(doc, zoom=1.5):
+    rows = []
+    for name, pipeline in (("PPM round trip", legacy_pixel_pipeline), ("Directe buffer", buffer_pixel_pipeline)):
+        ms, python_bytes, pil_bytes = measure_pipeline(doc, pipeline, zoom)
+        rows.append((f"{name}: tijd per pagina", f"{ms:.2f} ms"))
+        rows.append((f"{name}: Python heap per pagina", f"{python_bytes / 1048576:.2f} MB"))
+        rows.append((f"{name}: PIL buffers per pagina (geschat)", f"{pil_bytes / 1048576:.2f} MB"))
+    report(f"Pixmap naar PIL (zoom {zoom:.1f}, {len(doc)} pagina's)", rows)
+
+
+# ====================================================================
+# SELECTIE - lineaire scan vs. ruimtelijk grid per pagina
+# ====================================================================
+
+def legacy_selection(all_words, page_positions, rect):
+    """Oude pad: twee scans over alle woorden van alle pagina's plus pagina lookup per hit"""
+    left, top, right, bottom = rect
+    pages = set()
+    for text, wx0, wy0, wx1, wy1 in all_words:
+        if not (wx1 < left or wx0 > right or wy1 < top or wy0 > bottom):
+            for page_num, (page_top, page_bottom) in enumerate(page_positions):
+                if page_top <= wy0 <= page_bottom:
+                    pages.add(page_num)
+                    break
+    selected = []
+    for word in all_words:
+        text, wx0, wy0, wx1, wy1 = word
+        if not (wx1 < left or wx0 > right or wy1 < top or wy0 > bottom):
+            selected.append(word)
+    return selected
+
+
+def indexed_selection(layout, text_layer, zoom, rect):
+    """Nieuw pad: alleen pagina's (via de layout) en grid cellen onder de selectie"""
+    left, top, right, bottom = rect
+    selected = []
+    for page_num in layout.visible_range(top, bottom):
+        x_offset, y_offset = layout.page_rect(page_num)[:2]
+        for text, x0, y0, x1, y1 in text_layer.words_in_rect(
+                page_num, (left - x_offset) / zoom, (top - y_offset) / zoom,
+                (right - x_offset) / zoom, (bottom - y_offset) / zoom):
+            selected.append((text, x0 * zoom + x_offset, y0 * zoom + y_offset,
+                             x1 * zoom + x_offset, y1 * zoom + y_offset))
+    return selected
+
+
+def bench_selection(sizes=(50, 200, 500), zoom=1.5, repeats=20):
+    rows = []
+    for pages in sizes:
+        doc = make_test_document(pages=pages)
+        layout = PageLayout(doc)
+        layout.set_zoom(zoom)
+        text_layer = TextLayer(doc)
+        
+        # Alle woorden in scherm coördinaten, zoals de oude tab.text_words
+        all_words = []
+        page_positions = []
+        for page_num in range(pages):
+            x_offset, y_offset, _, page_bottom = layout.page_rect(page_num)
+            page_positions.append((y_offset, page_bottom))
+            for text, x0, y0, x1, y1 in text_layer.get_words(page_num):
+                all_words.append((text, x0 * zoom + x_offset, y0 * zoom + y_offset,
+                                  x1 * zoom + x_offset, y1 * zoom + y_offset))
+        
+        # Selectie over de grens van twee pagina's halverwege het document
+        middle = pages // 2
+        x0, y0, x1, y1 = layout.page_rect(middle)
+        rect = (x0 + 40, y1 - 200, x0 + 400, y1 + 200)
+        
+        indexed_selection(layout, text_layer, zoom, rect)  # Grid opbouwen (eenmalig per pagina)
+        assert len(indexed_selection(layout, text_layer, zoom, rect)) == len(legacy_selection(all_words, page_positions, rect))
+        
+        for name, select in (("Lineaire scan", lambda: legacy_selection(all_words, page_positions, rect)),
+                             ("Grid index", lambda: indexed_selection(layout, text_layer, zoom, rect))):
+            start = time.perf_counter()
+            for _ in range(repeats):
+                select()
+            ms = (time.perf_counter() - start) / repeats * 1000
+            rows.append((f"{name}: {pages} pagina's ({len(all_words)} woorden)", f"{ms:.3f} ms"))
+        doc.close()
+    report(f"Selectie latency per drag (zoom {zoom:.1f})", rows)
+
+
+# ====================================================================
+# ZOEKEN - pagina voor pagina search_for vs. woordindex en zoekmachine
+# ====================================================================
+
+DUTCH_WORDS = ("coördinatie", "ruïne", "één", "ijsbeer", "IJssel", "café", "reünie", "België", "zeeën",
+               "financiële", "gebruiker", "document", "pagina", "zoeken", "vinden", "het", "de", "een")
+
+
+def make_dutch_document(pages=1000, words_per_line=12, lines=60):
+    """Document met Nederlandse woorden met accenten (voor de zoekmachine)"""
+    doc = fitz.open()
+    for page_num in range(pages):
+        page = doc.new_page()
+        for line in range(lines):
+            words = (DUTCH_WORDS[(page_num * 7 + line * 3 + i * 5) % len(DUTCH_WORDS)] for i in range(words_per_line))
+            page.insert_text((36, 40 + line * 12), " ".join(words) + f" regel{line}", fontsize=7)
+    return doc
+
+
+def legacy_search(doc, text):
+    """Oude pad: elke zoekopdracht doorzoekt (en extraheert) alle pagina's opnieuw"""
+    return [(page_num, rects) for page_num in range(len(doc)) for rects in (doc[page_num].search_for(text),) if rects]
+
+
+def build_search_index(doc):
+    """Index zoals de achtergrond thread hem opbouwt, hier synchroon"""
+    index = SearchIndex(len(doc), DocumentSource.from_bytes(doc.tobytes(), "benchmark.pdf"))
+    for page_num in range(len(doc)):
+        index.extract_page(page_num)
+    return index
+
+
+def engine_search(index, query):
+    """Zoekpad van de zoekbalk zonder threads: voorselectie via de postings, daarna de paginatekst"""
+    pages = None if query.regex else index.candidate_pages(query.text)
+    if pages is None:
+        pages = range(index.page_count)
+    return [hit for page_num in pages for hit in index.search_page(page_num, query)]
+
+
+def time_ms(function, repeats):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        function()
+    return (time.perf_counter() - start) / repeats * 1000
+
+
+def bench_search(pages=500, repeats=5):
+    doc = make_test_document(pages=pages)
+    query = f"woord{pages // 2}_30_5"
+    
+    start = time.perf_counter()
+    index = build_search_index(doc)
+    build_ms = (time.perf_counter() - start) * 1000
+    assert len(engine_search(index, SearchQuery(query))) == sum(len(rects) for _, rects in legacy_search(doc, query))
+    
+    rows = [("Index opbouwen (eenmalig, achtergrond)", f"{build_ms:.0f} ms")]
+    rows.append(("Pagina scan (search_for): herhaalde zoekopdracht",
+                 f"{time_ms(lambda: legacy_search(doc, query), repeats):.2f} ms"))
+    rows.append(("Woordindex + zoekmachine: herhaalde zoekopdracht",
+                 f"{time_ms(lambda: engine_search(index, SearchQuery(query)), repeats):.2f} ms"))
+    rows.append(("Unieke woorden in de index", f"{len(index.postings)}"))
+    index.cancel()
+    doc.close()
+    report(f"Zoeken in {pages} pagina's", rows)
+
+
+def bench_search_engine(pages=1000, repeats=3):
+    doc = make_dutch_document(pages=pages)
+    index = build_search_index(doc)
+    
+    # Eerste doorloop bouwt de paginatekst (met en zonder accenten) op, daarna gecachet
+    start = time.perf_counter()
+    for page_num in range(pages):
+        index.page_text(page_num, True)
+        index.page_text(page_num, False)
+    text_bytes = sum(len(index.page_text(page_num, False)[0].encode("utf-8")) for page_num in range(pages))
+    rows = [("Paginatekst opbouwen (eenmalig)", f"{(time.perf_counter() - start) * 1000:.0f} ms"),
+            ("Paginatekst", f"{text_bytes / 1048576:.1f} MB")]
+    
+    queries = (
+        ("'reunie' (accenten negeren)", SearchQuery("reunie")),
+        ("'reünie' (met accenten)", SearchQuery("reünie", ignore_accents=False)),
+        ("'IJssel' (hoofdlettergevoelig)", SearchQuery("IJssel", case_sensitive=True)),
+        ("'een' (heel woord)", SearchQuery("een", whole_word=True)),
+        ("'ee' (deel van een woord)", SearchQuery("ee")),
+        ("regex 'regel[0-9]+5\\b'", SearchQuery(r"regel[0-9]+5\b", regex=True)),
+    )
+    for label, query in queries:
+        hits = len(engine_search(index, query))
+        ms = time_ms(lambda: engine_search(index, query), repeats)
+        rows.append((f"{label}: {hits} treffers", f"{ms:.0f} ms ({text_bytes / 1048576 / (ms / 1000):.0f} MB/s)"))
+    index.cancel()
+    doc.close()
+    report(f"Zoekmachine over {pages} pagina's", rows)
+
+
+def main():
+    if len(sys.argv) > 1:
+        doc = fitz.open(sys.argv[1])
+    else:
+        doc = make_test_document()
+
+    bench_pixel_pipeline(doc)
+    doc.close()
+    bench_selection()
+    bench_search()
+    bench_search_engine()
+
+
+if __name__ == "__main__":
+    main()